@@ -1,52 +1,190 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
+from urllib.parse import urlencode
 
-import requests
+from clockify_client.codec import STDLIB_CODEC
+from clockify_client.parsing import json_parser, list_parser
+from clockify_client.transport import Transport
 
 if TYPE_CHECKING:
-    from clockify_client.types import JsonType
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
+
+    from pydantic import BaseModel
+
+    from clockify_client.codec import JsonCodec
+    from clockify_client.parsing import ValidationMode
+    from clockify_client.types import JsonType, Payload
+
+DEFAULT_PAGE_SIZE = 50
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+T = TypeVar("T")
 
 
 class AbstractClockify:
-    def __init__(self, api_key: str, api_url: str) -> None:
+    subdomain = "global"
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        transport: Transport | None = None,
+        codec: JsonCodec | None = None,
+        validation: ValidationMode = "strict",
+    ) -> None:
 
-        self.base_url = f"https://global.{api_url.strip('/')}"
+        self.base_url = f"https://{self.subdomain}.{api_url.strip('/')}"
         self.api_key = api_key
         self.header = {"X-Api-Key": self.api_key}
+        self.transport = transport if transport is not None else Transport()
+        self.codec = codec if codec is not None else STDLIB_CODEC
+        self.validation = validation
+        self.transport.mount(self.base_url)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Payload = None,
+        *,
+        idempotent: bool | None = None,
+    ) -> JsonType:
+        return self._send(
+            method, path, payload, self.codec.loads, idempotent=idempotent
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Payload,
+        parse: Callable[[bytes], T],
+        *,
+        idempotent: bool | None = None,
+    ) -> T | None:
+        url = f"{self.base_url}{path}"
+        if payload is None:
+            return self.transport.send(
+                method, url, headers=self.header, parse=parse, idempotent=idempotent
+            )
+        return self.transport.send(
+            method,
+            url,
+            headers={**self.header, **JSON_CONTENT_TYPE},
+            content=self.codec.encode(payload),
+            parse=parse,
+            idempotent=idempotent,
+        )
 
     def get(self, path: str) -> JsonType:
         """Send GET request to Clockify API."""
-        url = f"{self.base_url}{path}"
-        response = requests.get(url, headers=self.header)
-        response.raise_for_status()
-        if response.status_code in [200, 201, 202]:
-            return response.json()
-        return None
+        return self._request("GET", path)
 
-    def post(self, path: str, payload: dict) -> JsonType:
+    def post(self, path: str, payload: dict | BaseModel) -> JsonType:
         """Send POST request to Clockify API."""
-        url = f"{self.base_url}{path}"
-        response = requests.post(url, headers=self.header, json=payload)
-        response.raise_for_status()
-        if response.status_code in [200, 201, 202]:
-            return response.json()
-        return None
+        return self._request("POST", path, payload)
 
-    def put(self, path: str, payload: dict | None = None) -> JsonType:
+    def put(self, path: str, payload: dict | BaseModel | None = None) -> JsonType:
         """Send PUT request to Clockify API."""
-        url = f"{self.base_url}{path}"
-        response = requests.put(url, headers=self.header, json=payload)
-        response.raise_for_status()
-        if response.status_code in [200, 201, 202]:
-            return response.json()
-        return None
+        return self._request("PUT", path, payload)
 
     def delete(self, path: str) -> JsonType:
         """Send DELETE request to Clockify API."""
-        url = f"{self.base_url}{path}"
-        response = requests.delete(url, headers=self.header)
-        response.raise_for_status()
-        if response.status_code in [200, 201, 202]:
-            return response.json()
-        return None
+        return self._request("DELETE", path)
+
+    def _parser(self, response_type: type[T]) -> Callable[[bytes], T]:
+        return json_parser(response_type, self.validation, self.codec.loads)
+
+    def get_as(self, path: str, response_type: type[T]) -> T | None:
+        """Send GET request, validating raw response body as given type."""
+        return self._send("GET", path, None, self._parser(response_type))
+
+    def post_as(
+        self, path: str, payload: dict | BaseModel, response_type: type[T]
+    ) -> T | None:
+        """Send POST request, validating raw response body as given type."""
+        return self._send("POST", path, payload, self._parser(response_type))
+
+    def put_as(
+        self, path: str, payload: dict | BaseModel | None, response_type: type[T]
+    ) -> T | None:
+        """Send PUT request, validating raw response body as given type."""
+        return self._send("PUT", path, payload, self._parser(response_type))
+
+    def paginate(
+        self,
+        path: str,
+        params: dict | None = None,
+        prefetch: int = 0,
+        *,
+        item_type: type | None = None,
+    ) -> Iterator[list]:
+        """
+        Lazily walks pages of list endpoint, yielding one page at a time.
+
+        Starts on ``page`` param (first page by default) and stops after first page
+        shorter than ``page-size`` param. With ``prefetch`` set, that many following
+        pages are fetched in background threads while current page is consumed;
+        pages are still yielded in order. With ``item_type`` set, pages are
+        validated from raw response body into lists of that type.
+        """
+        query = dict(params or {})
+        parse = (
+            list_parser(item_type, self.validation, self.codec.loads)
+            if item_type is not None
+            else self.codec.loads
+        )
+        page = int(query.pop("page", 1))
+        page_size = int(query.setdefault("page-size", DEFAULT_PAGE_SIZE))
+
+        fetch = partial(self._fetch_page, path, query, parse)
+        return self._walk_pages(fetch, page, page_size, prefetch)
+
+    def _walk_pages(
+        self, fetch: Callable[[int], list], page: int, page_size: int, prefetch: int
+    ) -> Iterator[list]:
+        """Yields non-empty pages returned by fetch, until first short one."""
+        if prefetch > 0:
+            yield from self._prefetch_pages(fetch, page, page_size, prefetch)
+            return
+
+        while True:
+            response = fetch(page)
+            if response:
+                yield response
+            if len(response) < page_size:
+                return
+            page += 1
+
+    def _prefetch_pages(
+        self, fetch: Callable[[int], list], page: int, page_size: int, prefetch: int
+    ) -> Iterator[list]:
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending: deque[Future[list]] = deque()
+        try:
+            for next_page in range(page, page + prefetch + 1):
+                pending.append(executor.submit(fetch, next_page))
+            while pending:
+                response = pending.popleft().result()
+                if len(response) < page_size:
+                    if response:
+                        yield response
+                    return
+                next_page += 1
+                pending.append(executor.submit(fetch, next_page))
+                yield response
+        finally:
+            # requests already in flight are awaited, so none outlive the walk
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_page(
+        self, path: str, query: dict, parse: Callable[[bytes], list], page: int
+    ) -> list:
+        url_params = urlencode({**query, "page": page}, doseq=True)
+        response = self._send("GET", f"{path}?{url_params}", None, parse)
+        return response or []
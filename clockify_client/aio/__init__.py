@@ -0,0 +1,3 @@
+from clockify_client.aio.clockify import AsyncClockify
+
+__all__ = ["AsyncClockify"]
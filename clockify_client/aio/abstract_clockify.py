@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+from clockify_client.abstract_clockify import JSON_CONTENT_TYPE
+from clockify_client.aio.transport import AsyncTransport
+from clockify_client.codec import STDLIB_CODEC
+from clockify_client.parsing import json_parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import BaseModel
+
+    from clockify_client.codec import JsonCodec
+    from clockify_client.parsing import ValidationMode
+    from clockify_client.types import JsonType, Payload
+
+T = TypeVar("T")
+
+
+class AsyncAbstractClockify:
+    subdomain = "global"
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        transport: AsyncTransport | None = None,
+        codec: JsonCodec | None = None,
+        validation: ValidationMode = "strict",
+    ) -> None:
+
+        self.base_url = f"https://{self.subdomain}.{api_url.strip('/')}"
+        self.api_key = api_key
+        self.header = {"X-Api-Key": self.api_key}
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.codec = codec if codec is not None else STDLIB_CODEC
+        self.validation = validation
+        self.transport.mount(self.base_url)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Payload = None,
+        *,
+        idempotent: bool | None = None,
+    ) -> JsonType:
+        return await self._send(
+            method, path, payload, self.codec.loads, idempotent=idempotent
+        )
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Payload,
+        parse: Callable[[bytes], T],
+        *,
+        idempotent: bool | None = None,
+    ) -> T | None:
+        url = f"{self.base_url}{path}"
+        if payload is None:
+            return await self.transport.send(
+                method, url, headers=self.header, parse=parse, idempotent=idempotent
+            )
+        return await self.transport.send(
+            method,
+            url,
+            headers={**self.header, **JSON_CONTENT_TYPE},
+            content=self.codec.encode(payload),
+            parse=parse,
+            idempotent=idempotent,
+        )
+
+    async def get(self, path: str) -> JsonType:
+        """Send GET request to Clockify API."""
+        return await self._request("GET", path)
+
+    async def post(self, path: str, payload: dict | BaseModel) -> JsonType:
+        """Send POST request to Clockify API."""
+        return await self._request("POST", path, payload)
+
+    async def put(self, path: str, payload: dict | BaseModel | None = None) -> JsonType:
+        """Send PUT request to Clockify API."""
+        return await self._request("PUT", path, payload)
+
+    async def delete(self, path: str) -> JsonType:
+        """Send DELETE request to Clockify API."""
+        return await self._request("DELETE", path)
+
+    def _parser(self, response_type: type[T]) -> Callable[[bytes], T]:
+        return json_parser(response_type, self.validation, self.codec.loads)
+
+    async def get_as(self, path: str, response_type: type[T]) -> T | None:
+        """Send GET request, validating raw response body as given type."""
+        return await self._send("GET", path, None, self._parser(response_type))
+
+    async def post_as(
+        self, path: str, payload: dict | BaseModel, response_type: type[T]
+    ) -> T | None:
+        """Send POST request, validating raw response body as given type."""
+        return await self._send("POST", path, payload, self._parser(response_type))
+
+    async def put_as(
+        self, path: str, payload: dict | BaseModel | None, response_type: type[T]
+    ) -> T | None:
+        """Send PUT request, validating raw response body as given type."""
+        return await self._send("PUT", path, payload, self._parser(response_type))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from clockify_client.aio.models.client import AsyncClient
+from clockify_client.aio.models.project import AsyncProject
+from clockify_client.aio.models.report import AsyncReport
+from clockify_client.aio.models.tag import AsyncTag
+from clockify_client.aio.models.task import AsyncTask
+from clockify_client.aio.models.time_entry import AsyncTimeEntry
+from clockify_client.aio.models.user import AsyncUser
+from clockify_client.aio.models.workspace import AsyncWorkspace
+from clockify_client.aio.transport import AsyncTransport
+from clockify_client.codec import get_codec
+from clockify_client.parsing import check_validation_mode
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+    from clockify_client.cache import ResponseCache
+    from clockify_client.codec import JsonCodec
+    from clockify_client.parsing import ValidationMode
+    from clockify_client.rate_limit import RateLimiter
+    from clockify_client.retry import RetryPolicy
+
+
+class AsyncClockify:
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        pool_maxsize: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        json_codec: JsonCodec | str = "json",
+        validation: ValidationMode = "strict",
+    ) -> None:
+        """
+        Builds asyncio services from available factories.
+
+        All services share one connection pooled transport, and so also share
+        its rate limiter, retry policy and response cache.
+
+        :param api_key Clockify API key.
+        :param api_url Clockify API url.
+        :param pool_maxsize Number of keep-alive connections kept per host.
+        :param rate_limiter Token bucket limiting requests of all services.
+        :param retry Policy for repeating requests failed with transient errors.
+        :param cache Opt-in cache of GET responses.
+        :param json_codec JSON codec, or name of its library (``json``, ``orjson``,
+            ``msgspec`` or ``auto``) decoding responses and encoding payloads.
+        :param validation How typed responses are validated: fully (``strict``),
+            without format checks of datetimes and durations (``lenient``), or not
+            at all (``trusted``). Raises ValueError for unknown mode.
+        """
+        check_validation_mode(validation)
+        transport = AsyncTransport(
+            pool_maxsize=pool_maxsize,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+        )
+        self.transport = transport
+        codec = get_codec(json_codec) if isinstance(json_codec, str) else json_codec
+
+        self.workspaces = AsyncWorkspace(api_key, api_url, transport, codec, validation)
+        self.projects = AsyncProject(api_key, api_url, transport, codec, validation)
+        self.tags = AsyncTag(api_key, api_url, transport, codec, validation)
+        self.tasks = AsyncTask(api_key, api_url, transport, codec, validation)
+        self.time_entries = AsyncTimeEntry(
+            api_key, api_url, transport, codec, validation
+        )
+        self.users = AsyncUser(api_key, api_url, transport, codec, validation)
+        self.reports = AsyncReport(api_key, api_url, transport, codec, validation)
+        self.clients = AsyncClient(api_key, api_url, transport, codec, validation)
+
+    async def aclose(self) -> None:
+        """Closes pooled connections of all services."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Returns itself, connections are closed on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Closes pooled connections."""
+        await self.aclose()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+from clockify_client.api_objects.project import (
+    AddProjectPayload,
+    AddProjectResponse,
+    GetProjectResponse,
+)
+
+if TYPE_CHECKING:
+    from clockify_client.api_objects.project import GetProjectsParams
+
+
+class AsyncProject(AsyncAbstractClockify):
+
+    async def get_projects(
+        self, workspace_id: str, params: GetProjectsParams | None = None
+    ) -> list[GetProjectResponse] | None:
+        """
+        Returns projects from given workspace with applied params if provided.
+
+        https://docs.clockify.me/#tag/Project/operation/getProjects
+        """
+        if params:
+            url_params = urlencode(
+                params.model_dump(exclude_none=True, by_alias=True), doseq=True
+            )
+            path = f"/workspaces/{workspace_id}/projects?{url_params}"
+        else:
+            path = f"/workspaces/{workspace_id}/projects/"
+
+        return await self.get_as(path, list[GetProjectResponse])
+
+    async def add_project(
+        self,
+        workspace_id: str,
+        project_name: str,
+        client_id: str,
+        *,
+        billable: bool = False,
+        public: bool = False,
+    ) -> AddProjectResponse | None:
+        """
+        Add new project into workspace.
+
+        https://docs.clockify.me/#tag/Project/operation/createNewProject
+        """
+        path = f"/workspaces/{workspace_id}/projects/"
+
+        payload = AddProjectPayload(
+            name=project_name,
+            client_id=client_id,
+            is_public=public,
+            billable=billable,
+        )
+
+        return await self.post_as(path, payload, AddProjectResponse)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+
+if TYPE_CHECKING:
+    from clockify_client.types import JsonType
+
+
+class AsyncReport(AsyncAbstractClockify):
+    subdomain = "reports"
+
+    async def _post_report(self, path: str, payload: dict) -> JsonType:
+        # reports are only read, so their requests are safe to repeat
+        return await self._request("POST", path, payload, idempotent=True)
+
+    async def get_summary_report(self, workspace_id: str, payload: dict) -> JsonType:
+        """
+        Calls Clockify API for summary report.
+
+        https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateSummaryReport
+        """
+        path = f"/workspaces/{workspace_id}/reports/summary/"
+
+        return await self._post_report(path, payload)
+
+    async def get_detailed_report(self, workspace_id: str, payload: dict) -> JsonType:
+        """
+        Calls Clockify API for detailed report.
+
+        https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateDetailedReport
+        """
+        path = f"/workspaces/{workspace_id}/reports/detailed/"
+
+        return await self._post_report(path, payload)
+
+    async def get_weekly_report(self, workspace_id: str, payload: dict) -> JsonType:
+        """
+        Calls Clockify API for weekly report.
+
+        https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateWeeklyReport
+        """
+        path = f"/workspaces/{workspace_id}/reports/weekly/"
+
+        return await self._post_report(path, payload)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+
+if TYPE_CHECKING:
+    from clockify_client.types import JsonType
+
+
+class AsyncTask(AsyncAbstractClockify):
+
+    async def add_task(
+        self,
+        workspace_id: str,
+        project_id: str,
+        task_name: str,
+        payload: dict | None = None,
+    ) -> JsonType:
+        """
+        Creates new task in Clockify.
+
+        https://docs.clockify.me/#tag/Task/operation/createTask
+        """
+        path = f"/workspaces/{workspace_id}/projects/{project_id}/tasks/"
+
+        final_payload = {"name": task_name, "projectId": project_id}
+        final_payload.update(payload or {})
+
+        return await self.post(path, payload=final_payload)
+
+    async def update_task(
+        self,
+        workspace_id: str,
+        project_id: str,
+        task_id: str,
+        payload: dict | None = None,
+    ) -> JsonType:
+        """
+        Updates task in Clockify.
+
+        https://docs.clockify.me/#tag/Task/operation/updateTask
+        """
+        path = f"/workspaces/{workspace_id}/projects/{project_id}/tasks/{task_id}"
+
+        return await self.put(path, payload=payload)
+
+    async def get_tasks(
+        self, workspace_id: str, project_id: str, params: dict | None = None
+    ) -> JsonType:
+        """
+        Gets list of tasks from Clockify.
+
+        https://docs.clockify.me/#tag/Task/operation/getTasks
+        """
+        base_path = f"/workspaces/{workspace_id}/projects/{project_id}"
+        if params:
+            url_params = urlencode(params)
+            path = f"{base_path}/tasks?{url_params}"
+        else:
+            path = f"{base_path}/tasks/"
+
+        return await self.get(path)
+
+    async def get_task(
+        self, workspace_id: str, project_id: str, task_id: str
+    ) -> JsonType:
+        """
+        Gets task from Clockify.
+
+        https://docs.clockify.me/#tag/Task/operation/getTask
+        """
+        path = f"/workspaces/{workspace_id}/projects/{project_id}/tasks/{task_id}"
+
+        return await self.get(path)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+from clockify_client.api_objects.time_entry import (
+    AddTimeEntryResponse,
+    TimeEntryResponse,
+    UpdateTimeEntryResponse,
+)
+
+if TYPE_CHECKING:
+    from clockify_client.api_objects.time_entry import (
+        AddTimeEntryPayload,
+        UpdateTimeEntryPayload,
+    )
+
+
+class AsyncTimeEntry(AsyncAbstractClockify):
+
+    async def get_time_entries(
+        self, workspace_id: str, user_id: str, params: dict | None = None
+    ) -> list[TimeEntryResponse] | None:
+        """
+        Returns user time entries.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/getTimeEntries
+        """
+        base_path = f"/workspaces/{workspace_id}/user/{user_id}/time-entries"
+
+        if params:
+            url_params = urlencode(params, doseq=True)
+            path = f"{base_path}?{url_params}"
+        else:
+            path = f"{base_path}/"
+
+        return await self.get_as(path, list[TimeEntryResponse])
+
+    async def get_time_entry(
+        self, workspace_id: str, time_entry_id: str
+    ) -> TimeEntryResponse | None:
+        """
+        Gets specific time entry.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/getTimeEntry
+        """
+        path = f"/workspaces/{workspace_id}/time-entries/{time_entry_id}"
+
+        return await self.get_as(path, TimeEntryResponse)
+
+    async def add_time_entry(
+        self, workspace_id: str, user_id: str, payload: AddTimeEntryPayload
+    ) -> AddTimeEntryResponse | None:
+        """
+        Adds time entry in Clockify with provided payload data.
+
+        Paid feature, workspace need to have active paid subscription.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/createTimeEntry
+        """
+        path = f"/workspaces/{workspace_id}/user/{user_id}/time-entries/"
+
+        return await self.post_as(path, payload, AddTimeEntryResponse)
+
+    async def update_time_entry(
+        self, workspace_id: str, entry_id: str, payload: UpdateTimeEntryPayload
+    ) -> UpdateTimeEntryResponse | None:
+        """
+        Updates time entry in Clockify with provided payload data.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/updateTimeEntry
+        """
+        path = f"/workspaces/{workspace_id}/time-entries/{entry_id}"
+
+        return await self.put_as(path, payload, UpdateTimeEntryResponse)
+
+    async def delete_time_entry(self, workspace_id: str, entry_id: str) -> None:
+        """Updates time entry in Clockify with provided payload data.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/deleteTimeEntry
+        """
+        path = f"/workspaces/{workspace_id}/time-entries/{entry_id}"
+
+        await self.delete(path)
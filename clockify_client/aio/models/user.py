@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+from clockify_client.api_objects.user import (
+    AddUserPayload,
+    AddUserResponse,
+    UserResponse,
+)
+
+if TYPE_CHECKING:
+    from clockify_client.api_objects.user import GetUsersParams
+    from clockify_client.types import JsonType
+
+
+class AsyncUser(AsyncAbstractClockify):
+
+    async def get_current_user(self) -> UserResponse | None:
+        """Get user by paired with API key.
+
+        https://docs.clockify.me/#tag/User/operation/getLoggedUser
+        """
+        path = "/user/"
+
+        return await self.get_as(path, UserResponse)
+
+    async def get_users(
+        self, workspace_id: str, params: GetUsersParams | None = None
+    ) -> list[UserResponse] | None:
+        """Returns list of all users in given workspace.
+
+        https://docs.clockify.me/#tag/User/operation/getUsersOfWorkspace
+        """
+        if params:
+            url_params = urlencode(
+                params.model_dump(exclude_none=True, by_alias=True), doseq=True
+            )
+            path = f"/workspaces/{workspace_id}/users?{url_params}"
+        else:
+            path = f"/workspaces/{workspace_id}/users/"
+
+        return await self.get_as(path, list[UserResponse])
+
+    async def add_user(self, workspace_id: str, email: str) -> AddUserResponse | None:
+        """Adds new user into workspace.
+
+        https://docs.clockify.me/#tag/Workspace/operation/addUsers
+        """
+        path = f"/workspaces/{workspace_id}/users/"
+
+        payload = AddUserPayload(email=email)
+
+        return await self.post_as(path, payload, AddUserResponse)
+
+    async def update_user(
+        self, workspace_id: str, user_id: str, status: str
+    ) -> JsonType:
+        """Update user status in workspace.
+
+        https://docs.clockify.me/#tag/Workspace/operation/updateUserStatus
+        """
+        path = f"/workspaces/{workspace_id}/users/{user_id}"
+
+        payload = {"status": status}
+        return await self.put(path, payload=payload)
+
+    async def remove_user(self, workspace_id: str, user_id: str) -> JsonType:
+        """Removes user from workspace.
+
+        https://docs.clockify.me/#tag/Workspace/operation/removeMember
+        """
+        path = f"/workspaces/{workspace_id}/users/{user_id}"
+
+        return await self.delete(path)
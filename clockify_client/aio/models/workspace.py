@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+
+if TYPE_CHECKING:
+    from clockify_client.types import JsonType
+
+
+class AsyncWorkspace(AsyncAbstractClockify):
+
+    async def get_workspaces(self) -> JsonType:
+        """Returns all workspaces.
+
+        https://docs.clockify.me/#tag/Workspace/operation/getWorkspacesOfUser
+        """
+        path = "/workspaces/"
+
+        return await self.get(path)
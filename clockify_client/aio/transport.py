@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeVar
+
+import httpx
+
+from clockify_client.cache import CacheLookup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from clockify_client.cache import ResponseCache
+    from clockify_client.rate_limit import RateLimiter
+    from clockify_client.retry import RetryPolicy
+
+T = TypeVar("T")
+
+
+class AsyncTransport:
+    """
+    Connection pooled asyncio HTTP transport shared by async Clockify services.
+
+    Every base url gets its own ``httpx.AsyncClient``, so the ``global.`` and
+    ``reports.`` hosts keep separate keep-alive pools. Optional ``rate_limiter`` is
+    consulted before every request sent, including repeated attempts made according
+    to optional ``retry`` policy. GET responses are served from optional ``cache``
+    while fresh, or while they are refreshed in background task if cache serves
+    stale entries.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        pool_maxsize: int = 10,
+        max_connections: int = 100,
+        *,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.max_connections = max_connections
+        self.http_transport = http_transport
+        self.clients: dict[str, httpx.AsyncClient] = {}
+        self._refreshes: set[asyncio.Task[None]] = set()
+
+    def mount(self, base_url: str) -> None:
+        """Gives base url its own connection pool, if it does not have one yet."""
+        if base_url in self.clients:
+            return
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.pool_maxsize,
+        )
+        self.clients[base_url] = httpx.AsyncClient(
+            limits=limits, transport=self.http_transport
+        )
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        for base_url, client in self.clients.items():
+            if url.startswith(f"{base_url}/"):
+                return client
+        msg = f"No connection pool mounted for {url}"
+        raise ValueError(msg)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        """
+        Sends request over pooled client of the url's base url.
+
+        Body is sent as ready ``content`` bytes. Request is retried if policy
+        allows, ``idempotent`` overrides whether it is safe to repeat, which is
+        otherwise derived from its method.
+        """
+        client = self._client_for(url)
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                response = await client.request(
+                    method, url, headers=headers, content=content
+                )
+            except httpx.TransportError as exc:
+                # failure to connect means server never saw the request
+                processed = not isinstance(
+                    exc, httpx.ConnectError | httpx.ConnectTimeout
+                )
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, idempotent=idempotent, maybe_processed=processed
+                ):
+                    raise
+                delay = self.retry.backoff(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response.status_code, idempotent=idempotent
+                ):
+                    return response
+                delay = self.retry.backoff(attempt, response.headers.get("Retry-After"))
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        parse: Callable[[bytes], T],
+        idempotent: bool | None = None,
+    ) -> T | None:
+        """
+        Sends request and returns its parsed body, or None when there is no body.
+
+        Raises ``httpx.HTTPStatusError`` for error responses. GET responses are
+        taken from and stored into cache, if transport has one, other methods evict
+        cached responses they make stale. Stale responses with validators are
+        revalidated with conditional request and reused when server answers 304.
+        ``idempotent`` overrides whether request is safe to repeat on failure.
+        """
+        lookup = CacheLookup()
+        if self.cache is not None:
+            lookup = self.cache.lookup(method, url, headers.get("X-Api-Key", ""))
+        if lookup.refresh:
+            # task is referenced until done, so it is not garbage collected
+            task = asyncio.create_task(self._refresh(lookup, url, headers, parse))
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+        if lookup.serve and lookup.entry is not None:
+            return lookup.entry.parse(parse)
+        return await self._fetch(
+            method,
+            url,
+            headers=headers,
+            content=content,
+            parse=parse,
+            idempotent=idempotent,
+            lookup=lookup,
+        )
+
+    async def _refresh(
+        self,
+        lookup: CacheLookup,
+        url: str,
+        headers: dict[str, str],
+        parse: Callable[[bytes], object],
+    ) -> None:
+        try:
+            await self._fetch("GET", url, headers=headers, parse=parse, lookup=lookup)
+        except httpx.HTTPError:
+            pass  # entry stays stale, so next request for it tries again
+        finally:
+            if self.cache is not None and lookup.key is not None:
+                self.cache.release_refresh(lookup.key)
+
+    async def _fetch(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        parse: Callable[[bytes], T],
+        idempotent: bool | None = None,
+        lookup: CacheLookup,
+    ) -> T | None:
+        response = await self.request(
+            method,
+            url,
+            headers=lookup.headers(headers),
+            content=content,
+            idempotent=idempotent,
+        )
+        if self.cache is not None:
+            entry = self.cache.settle(lookup, method, url, response.status_code)
+            if entry is not None:
+                return entry.parse(parse)
+        response.raise_for_status()
+        if response.status_code not in [200, 201, 202]:
+            return None
+        if self.cache is not None:
+            entry = self.cache.store(lookup, url, response.content, response.headers)
+            if entry is not None:
+                return entry.parse(parse)
+        return parse(response.content)
+
+    async def aclose(self) -> None:
+        """Closes all pooled connections, once running background refreshes end."""
+        await asyncio.gather(*self._refreshes, return_exceptions=True)
+        for client in self.clients.values():
+            await client.aclose()
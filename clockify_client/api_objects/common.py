@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo
 
 T_day_of_week = Literal[
     "SUNDAY", "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY"
@@ -20,6 +20,11 @@ class ClockifyBaseModel(BaseModel):
     )
 
 
+def is_lenient(info: ValidationInfo) -> bool:
+    """Tells whether validation is lenient, skipping format checks of values."""
+    return bool(info.context and info.context.get("lenient"))
+
+
 class RateDtoV1(ClockifyBaseModel):
     amount: int = Field()
     currency: str = Field()
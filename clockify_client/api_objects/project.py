@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
 from clockify_client.api_objects.common import (
     ClockifyBaseModel,
@@ -11,6 +11,7 @@ from clockify_client.api_objects.common import (
     RateDtoV1,
     T_sort_order,
     T_status,
+    is_lenient,
 )
 
 T_contains_client = Literal["ACTIVE", "ARCHIVED", "ALL"]
@@ -59,8 +60,10 @@ class EstimateDtoV1(ClockifyBaseModel):
 
     @field_validator("estimate")
     @classmethod
-    def validate_estimate(cls, estimate: str) -> str:
+    def validate_estimate(cls, estimate: str, info: ValidationInfo) -> str:
         """Checks strings for proper datetime in iso format."""
+        if is_lenient(info):
+            return estimate
 
         class TimeDelta(ClockifyBaseModel):
             td: timedelta = Field()
@@ -4,9 +4,9 @@ from datetime import timedelta
 from typing import Literal
 
 from dateutil.parser import parse
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 
-from clockify_client.api_objects.common import ClockifyBaseModel, RateDtoV1
+from clockify_client.api_objects.common import ClockifyBaseModel, RateDtoV1, is_lenient
 from clockify_client.types import JsonType
 
 T_type = Literal["REGULAR", "BREAK"]
@@ -31,15 +31,18 @@ class TimeIntervalDtoV1(ClockifyBaseModel):
 
     @field_validator("start", "end")
     @classmethod
-    def validate_times(cls, value: str) -> str:
+    def validate_times(cls, value: str, info: ValidationInfo) -> str:
         """Checks strings for proper datetime in iso format."""
-        parse(value)
+        if not is_lenient(info):
+            parse(value)
         return value
 
     @field_validator("duration")
     @classmethod
-    def validate_duration(cls, duration: str) -> str:
+    def validate_duration(cls, duration: str, info: ValidationInfo) -> str:
         """Checks strings for proper datetime in iso format."""
+        if is_lenient(info):
+            return duration
 
         class TimeDelta(ClockifyBaseModel):
             td: timedelta = Field()
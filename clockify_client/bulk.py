@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import requests
+from pydantic import ValidationError
+
+from clockify_client.exceptions import ClockifyError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+# errors failing single operation, reported in its result instead of being raised
+OPERATION_ERRORS = (requests.RequestException, ValidationError, ClockifyError)
+
+
+@dataclass
+class BulkResult(Generic[T]):  # noqa: UP046
+    """Outcome of one operation of bulk request, its value or error which failed it."""
+
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Tells whether operation succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BulkReport(Generic[T]):  # noqa: UP046
+    """Outcome of bulk request of operations on given ids, one result per id."""
+
+    ids: list[str]
+    results: list[BulkResult[T]]
+
+    @property
+    def ok(self) -> bool:
+        """Tells whether all operations succeeded."""
+        return all(result.ok for result in self.results)
+
+    @property
+    def succeeded(self) -> list[str]:
+        """Returns ids of successful operations."""
+        return [
+            i for i, result in zip(self.ids, self.results, strict=True) if result.ok
+        ]
+
+    @property
+    def failed(self) -> dict[str, Exception]:
+        """Returns errors of failed operations by their ids."""
+        return {
+            i: result.error
+            for i, result in zip(self.ids, self.results, strict=True)
+            if result.error is not None
+        }
+
+
+def run_bulk(  # noqa: UP047
+    operation: Callable[[A], T],
+    items: Iterable[A],
+    max_workers: int = 8,
+    errors: tuple[type[Exception], ...] = OPERATION_ERRORS,
+) -> list[BulkResult[T]]:
+    """
+    Runs operation for every item concurrently, returning results in items order.
+
+    Up to ``max_workers`` operations run at a time, further items are taken from
+    ``items`` only as running operations finish, so large iterables are not held
+    in memory at once. Errors listed in ``errors``, by default request, validation
+    and client errors such as refusal of non-blocking rate limiter, are reported in
+    results of failed items and do not stop others, any other error is raised once
+    running operations finish.
+    """
+    results: list[BulkResult[T]] = []
+    remaining = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: dict[Future[T], int] = {}
+
+    def submit(count: int) -> None:
+        for item in islice(remaining, count):
+            pending[executor.submit(operation, item)] = len(results)
+            results.append(BulkResult())
+
+    try:
+        submit(max_workers)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    results[index] = BulkResult(future.result())
+                except errors as exc:
+                    results[index] = BulkResult(error=exc)
+            submit(len(done))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
@@ -0,0 +1,567 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+    from pathlib import Path
+
+T = TypeVar("T")
+
+# Reference data rarely changes, so it is cached for five minutes by default.
+DEFAULT_TTLS = {
+    "*/user": 300.0,
+    "*/workspaces": 300.0,
+    "*/workspaces/*/clients": 300.0,
+    "*/workspaces/*/projects": 300.0,
+    "*/workspaces/*/projects/*/tasks": 300.0,
+    "*/workspaces/*/projects/*/tasks/*": 300.0,
+    "*/workspaces/*/tags": 300.0,
+    "*/workspaces/*/users": 300.0,
+}
+
+# Write endpoints mapped to cached read endpoints they make stale. Placeholders in
+# braces are taken from url of the write, read endpoints may use glob wildcards.
+WS = "/workspaces/{workspace}"
+DEFAULT_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    f"{WS}/clients": (f"{WS}/clients",),
+    f"{WS}/projects": (f"{WS}/projects",),
+    f"{WS}/projects/{{project}}/tasks": (f"{WS}/projects/{{project}}/tasks",),
+    f"{WS}/projects/{{project}}/tasks/{{task}}": (
+        f"{WS}/projects/{{project}}/tasks",
+        f"{WS}/projects/{{project}}/tasks/{{task}}",
+    ),
+    f"{WS}/users": (f"{WS}/users",),
+    f"{WS}/users/{{user}}": (f"{WS}/users", f"{WS}/projects", "/user"),
+    f"{WS}/user/{{user}}/time-entries": (f"{WS}/user/{{user}}/time-entries",),
+    f"{WS}/time-entries/{{entry}}": (
+        f"{WS}/time-entries/{{entry}}",
+        f"{WS}/user/*/time-entries",
+    ),
+}
+
+
+def _location(url: str) -> str:
+    """Returns host and path of url, without trailing slash."""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}".rstrip("/")
+
+
+def _key_location(key: str) -> str:
+    """Returns host and path part of cache key."""
+    return key.split(" ", 2)[2].partition("?")[0].rstrip("/")
+
+
+def _compile_write_path(template: str) -> re.Pattern[str]:
+    pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template))
+    return re.compile(f"(?P<prefix>.*?){pattern}")
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    ttl: float = 0.0
+    parsed: dict[Callable[[bytes], Any], Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @property
+    def fresh(self) -> bool:
+        """Tells whether entry can be used without asking server."""
+        return self.expires_at > time.monotonic()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Returns headers turning request for this entry into conditional one."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def parse(self, parse: Callable[[bytes], T]) -> T:
+        """
+        Returns content parsed by given function, parsing it only once.
+
+        Every call gets its own copy of parsed lists, dicts and models in them, so
+        callers may modify what they got without changing cached content. Objects
+        nested in models are shared between calls.
+        """
+        if parse not in self.parsed:
+            self.parsed[parse] = parse(self.content)
+        return _detach(self.parsed[parse])
+
+
+def _detach(value: Any) -> Any:  # noqa: ANN401
+    """Returns copy of parsed JSON containers, with shallow copies of models."""
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _detach(item) for key, item in value.items()}
+    if isinstance(value, BaseModel):
+        return value.model_copy()
+    return value
+
+
+@dataclass
+class CacheLookup:
+    """
+    Outcome of looking request up in cache, telling transport what to do.
+
+    ``entry`` is served right away when ``serve`` is on, otherwise request is made
+    conditional by its validators. With ``refresh`` on, served stale entry is
+    to be refreshed in background. Requests which are not cached have no ``key``.
+    """
+
+    key: str | None = None
+    entry: CacheEntry | None = None
+    serve: bool = False
+    refresh: bool = False
+
+    def headers(self, headers: dict[str, str]) -> dict[str, str]:
+        """Returns request headers, conditional ones when entry has validators."""
+        if self.entry is None:
+            return headers
+        return {**headers, **self.entry.validators}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+    stale_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from cache, including stale answers."""
+        answered = self.hits + self.stale_hits
+        lookups = answered + self.misses
+        return answered / lookups if lookups else 0.0
+
+
+class CacheBackend(Protocol):
+    """Storage of cache entries, evicting least recently used ones when full."""
+
+    def __len__(self) -> int:
+        """Returns number of stored entries."""
+        ...
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns entry stored under key and marks it recently used."""
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """Stores entry under key, returns number of evicted entries."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Drops entry stored under key, if any."""
+        ...
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over keys of all stored entries."""
+        ...
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        ...
+
+
+class MemoryBackend:
+    """Entries kept in process memory, up to ``maxsize`` of them."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns number of stored entries."""
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns entry stored under key and marks it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """Stores entry under key, returns number of evicted entries."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def delete(self, key: str) -> None:
+        """Drops entry stored under key, if any."""
+        self._entries.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over keys of all stored entries."""
+        return iter(self._entries)
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        self._entries.clear()
+
+
+class SqliteBackend:
+    """
+    Entries persisted in SQLite database, surviving restarts of the process.
+
+    Once there are more than ``maxsize`` entries or their bodies take more than
+    ``max_bytes``, least recently used ones are evicted. Expiry times are stored as
+    wall clock time, so entries fetched by previous run are fresh until their TTL
+    runs out. Database can be shared by threads and processes. Bodies are stored
+    unencrypted, so database should be readable only by its owner.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        maxsize: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL, etag TEXT, last_modified TEXT,"
+                " ttl REAL NOT NULL, used INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)"
+            )
+
+    def close(self) -> None:
+        """Closes database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """Returns number of stored entries."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return count
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns entry stored under key and marks it recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT content, expires_at, etag, last_modified, ttl FROM responses"
+                " WHERE key = ?",
+                [key],
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET used = (SELECT MAX(used) + 1 FROM responses)"
+                " WHERE key = ?",
+                [key],
+            )
+        content, expires_at, etag, last_modified, ttl = row
+        # entries use monotonic clock, which is meaningless in other processes
+        expires_at += time.monotonic() - time.time()
+        return CacheEntry(content, expires_at, etag, last_modified, ttl)
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """Stores entry under key, returns number of evicted entries."""
+        expires_at = entry.expires_at - time.monotonic() + time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?,"
+                " (SELECT COALESCE(MAX(used), 0) + 1 FROM responses))",
+                [
+                    key,
+                    entry.content,
+                    len(entry.content),
+                    expires_at,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.ttl,
+                ],
+            )
+            return self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM ("
+                " SELECT key, ROW_NUMBER() OVER recent AS position,"
+                " SUM(size) OVER recent AS total FROM responses"
+                " WINDOW recent AS (ORDER BY used DESC))"
+                " WHERE position > ? OR total > ?)",
+                [self.maxsize, self.max_bytes],
+            ).rowcount
+
+    def delete(self, key: str) -> None:
+        """Drops entry stored under key, if any."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", [key])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over keys of all stored entries."""
+        with self._lock:
+            rows = self._connection.execute("SELECT key FROM responses").fetchall()
+        return iter([key for (key,) in rows])
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+
+@dataclass
+class ResponseCache:
+    """
+    Cache of GET responses with per-endpoint TTLs and LRU eviction.
+
+    Responses are keyed by API key, method and url with sorted query params. TTL of
+    a response is taken from first pattern in ``ttls`` matching its url path
+    (without trailing slash), ``default_ttl`` applies when none does. Responses
+    with zero TTL are not cached at all. Entries are kept in memory, where least
+    recently used one is evicted once ``maxsize`` entries are stored, unless other
+    ``backend`` is given, such as ``SqliteBackend`` persisting them across restarts.
+
+    Writes evict cached reads they affect, as listed in ``invalidations`` mapping
+    of write endpoints to read endpoints, so TTLs can stay long.
+
+    With ``conditional`` on, responses carrying ``ETag`` or ``Last-Modified`` are
+    kept after they expire (even with zero TTL), so transport can revalidate them
+    with conditional request and reuse them on 304 Not Modified. Parsed content of
+    entry is memoized and every hit gets its own copy of it (see
+    ``CacheEntry.parse``). Entries read from persistent backend are parsed on every
+    hit.
+
+    With positive ``stale_while_revalidate``, entries of endpoints with positive TTL
+    expired less than that many seconds ago are still served, while transport
+    refreshes them in background. Only one refresh of an entry runs at a time.
+    """
+
+    maxsize: int = 1024
+    default_ttl: float = 0.0
+    ttls: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+    invalidations: dict[str, tuple[str, ...]] = field(
+        default_factory=lambda: dict(DEFAULT_INVALIDATIONS)
+    )
+    conditional: bool = True
+    stats: CacheStats = field(default_factory=CacheStats)
+    backend: CacheBackend | None = None
+    stale_while_revalidate: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Sets up storage of entries."""
+        self._backend: CacheBackend = (
+            self.backend if self.backend is not None else MemoryBackend(self.maxsize)
+        )
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._write_paths = [
+            (_compile_write_path(write), reads)
+            for write, reads in self.invalidations.items()
+        ]
+
+    def __len__(self) -> int:
+        """Returns number of stored entries, including expired ones."""
+        return len(self._backend)
+
+    @staticmethod
+    def make_key(method: str, url: str, api_key: str) -> str:
+        """Builds cache key for request, independent of query params order."""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        owner = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return f"{owner} {method.upper()} {parts.netloc}{parts.path}?{query}"
+
+    def ttl_for(self, url: str) -> float:
+        """Returns number of seconds response for url stays fresh."""
+        path = urlsplit(url).path.rstrip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Returns entry stored under key, if it is fresh or can be revalidated.
+
+        Fresh entries count as hits, entries which can be served stale as stale hits.
+        """
+        with self._lock:
+            entry = self._backend.get(key)
+            if (
+                entry is not None
+                and not self.serves_stale(entry)
+                and not entry.validators
+            ):
+                self._backend.delete(key)
+                entry = None
+            if entry is not None and entry.fresh:
+                self.stats.hits += 1
+            elif entry is not None and self.serves_stale(entry):
+                self.stats.stale_hits += 1
+            else:
+                self.stats.misses += 1
+            return entry
+
+    def lookup(self, method: str, url: str, api_key: str) -> CacheLookup:
+        """
+        Looks request up before it is sent, only GET requests are cached.
+
+        Stale entry which can still be served is claimed for refresh, unless its
+        refresh already runs.
+        """
+        if method != "GET":
+            return CacheLookup()
+        key = self.make_key(method, url, api_key)
+        entry = self.get(key)
+        if entry is None or not self.serves_stale(entry):
+            return CacheLookup(key, entry)
+        refresh = not entry.fresh and self.claim_refresh(key)
+        return CacheLookup(key, entry, serve=True, refresh=refresh)
+
+    def settle(
+        self, lookup: CacheLookup, method: str, url: str, status_code: int
+    ) -> CacheEntry | None:
+        """
+        Updates cache once response to looked up request arrives.
+
+        Returns looked up entry when server answered 304 Not Modified. Writes
+        evict cached responses they make stale, even failed ones, as they may
+        have been partially applied.
+        """
+        if lookup.entry is not None and status_code == HTTPStatus.NOT_MODIFIED:
+            self.revalidated(lookup.entry, url, lookup.key)
+            return lookup.entry
+        if method != "GET":
+            self.invalidate_for(url)
+        return None
+
+    def store(
+        self, lookup: CacheLookup, url: str, content: bytes, headers: Mapping[str, str]
+    ) -> CacheEntry | None:
+        """Stores successful response to looked up request, if it is cached."""
+        if lookup.key is None:
+            return None
+        return self.set(
+            lookup.key,
+            url,
+            content,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+    def serves_stale(self, entry: CacheEntry) -> bool:
+        """
+        Tells whether entry can be served, possibly while it is refreshed.
+
+        Entries of endpoints with zero TTL, kept only to be revalidated, are never
+        served without asking server first.
+        """
+        if entry.fresh:
+            return True
+        return (
+            entry.ttl > 0
+            and entry.expires_at + self.stale_while_revalidate > time.monotonic()
+        )
+
+    def claim_refresh(self, key: str) -> bool:
+        """Marks entry as being refreshed, unless its refresh already runs."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: str) -> None:
+        """Marks refresh of entry as finished."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def set(
+        self,
+        key: str,
+        url: str,
+        content: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry | None:
+        """Stores response for url, unless its endpoint is not cached."""
+        ttl = self.ttl_for(url)
+        revalidable = self.conditional and (etag or last_modified)
+        if ttl <= 0 and not revalidable:
+            return None
+        entry = CacheEntry(content, time.monotonic() + ttl, etag, last_modified, ttl)
+        with self._lock:
+            self.stats.evictions += self._backend.set(key, entry)
+        return entry
+
+    def revalidated(self, entry: CacheEntry, url: str, key: str | None = None) -> None:
+        """
+        Marks entry fresh again after server confirmed it did not change.
+
+        Entry is stored again under ``key``, when given, so its new expiry is saved.
+        """
+        entry.ttl = self.ttl_for(url)
+        entry.expires_at = time.monotonic() + entry.ttl
+        self.stats.revalidations += 1
+        if key is not None:
+            with self._lock:
+                self._backend.set(key, entry)
+
+    def invalidate(self, pattern: str) -> int:
+        """
+        Drops entries with host and path matching glob pattern, for all query params.
+
+        Returns number of dropped entries.
+        """
+        with self._lock:
+            stale = [
+                key for key in self._backend if fnmatchcase(_key_location(key), pattern)
+            ]
+            for key in stale:
+                self._backend.delete(key)
+        return len(stale)
+
+    def invalidate_for(self, url: str) -> int:
+        """Drops entries made stale by write sent to url."""
+        location = _location(url)
+        dropped = 0
+        for write_path, reads in self._write_paths:
+            match = write_path.fullmatch(location)
+            if match is None:
+                continue
+            for read in reads:
+                pattern = match["prefix"] + read.format(**match.groupdict())
+                dropped += self.invalidate(pattern)
+        return dropped
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        with self._lock:
+            self._backend.clear()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from clockify_client.codec import get_codec
 from clockify_client.models.client import Client
 from clockify_client.models.project import Project
 from clockify_client.models.report import Report
@@ -8,22 +11,84 @@ from clockify_client.models.task import Task
 from clockify_client.models.time_entry import TimeEntry
 from clockify_client.models.user import User
 from clockify_client.models.workspace import Workspace
+from clockify_client.parsing import check_validation_mode
+from clockify_client.transport import Transport
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+    from clockify_client.cache import ResponseCache
+    from clockify_client.codec import JsonCodec
+    from clockify_client.parsing import ValidationMode
+    from clockify_client.rate_limit import RateLimiter
+    from clockify_client.retry import RetryPolicy
 
 
 class Clockify:
 
-    def __init__(self, api_key: str, api_url: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        pool_maxsize: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        json_codec: JsonCodec | str = "json",
+        validation: ValidationMode = "strict",
+    ) -> None:
         """
         Builds services from available factories.
 
+        All services share one connection pooled transport, and so also share
+        its rate limiter, retry policy and response cache.
+
         :param api_key Clockify API key.
         :param api_url Clockify API url.
+        :param pool_maxsize Number of keep-alive connections kept per host.
+        :param rate_limiter Token bucket limiting requests of all services.
+        :param retry Policy for repeating requests failed with transient errors.
+        :param cache Opt-in cache of GET responses.
+        :param json_codec JSON codec, or name of its library (``json``, ``orjson``,
+            ``msgspec`` or ``auto``) decoding responses and encoding payloads.
+        :param validation How typed responses are validated: fully (``strict``),
+            without format checks of datetimes and durations (``lenient``), or not
+            at all (``trusted``). Raises ValueError for unknown mode.
         """
-        self.workspaces = Workspace(api_key=api_key, api_url=api_url)
-        self.projects = Project(api_key=api_key, api_url=api_url)
-        self.tags = Tag(api_key=api_key, api_url=api_url)
-        self.tasks = Task(api_key=api_key, api_url=api_url)
-        self.time_entries = TimeEntry(api_key=api_key, api_url=api_url)
-        self.users = User(api_key=api_key, api_url=api_url)
-        self.reports = Report(api_key=api_key, api_url=api_url)
-        self.clients = Client(api_key=api_key, api_url=api_url)
+        check_validation_mode(validation)
+        transport = Transport(
+            pool_maxsize=pool_maxsize,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+        )
+        self.transport = transport
+        codec = get_codec(json_codec) if isinstance(json_codec, str) else json_codec
+
+        self.workspaces = Workspace(api_key, api_url, transport, codec, validation)
+        self.projects = Project(api_key, api_url, transport, codec, validation)
+        self.tags = Tag(api_key, api_url, transport, codec, validation)
+        self.tasks = Task(api_key, api_url, transport, codec, validation)
+        self.time_entries = TimeEntry(api_key, api_url, transport, codec, validation)
+        self.users = User(api_key, api_url, transport, codec, validation)
+        self.reports = Report(api_key, api_url, transport, codec, validation)
+        self.clients = Client(api_key, api_url, transport, codec, validation)
+
+    def close(self) -> None:
+        """Closes pooled connections of all services."""
+        self.transport.close()
+
+    def __enter__(self) -> Self:
+        """Returns itself, connections are closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Closes pooled connections."""
+        self.close()
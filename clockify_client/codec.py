@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from clockify_client.types import Payload
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Functions decoding JSON bytes into Python objects and encoding them back."""
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+    def encode(self, payload: Payload) -> bytes:
+        """Returns request body for payload, pydantic models are dumped by pydantic."""
+        if isinstance(payload, BaseModel):
+            # dumped straight to JSON, without intermediate dict
+            return payload.model_dump_json(exclude_unset=True, by_alias=True).encode()
+        return self.dumps(payload)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:  # noqa: ANN401
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+STDLIB_CODEC = JsonCodec("json", json.loads, _stdlib_dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # noqa: PLC0415
+
+    return JsonCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # noqa: PLC0415
+
+    return JsonCodec("msgspec", msgspec.json.decode, msgspec.json.encode)
+
+
+CODECS: dict[str, Callable[[], JsonCodec]] = {
+    "json": lambda: STDLIB_CODEC,
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Returns JSON codec backed by library of given name.
+
+    Known names are ``json`` (standard library), ``orjson`` and ``msgspec``. With
+    ``auto``, the fastest installed library is picked, falling back to standard
+    library. Raises ``ImportError`` when requested library is not installed.
+    """
+    if name == "auto":
+        for fast in ("orjson", "msgspec"):
+            try:
+                return CODECS[fast]()
+            except ImportError:
+                continue
+        return STDLIB_CODEC
+    if name not in CODECS:
+        msg = f"Unknown JSON codec {name!r}, choose one of {', '.join(CODECS)}"
+        raise ValueError(msg)
+    return CODECS[name]()
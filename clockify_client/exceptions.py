@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+class ClockifyError(Exception):
+    """Base class for errors raised by clockify_client itself."""
+
+
+class RateLimitExceededError(ClockifyError):
+    """Raised when client-side rate limiter refuses to send request."""
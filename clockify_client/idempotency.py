@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import requests
+from dateutil.parser import isoparse
+
+from clockify_client.api_objects.time_entry import AddTimeEntryResponse
+from clockify_client.bulk import run_bulk
+from clockify_client.exceptions import RateLimitExceededError
+from clockify_client.retry import RetryPolicy
+from clockify_client.types import API_DATETIME_FORMAT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+
+    from clockify_client.api_objects.time_entry import (
+        AddTimeEntryPayload,
+        TimeEntryResponse,
+    )
+    from clockify_client.bulk import BulkResult
+    from clockify_client.models.time_entry import TimeEntry
+
+PENDING = "pending"
+DONE = "done"
+
+
+def idempotency_key(
+    workspace_id: str, user_id: str, payload: AddTimeEntryPayload
+) -> str:
+    """Returns stable key of time entry creation, equal for equal payloads."""
+    body = payload.model_dump(mode="json", by_alias=True)
+    text = json.dumps([workspace_id, user_id, body], sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """
+    Write recorded in journal.
+
+    Pending writes were attempted, but their outcome is not known. Done writes
+    keep response of the server as JSON, if it sent any.
+    """
+
+    key: str
+    status: str
+    response: str | None = None
+
+
+class IdempotencyJournal:
+    """Outcomes of writes persisted in SQLite database, keyed by idempotency key."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS writes (key TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL, response TEXT, updated_at REAL NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Closes database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        """Returns itself, connection is closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Closes database connection."""
+        self.close()
+
+    def get(self, key: str) -> JournalRecord | None:
+        """Returns write recorded under key, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, response FROM writes WHERE key = ?", [key]
+            ).fetchone()
+        return JournalRecord(key, *row) if row is not None else None
+
+    def begin(self, key: str) -> None:
+        """Records write as pending, unless it is already recorded."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO writes VALUES (?, ?, NULL, ?)",
+                [key, PENDING, time.time()],
+            )
+
+    def complete(self, key: str, response: str | None) -> None:
+        """Records write as done, with response of the server."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?)",
+                [key, DONE, response, time.time()],
+            )
+
+    def forget(self, key: str) -> None:
+        """Drops write, once it is known that server did not act on it."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM writes WHERE key = ?", [key])
+
+
+def _utc(value: str) -> datetime:
+    """Parses ISO 8601 datetime in UTC, datetime without offset is taken as UTC."""
+    moment = isoparse(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+class IdempotentTimeEntries:
+    """
+    Time entry creation safe to repeat, backed by idempotency journal.
+
+    Every creation is recorded in ``journal`` under key derived from its payload.
+    Creation already done returns recorded response without calling Clockify.
+    Before repeating creation which failed with unknown outcome, either within
+    ``retry`` policy or in later call, Clockify is asked for existing entry with
+    the same start, end, description, project and task, which is then returned
+    instead of creating another one. Equal payloads are therefore treated as one
+    entry and must not be used to create several identical ones.
+    """
+
+    def __init__(
+        self,
+        time_entries: TimeEntry,
+        journal: IdempotencyJournal,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.time_entries = time_entries
+        self.journal = journal
+        self.retry = retry if retry is not None else RetryPolicy()
+
+    def add_time_entry(
+        self, workspace_id: str, user_id: str, payload: AddTimeEntryPayload
+    ) -> AddTimeEntryResponse | None:
+        """
+        Adds time entry unless it was already added, retrying failed attempts.
+
+        Raises last error once retries are exhausted; creation then stays pending
+        in journal unless server rejected it, so next call looks for the entry.
+        """
+        key = idempotency_key(workspace_id, user_id, payload)
+        record = self.journal.get(key)
+        if record is not None and record.status == DONE:
+            if record.response is None:
+                return None
+            return AddTimeEntryResponse.model_validate_json(record.response)
+
+        uncertain = record is not None
+        self.journal.begin(key)
+        attempt = 1
+        while True:
+            if uncertain:
+                existing = self.find_existing(workspace_id, user_id, payload)
+                if existing is not None:
+                    found = AddTimeEntryResponse.model_validate(existing)
+                    self._complete(key, found)
+                    return found
+            try:
+                created = self.time_entries.add_time_entry(
+                    workspace_id, user_id, payload
+                )
+            except RateLimitExceededError:
+                if not uncertain:
+                    self.journal.forget(key)  # request was not sent at all
+                raise
+            except requests.RequestException as exc:
+                response = exc.response
+                status = response.status_code if response is not None else None
+                if not self.retry.should_retry(
+                    "POST", attempt, status, idempotent=True
+                ):
+                    if status is not None and status < HTTPStatus.INTERNAL_SERVER_ERROR:
+                        self.journal.forget(key)  # server rejected it
+                    raise
+                retry_after = (
+                    response.headers.get("Retry-After")
+                    if response is not None
+                    else None
+                )
+                time.sleep(self.retry.backoff(attempt, retry_after))
+                attempt += 1
+                uncertain = True
+            else:
+                self._complete(key, created)
+                return created
+
+    def add_time_entries(
+        self,
+        workspace_id: str,
+        user_id: str,
+        payloads: Iterable[AddTimeEntryPayload],
+        *,
+        max_workers: int = 8,
+    ) -> list[BulkResult[AddTimeEntryResponse | None]]:
+        """Adds many time entries concurrently, each one at most once."""
+        return run_bulk(
+            lambda payload: self.add_time_entry(workspace_id, user_id, payload),
+            payloads,
+            max_workers,
+        )
+
+    def find_existing(
+        self, workspace_id: str, user_id: str, payload: AddTimeEntryPayload
+    ) -> TimeEntryResponse | None:
+        """Returns time entry of user matching payload, if there is one."""
+        start, end = _utc(payload.start), _utc(payload.end)
+        # query bounds have whole seconds, so end is rounded up to keep the entry
+        params = {
+            "start": start.strftime(API_DATETIME_FORMAT),
+            "end": (end + timedelta(microseconds=999999)).strftime(API_DATETIME_FORMAT),
+        }
+        for entry in self.time_entries.iter_time_entries(workspace_id, user_id, params):
+            if (
+                _utc(entry.time_interval.start) == start
+                and _utc(entry.time_interval.end) == end
+                and entry.description == payload.description
+                and entry.project_id == payload.project_id
+                and entry.task_id == payload.task_id
+            ):
+                return entry
+        return None
+
+    def _complete(self, key: str, created: AddTimeEntryResponse | None) -> None:
+        response = created.model_dump_json(by_alias=True) if created else None
+        self.journal.complete(key, response)
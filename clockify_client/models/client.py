@@ -6,6 +6,8 @@ from urllib.parse import urlencode
 from clockify_client.abstract_clockify import AbstractClockify
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from clockify_client.types import JsonType
 
 
@@ -47,3 +49,16 @@ class Client(AbstractClockify):
             path = f"/workspaces/{workspace_id}/clients/"
 
         return self.get(path)
+
+    def iter_clients(
+        self, workspace_id: str, params: dict | None = None, *, prefetch: int = 0
+    ) -> Iterator:
+        """
+        Lazily yields clients from all pages.
+
+        https://docs.clockify.me/#tag/Client/operation/getClients
+        """
+        path = f"/workspaces/{workspace_id}/clients"
+
+        for page in self.paginate(path, params, prefetch):
+            yield from page
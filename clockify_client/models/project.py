@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
 from clockify_client.abstract_clockify import AbstractClockify
@@ -9,9 +9,10 @@ from clockify_client.api_objects.project import (
     AddProjectResponse,
     GetProjectResponse,
 )
-from clockify_client.types import JsonType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from clockify_client.api_objects.project import GetProjectsParams
 
 
@@ -33,10 +34,25 @@ class Project(AbstractClockify):
         else:
             path = f"/workspaces/{workspace_id}/projects/"
 
-        response = cast(list[JsonType], self.get(path))
-        if response is None:
-            return None
-        return [GetProjectResponse.model_validate(r) for r in response]
+        return self.get_as(path, list[GetProjectResponse])
+
+    def iter_projects(
+        self,
+        workspace_id: str,
+        params: GetProjectsParams | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> Iterator[GetProjectResponse]:
+        """
+        Lazily yields projects from all pages, starting at ``params.page``.
+
+        https://docs.clockify.me/#tag/Project/operation/getProjects
+        """
+        path = f"/workspaces/{workspace_id}/projects"
+        query = params.model_dump(exclude_none=True, by_alias=True) if params else {}
+
+        for page in self.paginate(path, query, prefetch, item_type=GetProjectResponse):
+            yield from page
 
     def add_project(
         self,
@@ -61,9 +77,4 @@ class Project(AbstractClockify):
             billable=billable,
         )
 
-        response = self.post(
-            path, payload=payload.model_dump(exclude_unset=True, by_alias=True)
-        )
-        if response is None:
-            return None
-        return AddProjectResponse.model_validate(response)
+        return self.post_as(path, payload, AddProjectResponse)
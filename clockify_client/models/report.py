@@ -1,37 +1,200 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
 
-from clockify_client.abstract_clockify import AbstractClockify
+from clockify_client.abstract_clockify import (
+    DEFAULT_PAGE_SIZE,
+    JSON_CONTENT_TYPE,
+    AbstractClockify,
+)
+from clockify_client.sharding import (
+    merge_detailed_reports,
+    merge_summary_reports,
+    sorted_descending,
+    split_date_range,
+)
+from clockify_client.streaming import ItemStream
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from clockify_client.sharding import Window
     from clockify_client.types import JsonType
 
 
+class DetailedReport:
+    """
+    Time entries of detailed report, lazily fetched page after page.
+
+    Pages are requested with ``detailedFilter.page`` and ``pageSize`` rewritten
+    in copy of the payload, starting on page the payload names. ``totals`` of the
+    report are kept from its first page, as every page repeats them.
+    """
+
+    def __init__(
+        self, report: Report, workspace_id: str, payload: dict, prefetch: int = 0
+    ) -> None:
+        self.report = report
+        self.path = f"/workspaces/{workspace_id}/reports/detailed/"
+        self.payload = payload
+        self.prefetch = prefetch
+        detailed_filter = payload.get("detailedFilter") or {}
+        self.first_page = int(detailed_filter.get("page", 1))
+        self.page_size = int(detailed_filter.get("pageSize", DEFAULT_PAGE_SIZE))
+        self.totals: list[dict[str, Any]] | None = None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yields time entries from all pages, in order."""
+        pages = self.report._walk_pages(
+            self._fetch_page, self.first_page, self.page_size, self.prefetch
+        )
+        for page in pages:
+            yield from page
+
+    def _fetch_page(self, page: int) -> list:
+        detailed_filter = {
+            **(self.payload.get("detailedFilter") or {}),
+            "page": page,
+            "pageSize": self.page_size,
+        }
+        payload = {**self.payload, "detailedFilter": detailed_filter}
+        response = self.report._post_report(self.path, payload)
+        if not isinstance(response, dict):
+            return []  # pragma: nocover
+        if page == self.first_page:
+            self.totals = response.get("totals")
+        return response.get("timeentries") or []
+
+
 class Report(AbstractClockify):
-    def __init__(self, api_key: str, api_url: str) -> None:
-        super().__init__(api_key=api_key, api_url=api_url)
-        self.base_url = f"https://reports.{api_url.strip('/')}"
+    subdomain = "reports"
+
+    def _post_report(self, path: str, payload: dict) -> JsonType:
+        # reports are only read, so their requests are safe to repeat
+        return self._request("POST", path, payload, idempotent=True)
 
-    def get_summary_report(self, workspace_id: str, payload: dict) -> JsonType:
+    def get_summary_report(
+        self,
+        workspace_id: str,
+        payload: dict,
+        *,
+        shard_by: Window | None = None,
+        max_workers: int = 4,
+    ) -> JsonType:
         """
         Calls Clockify API for summary report.
 
+        With ``shard_by`` set, date range of the report is split into windows of
+        a day, week or month, which are requested in parallel by up to
+        ``max_workers`` threads; their totals and groups are merged into one
+        report. Merged groups are not sorted again, they keep order of their first
+        appearance.
+
         https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateSummaryReport
         """
         path = f"/workspaces/{workspace_id}/reports/summary/"
 
-        return self.post(path, payload=payload)
+        if shard_by is None:
+            return self._post_report(path, payload)
+
+        def fetch(window_payload: dict) -> dict:
+            return cast(dict | None, self._post_report(path, window_payload)) or {}
 
-    def get_detailed_report(self, workspace_id: str, payload: dict) -> JsonType:
+        reports = self._shard(payload, shard_by, max_workers, fetch)
+        return merge_summary_reports(reports)
+
+    def get_detailed_report(
+        self,
+        workspace_id: str,
+        payload: dict,
+        *,
+        shard_by: Window | None = None,
+        max_workers: int = 4,
+    ) -> JsonType:
         """
         Calls Clockify API for detailed report.
 
+        With ``shard_by`` set, date range of the report is split into windows of
+        a day, week or month, which are requested in parallel by up to
+        ``max_workers`` threads. All pages of every window are fetched, their time
+        entries are concatenated in order of ``sortOrder`` and totals summed. Only
+        reports sorted by ``DATE`` column can be sharded, ValueError is raised for
+        other ``sortColumn``.
+
         https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateDetailedReport
         """
         path = f"/workspaces/{workspace_id}/reports/detailed/"
 
-        return self.post(path, payload=payload)
+        if shard_by is None:
+            return self._post_report(path, payload)
+
+        descending = sorted_descending(payload)
+
+        def fetch(window_payload: dict) -> dict:
+            report = DetailedReport(self, workspace_id, window_payload)
+            entries = list(report)
+            return {"totals": report.totals, "timeentries": entries}
+
+        reports = self._shard(payload, shard_by, max_workers, fetch)
+        return merge_detailed_reports(reports, descending=descending)
+
+    @staticmethod
+    def _shard(
+        payload: dict,
+        shard_by: Window,
+        max_workers: int,
+        fetch: Callable[[dict], dict],
+    ) -> list[dict]:
+        windows = split_date_range(
+            payload["dateRangeStart"], payload["dateRangeEnd"], shard_by
+        )
+        payloads = [
+            {**payload, "dateRangeStart": start, "dateRangeEnd": end}
+            for start, end in windows
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, payloads))
+
+    def iter_detailed_report(
+        self, workspace_id: str, payload: dict, *, prefetch: int = 0
+    ) -> DetailedReport:
+        """
+        Lazily yields time entries of detailed report from all pages.
+
+        Report ``totals`` are set on returned object once its first page is
+        fetched. With ``prefetch`` set, that many pages are fetched ahead in
+        background threads while current page is consumed.
+
+        https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateDetailedReport
+        """
+        return DetailedReport(self, workspace_id, payload, prefetch)
+
+    def stream_detailed_report(
+        self, workspace_id: str, payload: dict, chunk_size: int = 65536
+    ) -> ItemStream:
+        """
+        Calls Clockify API for detailed report, parsing it while it is downloaded.
+
+        Iterating returned stream yields time entries one by one, reading response
+        body in chunks of ``chunk_size`` bytes, so memory use is bounded by one
+        entry instead of whole report. Other parts of report, such as ``totals``,
+        are collected into ``members`` of the stream. Request is sent once
+        iteration starts.
+
+        https://docs.clockify.me/#tag/Time-Entry-Report/operation/generateDetailedReport
+        """
+        url = f"{self.base_url}/workspaces/{workspace_id}/reports/detailed/"
+
+        chunks = self.transport.stream(
+            "POST",
+            url,
+            headers={**self.header, **JSON_CONTENT_TYPE},
+            content=self.codec.encode(payload),
+            chunk_size=chunk_size,
+            idempotent=True,
+        )
+        return ItemStream(chunks, "timeentries")
 
     def get_weekly_report(self, workspace_id: str, payload: dict) -> JsonType:
         """
@@ -41,4 +204,4 @@ class Report(AbstractClockify):
         """
         path = f"/workspaces/{workspace_id}/reports/weekly/"
 
-        return self.post(path, payload=payload)
+        return self._post_report(path, payload)
@@ -6,6 +6,8 @@ from urllib.parse import urlencode
 from clockify_client.abstract_clockify import AbstractClockify
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from clockify_client.types import JsonType
 
 
@@ -24,3 +26,16 @@ class Tag(AbstractClockify):
             path = f"/workspaces/{workspace_id}/tags/"
 
         return self.get(path)
+
+    def iter_tags(
+        self, workspace_id: str, params: dict | None = None, *, prefetch: int = 0
+    ) -> Iterator:
+        """
+        Lazily yields tags from all pages.
+
+        https://docs.clockify.me/#tag/Tag/operation/getTags
+        """
+        path = f"/workspaces/{workspace_id}/tags"
+
+        for page in self.paginate(path, params, prefetch):
+            yield from page
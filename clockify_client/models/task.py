@@ -6,6 +6,8 @@ from urllib.parse import urlencode
 from clockify_client.abstract_clockify import AbstractClockify
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from clockify_client.types import JsonType
 
 
@@ -63,6 +65,24 @@ class Task(AbstractClockify):
 
         return self.get(path)
 
+    def iter_tasks(
+        self,
+        workspace_id: str,
+        project_id: str,
+        params: dict | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> Iterator:
+        """
+        Lazily yields tasks of project from all pages.
+
+        https://docs.clockify.me/#tag/Task/operation/getTasks
+        """
+        path = f"/workspaces/{workspace_id}/projects/{project_id}/tasks"
+
+        for page in self.paginate(path, params, prefetch):
+            yield from page
+
     def get_task(self, workspace_id: str, project_id: str, task_id: str) -> JsonType:
         """
         Gets task from Clockify.
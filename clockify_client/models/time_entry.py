@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
 from clockify_client.abstract_clockify import AbstractClockify
@@ -9,13 +12,26 @@ from clockify_client.api_objects.time_entry import (
     TimeEntryResponse,
     UpdateTimeEntryResponse,
 )
-from clockify_client.types import JsonType
+from clockify_client.bulk import OPERATION_ERRORS, BulkReport, run_bulk
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
     from clockify_client.api_objects.time_entry import (
         AddTimeEntryPayload,
         UpdateTimeEntryPayload,
     )
+    from clockify_client.bulk import BulkResult
+
+
+@dataclass
+class UserTimeEntries:
+    """Time entries of one user, or error which prevented fetching them."""
+
+    user_id: str
+    entries: list[TimeEntryResponse] = field(default_factory=list)
+    error: Exception | None = None
 
 
 class TimeEntry(AbstractClockify):
@@ -36,11 +52,83 @@ class TimeEntry(AbstractClockify):
         else:
             path = f"{base_path}/"
 
-        response = cast(list[JsonType], self.get(path))
+        return self.get_as(path, list[TimeEntryResponse])
+
+    def iter_time_entries(
+        self,
+        workspace_id: str,
+        user_id: str,
+        params: dict | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> Iterator[TimeEntryResponse]:
+        """
+        Lazily yields user time entries from all pages.
+
+        With ``prefetch`` set, that many pages are fetched ahead in background
+        threads while current page is consumed.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/getTimeEntries
+        """
+        path = f"/workspaces/{workspace_id}/user/{user_id}/time-entries"
+
+        for page in self.paginate(path, params, prefetch, item_type=TimeEntryResponse):
+            yield from page
+
+    def get_workspace_time_entries(
+        self,
+        workspace_id: str,
+        params: dict | None = None,
+        *,
+        user_ids: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> Iterator[UserTimeEntries]:
+        """
+        Lazily yields time entries of all workspace users, one user at a time.
+
+        Entries of up to ``max_workers`` users are fetched concurrently, each user
+        from all pages, and results are yielded in order of completion. Users are
+        listed from workspace unless ``user_ids`` are given. Failure to fetch
+        entries of one user is reported in its result and does not stop others.
 
-        if response is None:
-            return None  # pragma: nocover
-        return [TimeEntryResponse.model_validate(r) for r in response]
+        https://docs.clockify.me/#tag/Time-entry/operation/getTimeEntries
+        """
+        if user_ids is None:
+            user_ids = self._iter_user_ids(workspace_id)
+        remaining = iter(user_ids)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: set[Future[UserTimeEntries]] = set()
+
+        def submit(count: int) -> None:
+            for user_id in islice(remaining, count):
+                pending.add(
+                    executor.submit(
+                        self._user_time_entries, workspace_id, user_id, params
+                    )
+                )
+
+        try:
+            submit(max_workers)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                submit(len(done))
+                yield from (future.result() for future in done)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_user_ids(self, workspace_id: str) -> Iterator[str]:
+        for page in self.paginate(f"/workspaces/{workspace_id}/users"):
+            for user in page:
+                yield user["id"]
+
+    def _user_time_entries(
+        self, workspace_id: str, user_id: str, params: dict | None
+    ) -> UserTimeEntries:
+        try:
+            entries = list(self.iter_time_entries(workspace_id, user_id, params))
+        except OPERATION_ERRORS as exc:
+            return UserTimeEntries(user_id, error=exc)
+        return UserTimeEntries(user_id, entries)
 
     def get_time_entry(
         self, workspace_id: str, time_entry_id: str
@@ -52,11 +140,7 @@ class TimeEntry(AbstractClockify):
         """
         path = f"/workspaces/{workspace_id}/time-entries/{time_entry_id}"
 
-        response = self.get(path)
-
-        if response is None:
-            return None  # pragma: nocover
-        return TimeEntryResponse.model_validate(response)
+        return self.get_as(path, TimeEntryResponse)
 
     def add_time_entry(
         self, workspace_id: str, user_id: str, payload: AddTimeEntryPayload
@@ -70,13 +154,31 @@ class TimeEntry(AbstractClockify):
         """
         path = f"/workspaces/{workspace_id}/user/{user_id}/time-entries/"
 
-        response = self.post(
-            path, payload=payload.model_dump(exclude_unset=True, by_alias=True)
-        )
+        return self.post_as(path, payload, AddTimeEntryResponse)
+
+    def add_time_entries(
+        self,
+        workspace_id: str,
+        user_id: str,
+        payloads: Iterable[AddTimeEntryPayload],
+        *,
+        max_workers: int = 8,
+    ) -> list[BulkResult[AddTimeEntryResponse | None]]:
+        """
+        Adds many time entries concurrently, returning result of each in order.
 
-        if response is None:
-            return None  # pragma: nocover
-        return AddTimeEntryResponse.model_validate(response)
+        Up to ``max_workers`` entries are added at a time, all requests go through
+        shared transport and so respect its rate limiter. Failure to add one entry
+        is reported in its result and does not stop others. Failed additions are
+        not retried, as Clockify may have created entry despite the error.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/createTimeEntry
+        """
+        return run_bulk(
+            lambda payload: self.add_time_entry(workspace_id, user_id, payload),
+            payloads,
+            max_workers,
+        )
 
     def update_time_entry(
         self, workspace_id: str, entry_id: str, payload: UpdateTimeEntryPayload
@@ -88,13 +190,30 @@ class TimeEntry(AbstractClockify):
         """
         path = f"/workspaces/{workspace_id}/time-entries/{entry_id}"
 
-        response = self.put(
-            path, payload=payload.model_dump(exclude_unset=True, by_alias=True)
-        )
+        return self.put_as(path, payload, UpdateTimeEntryResponse)
 
-        if response is None:
-            return None  # pragma: nocover
-        return UpdateTimeEntryResponse.model_validate(response)
+    def update_time_entries(
+        self,
+        workspace_id: str,
+        updates: Iterable[tuple[str, UpdateTimeEntryPayload]],
+        *,
+        max_workers: int = 8,
+    ) -> BulkReport[UpdateTimeEntryResponse | None]:
+        """
+        Updates many time entries concurrently, given pairs of entry id and payload.
+
+        Up to ``max_workers`` entries are updated at a time. Failure to update one
+        entry is reported by its id and does not stop others.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/updateTimeEntry
+        """
+        updates = list(updates)
+        results = run_bulk(
+            lambda update: self.update_time_entry(workspace_id, *update),
+            updates,
+            max_workers,
+        )
+        return BulkReport([entry_id for entry_id, _ in updates], results)
 
     def delete_time_entry(self, workspace_id: str, entry_id: str) -> None:
         """Updates time entry in Clockify with provided payload data.
@@ -104,3 +223,22 @@ class TimeEntry(AbstractClockify):
         path = f"/workspaces/{workspace_id}/time-entries/{entry_id}"
 
         self.delete(path)
+
+    def delete_time_entries(
+        self, workspace_id: str, entry_ids: Iterable[str], *, max_workers: int = 8
+    ) -> BulkReport[None]:
+        """
+        Deletes many time entries concurrently.
+
+        Up to ``max_workers`` entries are deleted at a time. Failure to delete one
+        entry is reported by its id and does not stop others.
+
+        https://docs.clockify.me/#tag/Time-entry/operation/deleteTimeEntry
+        """
+        entry_ids = list(entry_ids)
+        results = run_bulk(
+            lambda entry_id: self.delete_time_entry(workspace_id, entry_id),
+            entry_ids,
+            max_workers,
+        )
+        return BulkReport(entry_ids, results)
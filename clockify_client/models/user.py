@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
 from clockify_client.abstract_clockify import AbstractClockify
@@ -11,6 +11,8 @@ from clockify_client.api_objects.user import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from clockify_client.api_objects.user import GetUsersParams
     from clockify_client.types import JsonType
 
@@ -24,10 +26,7 @@ class User(AbstractClockify):
         """
         path = "/user/"
 
-        response = self.get(path)
-        if response is None:
-            return None  # pragma: nocover
-        return UserResponse.model_validate(response)
+        return self.get_as(path, UserResponse)
 
     def get_users(
         self, workspace_id: str, params: GetUsersParams | None = None
@@ -44,10 +43,24 @@ class User(AbstractClockify):
         else:
             path = f"/workspaces/{workspace_id}/users/"
 
-        response = cast(list, self.get(path))
-        if response is None:
-            return None  # pragma: nocover
-        return [UserResponse.model_validate(r) for r in response]
+        return self.get_as(path, list[UserResponse])
+
+    def iter_users(
+        self,
+        workspace_id: str,
+        params: GetUsersParams | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> Iterator[UserResponse]:
+        """Lazily yields users of workspace from all pages.
+
+        https://docs.clockify.me/#tag/User/operation/getUsersOfWorkspace
+        """
+        path = f"/workspaces/{workspace_id}/users"
+        query = params.model_dump(exclude_none=True, by_alias=True) if params else {}
+
+        for page in self.paginate(path, query, prefetch, item_type=UserResponse):
+            yield from page
 
     def add_user(self, workspace_id: str, email: str) -> AddUserResponse | None:
         """Adds new user into workspace.
@@ -58,12 +71,7 @@ class User(AbstractClockify):
 
         payload = AddUserPayload(email=email)
 
-        response = self.post(
-            path, payload=payload.model_dump(exclude_unset=True, by_alias=True)
-        )
-        if response is None:
-            return None  # pragma: nocover
-        return AddUserResponse.model_validate(response)
+        return self.post_as(path, payload, AddUserResponse)
 
     def update_user(self, workspace_id: str, user_id: str, status: str) -> JsonType:
         """Update user status in workspace.
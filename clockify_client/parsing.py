@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import types
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+# strict: full validation; lenient: type checks and coercion, but no format checks
+# of API models (datetimes, durations); trusted: models built without validation
+ValidationMode = Literal["strict", "lenient", "trusted"]
+VALIDATION_MODES: tuple[ValidationMode, ...] = ("strict", "lenient", "trusted")
+
+# validation context telling validators of API models to skip format checks
+LENIENT = {"lenient": True}
+
+_adapters: dict[Any, TypeAdapter[Any]] = {}
+_parsers: dict[tuple[Any, ...], Callable[[bytes], Any]] = {}
+_builders: dict[Any, Callable[[Any], Any]] = {}
+
+
+def check_validation_mode(mode: str) -> None:
+    """Raises ValueError unless mode is one of ``VALIDATION_MODES``."""
+    if mode not in VALIDATION_MODES:
+        msg = f"Unknown validation mode {mode!r}"
+        raise ValueError(msg)
+
+
+def _adapter(response_type: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+    # building adapter compiles validator, so it is done once per type
+    adapter = _adapters.get(response_type)
+    if adapter is None:
+        adapter = _adapters[response_type] = TypeAdapter(response_type)
+    return adapter
+
+
+def _identity(value: Any) -> Any:  # noqa: ANN401
+    return value
+
+
+def _builder(response_type: Any) -> Callable[[Any], Any]:  # noqa: ANN401
+    """Returns function building instance of type from decoded JSON, unvalidated."""
+    builder = _builders.get(response_type)
+    if builder is not None:
+        return builder
+
+    origin, args = get_origin(response_type), get_args(response_type)
+    if isinstance(response_type, type) and issubclass(response_type, BaseModel):
+        builder = _model_builder(response_type)
+    elif origin is list and args:
+        builder = partial(_build_list, _builder(args[0]))
+    elif origin is dict and args:
+        builder = partial(_build_dict, _builder(args[-1]))
+    elif origin in (Union, types.UnionType):
+        # optional model is the only union of models used by API objects
+        arms = [_builder(arg) for arg in args if arg is not type(None)]
+        builder = arms[0] if len(arms) == 1 else _identity
+    else:
+        builder = _identity
+    _builders[response_type] = builder
+    return builder
+
+
+def _build_list(item: Callable[[Any], Any], data: Any) -> Any:  # noqa: ANN401
+    return [item(value) for value in data] if isinstance(data, list) else data
+
+
+def _build_dict(value: Callable[[Any], Any], data: Any) -> Any:  # noqa: ANN401
+    if not isinstance(data, dict):
+        return data
+    return {key: value(item) for key, item in data.items()}
+
+
+def _model_builder(model: type[BaseModel]) -> Callable[[Any], Any]:
+    fields: list[tuple[str, str, Callable[[Any], Any]]] = []
+
+    def build(data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict):
+            return data
+        if not fields:
+            # resolved on first use, so models may refer to themselves
+            fields.extend(
+                (field.alias or name, name, _builder(field.annotation))
+                for name, field in model.model_fields.items()
+            )
+        values = {}
+        for alias, name, convert in fields:
+            if alias in data:
+                values[name] = convert(data[alias])
+            elif name in data:
+                values[name] = convert(data[name])
+        return model.model_construct(**values)
+
+    return build
+
+
+def _trusted(
+    build: Callable[[Any], Any], loads: Callable[[bytes], Any], content: bytes
+) -> Any:  # noqa: ANN401
+    return build(loads(content))
+
+
+def json_parser(  # noqa: UP047
+    response_type: type[T],
+    mode: ValidationMode = "strict",
+    loads: Callable[[bytes], Any] = json.loads,
+) -> Callable[[bytes], T]:
+    """
+    Returns function parsing raw JSON bytes straight into given type.
+
+    In ``strict`` mode everything is validated. In ``lenient`` mode format checks
+    done by API models, such as parsing of datetimes and durations, are skipped.
+    In ``trusted`` mode JSON is decoded by ``loads`` and models are constructed
+    from it without any validation, so malformed responses produce malformed
+    models. Parser is built once per type and mode and parsers returned for it
+    compare equal, so cached responses are parsed only once per type.
+    """
+    check_validation_mode(mode)
+    key = (response_type, mode, loads if mode == "trusted" else None)
+    parser = _parsers.get(key)
+    if parser is None:
+        if mode == "strict":
+            parser = _adapter(response_type).validate_json
+        elif mode == "lenient":
+            parser = partial(_adapter(response_type).validate_json, context=LENIENT)
+        else:
+            parser = partial(_trusted, _builder(response_type), loads)
+        _parsers[key] = parser
+    return parser
+
+
+def list_parser(  # noqa: UP047
+    item_type: type[T],
+    mode: ValidationMode = "strict",
+    loads: Callable[[bytes], Any] = json.loads,
+) -> Callable[[bytes], list[T]]:
+    """Returns function parsing raw JSON array bytes into list of given type."""
+    return json_parser(list[item_type], mode, loads)  # type: ignore[valid-type]
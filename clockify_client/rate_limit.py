@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from clockify_client.exceptions import RateLimitExceededError
+
+
+class RateLimiter:
+    """
+    Thread safe token bucket limiting requests sent by transport.
+
+    Bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per second;
+    every request takes one token. When bucket is empty, request either waits for
+    its token (``block=True``, at most ``timeout`` seconds) or fails right away with
+    ``RateLimitExceededError``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.block = block
+        self.timeout = timeout
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes one token, returns number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+            # tokens go negative while callers queue up for future tokens
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if delay and not self.block:
+                msg = "Rate limit reached, no token available"
+                raise RateLimitExceededError(msg)
+            if self.timeout is not None and delay > self.timeout:
+                msg = f"Rate limit reached, token not available in {self.timeout}s"
+                raise RateLimitExceededError(msg)
+            self._tokens -= 1
+            return delay
+
+    def acquire(self) -> None:
+        """Takes token for one request, sleeping until it is available."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Takes token for one request without blocking event loop."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
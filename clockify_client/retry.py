@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether and when transport repeats failed request.
+
+    Delay before attempt ``n + 1`` is ``backoff_factor * 2 ** (n - 1)`` capped at
+    ``max_backoff``, randomized between zero and that value when ``jitter`` is on.
+    ``Retry-After`` header of the response takes precedence when present.
+
+    Idempotent requests are retried on any status from ``retry_statuses`` and on
+    connection errors. POST requests are only repeated when server surely did not
+    act on them (429 responses, failures to connect), unless caller marks them as
+    idempotent.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_statuses: frozenset[int] = field(default=frozenset({429, 500, 502, 503, 504}))
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        *,
+        idempotent: bool | None = None,
+        maybe_processed: bool = True,
+    ) -> bool:
+        """
+        Tells whether request that failed on given attempt can be sent again.
+
+        ``status_code`` is None when no response was received at all;
+        ``maybe_processed`` is False when request never reached the server.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if idempotent:
+            return True
+        if status_code is None:
+            return not maybe_processed
+        return status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Returns seconds to wait after given failed attempt."""
+        if self.respect_retry_after and retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parses ``Retry-After`` header given either in seconds or as HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
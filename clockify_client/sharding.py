@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Literal
+
+from dateutil.parser import isoparse
+from dateutil.relativedelta import relativedelta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+Window = Literal["day", "week", "month"]
+
+WINDOWS: dict[str, relativedelta] = {
+    "day": relativedelta(days=1),
+    "week": relativedelta(weeks=1),
+    "month": relativedelta(months=1),
+}
+
+# fields identifying records of report lists, so the same record of two windows
+# can be merged, e.g. project group by ``_id`` or amount by ``type``
+KEY_FIELDS = ("_id", "type", "currency")
+
+# Clockify sorts detailed reports by date, newest first, unless told otherwise
+DEFAULT_SORT_COLUMN = "DATE"
+DEFAULT_SORT_ORDER = "DESCENDING"
+
+
+def _format(moment: datetime) -> str:
+    text = moment.isoformat(timespec="milliseconds")
+    if moment.utcoffset() == timedelta(0):
+        return text.removesuffix("+00:00") + "Z"
+    return text
+
+
+def split_date_range(start: str, end: str, window: Window) -> list[tuple[str, str]]:
+    """
+    Splits report date range into consecutive windows of given length.
+
+    Windows start at ``start`` and each one ends one millisecond before the next
+    one starts, last window ends at ``end``. Every window starts whole number of
+    steps after ``start``, so month windows keep its day of month where it exists
+    (Jan 31, Feb 28, Mar 31, ...). Bounds are ISO 8601 strings as used by Clockify
+    reports.
+    """
+    step = WINDOWS[window]
+    first, last = isoparse(start), isoparse(end)
+    windows = []
+    count = 0
+    window_start = first
+    while window_start <= last:
+        count += 1
+        next_start = first + step * count
+        window_end = next_start - relativedelta(microseconds=1000)
+        if window_end >= last:
+            windows.append((_format(window_start), end))
+            break
+        windows.append((_format(window_start), _format(window_end)))
+        window_start = next_start
+    if windows:
+        windows[0] = (start, windows[0][1])
+    return windows
+
+
+def _key(record: dict) -> Any:  # noqa: ANN401
+    for field in KEY_FIELDS:
+        if field in record:
+            return field, record[field]
+    return None
+
+
+def merge_records(records: Iterable[list[dict] | None]) -> list[dict]:
+    """
+    Merges lists of report records, such as totals or groups, of several windows.
+
+    Records with the same key field (``_id``, ``type`` or ``currency``) are merged
+    into one, summing its numbers and merging its nested record lists the same
+    way; other fields are taken from first record. Records without key field are
+    concatenated. Order of first appearance is kept.
+    """
+    merged: dict[Any, dict] = {}
+    unkeyed: list[dict] = []
+    for window_records in records:
+        for record in window_records or []:
+            key = _key(record)
+            if key is None:
+                unkeyed.append(record)
+            elif key in merged:
+                merged[key] = _merge_record(merged[key], record)
+            else:
+                merged[key] = dict(record)
+    return [*merged.values(), *unkeyed]
+
+
+def _merge_record(first: dict, second: dict) -> dict:
+    result = dict(first)
+    for field, value in second.items():
+        current = result.get(field)
+        if field not in result:
+            result[field] = value
+        elif _is_number(current) and _is_number(value):
+            result[field] = current + value
+        elif _is_records(current) and _is_records(value):
+            result[field] = merge_records([current, value])
+    return result
+
+
+def _is_number(value: Any) -> bool:  # noqa: ANN401
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _is_records(value: Any) -> bool:  # noqa: ANN401
+    return isinstance(value, list) and all(isinstance(v, dict) for v in value)
+
+
+def merge_summary_reports(reports: list[dict]) -> dict:
+    """
+    Merges summary reports of consecutive windows into one report.
+
+    Totals and groups are merged by their key fields, summing their durations,
+    amounts and counts. Groups keep order of their first appearance, they are not
+    sorted again by ``sortColumn`` of the report.
+    """
+    merged: dict = {}
+    for report in reports:
+        for field, value in report.items():
+            merged.setdefault(field, value)
+    for field, value in merged.items():
+        if _is_records(value):
+            merged[field] = merge_records(report.get(field) for report in reports)
+    return merged
+
+
+def sorted_descending(payload: dict) -> bool:
+    """
+    Returns whether detailed report payload sorts time entries newest first.
+
+    Raises ValueError unless entries are sorted by date, as only then entries of
+    consecutive windows can be concatenated without sorting them again.
+    """
+    detailed_filter = payload.get("detailedFilter") or {}
+    column = detailed_filter.get("sortColumn", DEFAULT_SORT_COLUMN)
+    if column != "DATE":
+        msg = f"Sharded detailed report must be sorted by DATE, not {column}"
+        raise ValueError(msg)
+    return payload.get("sortOrder", DEFAULT_SORT_ORDER) == "DESCENDING"
+
+
+def merge_detailed_reports(reports: list[dict], *, descending: bool = False) -> dict:
+    """
+    Merges detailed reports of consecutive windows into one report.
+
+    Time entries are concatenated in window order, or in reversed window order
+    when ``descending``, and totals are summed.
+    """
+    ordered = reports[::-1] if descending else reports
+    merged = dict(ordered[0]) if ordered else {}
+    merged["totals"] = merge_records(report.get("totals") for report in ordered)
+    merged["timeentries"] = [
+        entry for report in ordered for entry in report.get("timeentries") or []
+    ]
+    return merged
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from pydantic import BaseModel
+
+from clockify_client.api_objects.project import GetProjectResponse
+from clockify_client.api_objects.time_entry import TimeEntryResponse
+from clockify_client.api_objects.user import UserResponse
+from clockify_client.parsing import json_parser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+
+    from clockify_client.clockify import Clockify
+    from clockify_client.sync import ChangeSet
+
+
+@dataclass(frozen=True)
+class Table:
+    """
+    Mirrored resource, stored as JSON document with indexed columns taken from it.
+
+    Records of resources with ``model`` are validated by it when stored and
+    returned as its instances, others are kept and returned as dicts. ``columns``
+    map column names to dotted paths of values in record.
+    """
+
+    name: str
+    model: type[BaseModel] | None = None
+    columns: dict[str, str] = field(default_factory=dict)
+
+
+TABLES = {
+    table.name: table
+    for table in [
+        Table("workspaces"),
+        Table("clients", columns={"name": "name"}),
+        Table("projects", GetProjectResponse, {"name": "name"}),
+        Table("tasks", columns={"project_id": "projectId", "name": "name"}),
+        Table("tags", columns={"name": "name"}),
+        Table("users", UserResponse, {"email": "email"}),
+        Table(
+            "time_entries",
+            TimeEntryResponse,
+            {
+                "user_id": "userId",
+                "project_id": "projectId",
+                "start": "timeInterval.start",
+                "end": "timeInterval.end",
+            },
+        ),
+    ]
+}
+
+
+def _lookup(record: dict, path: str) -> Any:  # noqa: ANN401
+    value: Any = record
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+class LocalStore:
+    """
+    Local SQLite mirror of Clockify workspaces, queried without API round trips.
+
+    Every resource is kept in its own table of JSON documents keyed by id and
+    workspace, with indexed columns for common queries. Times are compared as
+    strings, which orders correctly for UTC times in ISO 8601 format used by
+    Clockify. Store can be shared by threads.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            for table in TABLES.values():
+                self._create(table)
+
+    def _create(self, table: Table) -> None:
+        columns = "".join(f", {column} TEXT" for column in table.columns)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table.name} ("
+            f"id TEXT NOT NULL, workspace_id TEXT NOT NULL{columns},"
+            " data TEXT NOT NULL, PRIMARY KEY (workspace_id, id))"
+        )
+        for column in table.columns:
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table.name}_{column}"
+                f" ON {table.name} (workspace_id, {column})"
+            )
+
+    def close(self) -> None:
+        """Closes database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        """Returns itself, connection is closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Closes database connection."""
+        self.close()
+
+    def upsert(
+        self, table: str, workspace_id: str, records: Iterable[dict | BaseModel]
+    ) -> int:
+        """Inserts or replaces records of workspace, returns number of records."""
+        return self._write(TABLES[table], workspace_id, records, replace_all=False)
+
+    def replace(
+        self, table: str, workspace_id: str, records: Iterable[dict | BaseModel]
+    ) -> int:
+        """Replaces all records of workspace, returns number of records."""
+        return self._write(TABLES[table], workspace_id, records, replace_all=True)
+
+    def _write(
+        self,
+        spec: Table,
+        workspace_id: str,
+        records: Iterable[dict | BaseModel],
+        *,
+        replace_all: bool,
+    ) -> int:
+        rows = []
+        for record in records:
+            if isinstance(record, BaseModel):
+                data = record.model_dump(mode="json", by_alias=True)
+            elif spec.model is not None:
+                data = spec.model.model_validate(record).model_dump(
+                    mode="json", by_alias=True
+                )
+            else:
+                data = record
+            columns = [_lookup(data, path) for path in spec.columns.values()]
+            rows.append((data["id"], workspace_id, *columns, json.dumps(data)))
+        names = ", ".join(["id", "workspace_id", *spec.columns, "data"])
+        marks = ", ".join("?" * (len(spec.columns) + 3))
+        with self._lock, self._connection:
+            if replace_all:
+                self._connection.execute(
+                    f"DELETE FROM {spec.name} WHERE workspace_id = ?", [workspace_id]
+                )
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {spec.name} ({names}) VALUES ({marks})",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, table: str, workspace_id: str, ids: Iterable[str]) -> None:
+        """Removes records of workspace with given ids."""
+        spec = TABLES[table]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"DELETE FROM {spec.name} WHERE workspace_id = ? AND id = ?",
+                [(workspace_id, record_id) for record_id in ids],
+            )
+
+    def get(self, table: str, workspace_id: str, record_id: str) -> Any:  # noqa: ANN401
+        """Returns record of workspace with given id, or None."""
+        found = self.query(table, workspace_id, id=record_id)
+        return found[0] if found else None
+
+    def query(
+        self,
+        table: str,
+        workspace_id: str,
+        order_by: str = "id",
+        **conditions: str,
+    ) -> list[Any]:
+        """
+        Returns records of workspace with columns equal to given values.
+
+        Records are model instances for tables with model, dicts otherwise.
+        """
+        return self._select(table, workspace_id, conditions, [], order_by)
+
+    def time_entries(
+        self,
+        workspace_id: str,
+        *,
+        user_id: str | None = None,
+        project_id: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[TimeEntryResponse]:
+        """
+        Returns time entries of workspace ordered by start, filtered by given values.
+
+        Entries started at ``start`` or later and before ``end`` are returned.
+        """
+        conditions = {
+            column: value
+            for column, value in [("user_id", user_id), ("project_id", project_id)]
+            if value is not None
+        }
+        ranges = []
+        if start is not None:
+            ranges.append(("start >= ?", start))
+        if end is not None:
+            ranges.append(("start < ?", end))
+        return self._select("time_entries", workspace_id, conditions, ranges, "start")
+
+    def _select(
+        self,
+        table: str,
+        workspace_id: str,
+        conditions: dict[str, str],
+        ranges: list[tuple[str, str]],
+        order_by: str,
+    ) -> list[Any]:
+        spec = TABLES[table]
+        allowed = {"id", *spec.columns}
+        if not {*conditions, order_by} <= allowed:
+            msg = f"Table {table} can be queried only by {', '.join(sorted(allowed))}"
+            raise ValueError(msg)
+        where = ["workspace_id = ?"]
+        where += [f"{column} = ?" for column in conditions]
+        where += [clause for clause, _ in ranges]
+        params = [workspace_id, *conditions.values(), *(v for _, v in ranges)]
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT data FROM {spec.name} WHERE {' AND '.join(where)}"
+                f" ORDER BY {order_by}",
+                params,
+            ).fetchall()
+        parse = json_parser(spec.model) if spec.model is not None else json.loads
+        return [parse(data) for (data,) in rows]
+
+    def apply(self, workspace_id: str, changes: ChangeSet) -> None:
+        """Applies time entry changes found by incremental sync."""
+        self.upsert("time_entries", workspace_id, [*changes.added, *changes.updated])
+        self.delete("time_entries", workspace_id, changes.deleted)
+
+    def mirror(self, clockify: Clockify, workspace_id: str) -> None:
+        """
+        Fetches all resources of workspace from Clockify, replacing stored ones.
+
+        Raises error of first user whose time entries could not be fetched.
+        """
+        workspaces = cast(list[dict], clockify.workspaces.get_workspaces() or [])
+        self.replace(
+            "workspaces",
+            workspace_id,
+            [w for w in workspaces if w.get("id") == workspace_id],
+        )
+        self.replace(
+            "clients", workspace_id, clockify.clients.iter_clients(workspace_id)
+        )
+        projects = list(clockify.projects.iter_projects(workspace_id))
+        self.replace("projects", workspace_id, projects)
+        self.replace(
+            "tasks",
+            workspace_id,
+            [
+                task
+                for project in projects
+                for task in clockify.tasks.iter_tasks(workspace_id, project.id)
+            ],
+        )
+        self.replace("tags", workspace_id, clockify.tags.iter_tags(workspace_id))
+        users = list(clockify.users.iter_users(workspace_id))
+        self.replace("users", workspace_id, users)
+
+        entries = []
+        for result in clockify.time_entries.get_workspace_time_entries(
+            workspace_id, user_ids=[user.id for user in users]
+        ):
+            if result.error is not None:
+                raise result.error
+            entries += result.entries
+        self.replace("time_entries", workspace_id, entries)
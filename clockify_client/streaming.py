@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    """Buffers text decoded from byte chunks, reading more only when needed."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Appends next chunk to buffer, returns False once stream is exhausted."""
+        while not self.exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                # consumed text is dropped, so buffer holds at most one value
+                self.buffer = self.buffer[self.pos :] + text
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Returns next non-whitespace character, or empty string at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consumes next character, which must be one of given ones."""
+        char = self.peek()
+        if not char or char not in chars:
+            msg = f"Expected one of {chars!r}"
+            raise json.JSONDecodeError(msg, self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:  # noqa: ANN401
+        """Consumes and returns next JSON value, reading as many chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # number at the very end of buffer may continue in next chunk
+            if end < len(self.buffer) or not self.fill():
+                self.pos = end
+                return value
+
+
+class ItemStream:
+    """
+    Lazily parses JSON object from byte chunks, yielding items of one of its arrays.
+
+    Items of array stored under ``key`` are yielded one by one as soon as they are
+    parsed, so only one of them is held in memory at a time. Other members of the
+    object are collected into ``members`` as they are passed, so members following
+    the array are only available once iteration is finished.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str) -> None:
+        self.chunks = chunks
+        self.key = key
+        self.members: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yields items of the array while parsing rest of the object."""
+        reader = _Reader(self.chunks)
+        try:
+            if not reader.peek():
+                return  # empty body
+            reader.expect("{")
+            if reader.peek() == "}":
+                return
+            while True:
+                name = reader.value()
+                reader.expect(":")
+                if name == self.key and reader.peek() == "[":
+                    yield from self._items(reader)
+                else:
+                    self.members[name] = reader.value()
+                if reader.expect(",}") == "}":
+                    return
+        finally:
+            close = getattr(self.chunks, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _items(reader: _Reader) -> Iterator[Any]:
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+            return
+        while True:
+            yield reader.value()
+            if reader.expect(",]") == "]":
+                return
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import requests
+from dateutil.parser import isoparse
+
+from clockify_client.types import API_DATETIME_FORMAT
+
+if TYPE_CHECKING:
+    from clockify_client.api_objects.time_entry import TimeEntryResponse
+    from clockify_client.models.time_entry import TimeEntry
+
+
+class JsonFileStore:
+    """
+    Sync state persisted as one JSON file, keyed by workspace and user.
+
+    File is rewritten atomically on every save, so it is never left half written.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Returns state stored under key, if any."""
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Stores state under key."""
+        with self._lock:
+            states = self._read()
+            states[key] = state
+            tmp = self.path.with_name(f"{self.path.name}.tmp")
+            tmp.write_text(json.dumps(states), encoding="utf-8")
+            tmp.replace(self.path)
+
+    def _read(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+
+@dataclass
+class ChangeSet:
+    """Time entries added, updated and deleted since previous sync."""
+
+    added: list[TimeEntryResponse] = field(default_factory=list)
+    updated: list[TimeEntryResponse] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Tells whether there are any changes."""
+        return bool(self.added or self.updated or self.deleted)
+
+
+def fingerprint(entry: TimeEntryResponse) -> str:
+    """Returns short hash of entry content, changing whenever entry is edited."""
+    return hashlib.sha256(entry.model_dump_json().encode()).hexdigest()[:16]
+
+
+class TimeEntrySync:
+    """
+    Incremental sync of user time entries, producing change sets.
+
+    Clockify cannot filter time entries by modification time, so every sync
+    fetches entries started within ``lookback`` before the previous sync (full
+    history on the first one) and compares them with fingerprints remembered from
+    previous sync. Edits and deletions of entries started earlier than that are
+    not detected, so ``lookback`` should cover how far back users edit their
+    timesheets. Known entry missing from fetched ones is looked up by its id
+    before it is reported as deleted, as its start may have been moved before
+    the fetched window; such entry is reported as updated instead.
+
+    Watermark (time of previous sync) and fingerprints are persisted per
+    workspace and user in ``store``.
+    """
+
+    def __init__(
+        self,
+        time_entries: TimeEntry,
+        store: JsonFileStore,
+        lookback: timedelta = timedelta(days=30),
+    ) -> None:
+        self.time_entries = time_entries
+        self.store = store
+        self.lookback = lookback
+
+    def sync(
+        self, workspace_id: str, user_id: str, now: datetime | None = None
+    ) -> ChangeSet:
+        """
+        Returns changes of user time entries since previous sync.
+
+        ``now`` must be timezone aware, it defaults to current time.
+        """
+        if now is None:
+            now = datetime.now(UTC)
+        elif now.tzinfo is None:
+            msg = "now must be timezone aware datetime"
+            raise ValueError(msg)
+        now = now.astimezone(UTC)
+        key = f"{workspace_id}/{user_id}"
+        state = self.store.load(key) or {}
+        known: dict[str, list[str]] = state.get("entries", {})
+
+        params = {}
+        window_start = None
+        if state.get("watermark"):
+            watermark = isoparse(state["watermark"]).astimezone(UTC)
+            window_start = watermark - self.lookback
+            params["start"] = window_start.strftime(API_DATETIME_FORMAT)
+
+        changes = ChangeSet()
+        seen: dict[str, list[str]] = {}
+        for entry in self.time_entries.iter_time_entries(workspace_id, user_id, params):
+            seen[entry.id] = [entry.time_interval.start, fingerprint(entry)]
+            if entry.id not in known:
+                changes.added.append(entry)
+            elif known[entry.id][1] != seen[entry.id][1]:
+                changes.updated.append(entry)
+        for entry_id, (start, _) in known.items():
+            if entry_id in seen or (
+                window_start is not None and isoparse(start) < window_start
+            ):
+                continue
+            moved = self._get_entry(workspace_id, entry_id)
+            if moved is None:
+                changes.deleted.append(entry_id)
+            else:
+                seen[entry_id] = [moved.time_interval.start, fingerprint(moved)]
+                changes.updated.append(moved)
+
+        # only entries next sync fetches again need to be remembered
+        next_window_start = now - self.lookback
+        deleted = set(changes.deleted)
+        entries = {
+            entry_id: known_entry
+            for entry_id, known_entry in known.items()
+            if entry_id not in seen
+            and entry_id not in deleted
+            and isoparse(known_entry[0]) >= next_window_start
+        }
+        entries.update(
+            (entry_id, seen_entry)
+            for entry_id, seen_entry in seen.items()
+            if isoparse(seen_entry[0]) >= next_window_start
+        )
+        self.store.save(key, {"watermark": now.isoformat(), "entries": entries})
+        return changes
+
+    def _get_entry(self, workspace_id: str, entry_id: str) -> TimeEntryResponse | None:
+        """Returns time entry by its id, None when it does not exist anymore."""
+        try:
+            return self.time_entries.get_time_entry(workspace_id, entry_id)
+        except requests.HTTPError as exc:
+            response = exc.response
+            if response is not None and response.status_code == HTTPStatus.NOT_FOUND:
+                return None
+            raise
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from clockify_client.cache import CacheLookup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from clockify_client.cache import ResponseCache
+    from clockify_client.rate_limit import RateLimiter
+    from clockify_client.retry import RetryPolicy
+
+T = TypeVar("T")
+
+
+class Transport:
+    """
+    Connection pooled HTTP transport shared by Clockify services.
+
+    Every base url gets its own adapter, so the ``global.`` and ``reports.`` hosts
+    keep separate keep-alive pools of up to ``pool_maxsize`` connections each.
+    Optional ``rate_limiter`` is consulted before every request sent, including
+    repeated attempts made according to optional ``retry`` policy. GET responses
+    are served from optional ``cache`` while fresh, or while they are refreshed
+    in background thread if cache serves stale entries.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.session = requests.Session()
+        self._mounted: set[str] = set()
+
+    def mount(self, base_url: str) -> None:
+        """Gives base url its own connection pool, if it does not have one yet."""
+        if base_url in self._mounted:
+            return
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        self.session.mount(f"{base_url}/", adapter)
+        self._mounted.add(base_url)
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        idempotent: bool | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Sends request over pooled session, retrying it if policy allows.
+
+        Body is sent as ready ``content`` bytes. ``idempotent`` overrides whether
+        request is safe to repeat, which is otherwise derived from its method. With
+        ``stream`` on, response body is not read until it is iterated.
+        """
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, data=content, stream=stream
+                )
+            except requests.RequestException as exc:
+                # failure to connect means server never saw the request
+                processed = not isinstance(exc, requests.ConnectTimeout)
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, idempotent=idempotent, maybe_processed=processed
+                ):
+                    raise
+                delay = self.retry.backoff(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response.status_code, idempotent=idempotent
+                ):
+                    return response
+                delay = self.retry.backoff(attempt, response.headers.get("Retry-After"))
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        parse: Callable[[bytes], T],
+        idempotent: bool | None = None,
+    ) -> T | None:
+        """
+        Sends request and returns its parsed body, or None when there is no body.
+
+        Raises ``requests.HTTPError`` for error responses. GET responses are taken
+        from and stored into cache, if transport has one, other methods evict
+        cached responses they make stale. Stale responses with validators are
+        revalidated with conditional request and reused when server answers 304.
+        ``idempotent`` overrides whether request is safe to repeat on failure.
+        """
+        lookup = CacheLookup()
+        if self.cache is not None:
+            lookup = self.cache.lookup(method, url, headers.get("X-Api-Key", ""))
+        if lookup.refresh:
+            threading.Thread(
+                target=self._refresh, args=(lookup, url, headers, parse), daemon=True
+            ).start()
+        if lookup.serve and lookup.entry is not None:
+            return lookup.entry.parse(parse)
+        return self._fetch(
+            method,
+            url,
+            headers=headers,
+            content=content,
+            parse=parse,
+            idempotent=idempotent,
+            lookup=lookup,
+        )
+
+    def _refresh(
+        self,
+        lookup: CacheLookup,
+        url: str,
+        headers: dict[str, str],
+        parse: Callable[[bytes], object],
+    ) -> None:
+        try:
+            self._fetch("GET", url, headers=headers, parse=parse, lookup=lookup)
+        except requests.RequestException:
+            pass  # entry stays stale, so next request for it tries again
+        finally:
+            if self.cache is not None and lookup.key is not None:
+                self.cache.release_refresh(lookup.key)
+
+    def _fetch(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        parse: Callable[[bytes], T],
+        idempotent: bool | None = None,
+        lookup: CacheLookup,
+    ) -> T | None:
+        response = self.request(
+            method,
+            url,
+            headers=lookup.headers(headers),
+            content=content,
+            idempotent=idempotent,
+        )
+        if self.cache is not None:
+            entry = self.cache.settle(lookup, method, url, response.status_code)
+            if entry is not None:
+                return entry.parse(parse)
+        response.raise_for_status()
+        if response.status_code not in [200, 201, 202]:
+            return None
+        if self.cache is not None:
+            entry = self.cache.store(lookup, url, response.content, response.headers)
+            if entry is not None:
+                return entry.parse(parse)
+        return parse(response.content)
+
+    def stream(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        chunk_size: int = 65536,
+        idempotent: bool | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Sends request and lazily yields chunks of its body as they arrive.
+
+        Raises ``requests.HTTPError`` for error responses. Responses are never
+        cached, connection is released once body is read or iteration is closed.
+        """
+        response = self.request(
+            method,
+            url,
+            headers=headers,
+            content=content,
+            idempotent=idempotent,
+            stream=True,
+        )
+        try:
+            response.raise_for_status()
+            if response.status_code in [200, 201, 202]:
+                yield from response.iter_content(chunk_size)
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.session.close()
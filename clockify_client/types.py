@@ -2,4 +2,10 @@ from __future__ import annotations
 
 from typing import Any, TypeAlias
 
+from pydantic import BaseModel
+
 JsonType: TypeAlias = None | int | str | bool | list | dict[str, Any]
+Payload: TypeAlias = JsonType | BaseModel
+
+# Clockify expects query datetimes in this exact form, always in UTC
+API_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
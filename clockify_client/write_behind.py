@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+import requests
+
+from clockify_client.api_objects.time_entry import AddTimeEntryPayload
+from clockify_client.bulk import run_bulk
+from clockify_client.exceptions import RateLimitExceededError
+from clockify_client.idempotency import (
+    IdempotencyJournal,
+    IdempotentTimeEntries,
+    idempotency_key,
+)
+from clockify_client.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+
+    from clockify_client.api_objects.time_entry import AddTimeEntryResponse
+    from clockify_client.models.time_entry import TimeEntry
+
+QUEUED = "queued"
+SENDING = "sending"
+FAILED = "failed"
+
+# Outages may last minutes, so creations are retried for a while before giving up.
+DEFAULT_RETRY = RetryPolicy(max_attempts=10, backoff_factor=1.0, max_backoff=300.0)
+
+# errors after which creation is attempted again, others fail it right away
+RETRIED_ERRORS = (requests.RequestException, RateLimitExceededError)
+
+
+@dataclass(frozen=True)
+class QueuedEntry:
+    """Time entry creation stored in queue, with error of its last attempt."""
+
+    id: int
+    workspace_id: str
+    user_id: str
+    payload: AddTimeEntryPayload
+    attempts: int = 0
+    error: str | None = None
+
+
+class TimeEntryQueue:
+    """
+    Write-behind queue of time entry creations, persisted in SQLite database.
+
+    ``put`` stores creation and returns at once, background thread started by
+    ``start`` sends stored creations in batches of up to ``batch_size``, with up to
+    ``max_workers`` requests at a time. Creations failing with connection error,
+    status listed by ``retry`` policy or refusal of rate limiter are attempted again
+    after its backoff, until the policy gives up; these, creations rejected by
+    server and creations failing with any other error are kept as failed.
+
+    Creations not sent yet survive restarts of the process. Creation interrupted
+    by restart is sent again, with idempotency journal stored in the same database
+    making sure it is not created twice.
+    """
+
+    def __init__(
+        self,
+        time_entries: TimeEntry,
+        path: str | Path,
+        *,
+        batch_size: int = 50,
+        max_workers: int = 4,
+        retry: RetryPolicy = DEFAULT_RETRY,
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.retry = retry
+        self.journal = IdempotencyJournal(path)
+        self._writer = IdempotentTimeEntries(
+            time_entries, self.journal, RetryPolicy(max_attempts=1)
+        )
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._settled = threading.Condition()
+        self._thread: threading.Thread | None = None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, workspace_id TEXT NOT NULL,"
+                " user_id TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL, next_attempt REAL NOT NULL, error TEXT)"
+            )
+            # creations interrupted by restart are sent again
+            self._connection.execute(
+                "UPDATE queue SET status = ? WHERE status = ?", [QUEUED, SENDING]
+            )
+
+    def __enter__(self) -> Self:
+        """Starts sending queued creations."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stops sending, creations not sent yet stay in queue."""
+        self.close()
+
+    def start(self) -> None:
+        """Starts background thread sending queued creations."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Waits for batch being sent and stops, closing database connections."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._connection.close()
+        self.journal.close()
+
+    def put(self, workspace_id: str, user_id: str, payload: AddTimeEntryPayload) -> int:
+        """Stores time entry creation to be sent in background, returns its id."""
+        # fields left unset stay unset, so body sent is the same as of direct call
+        body = payload.model_dump_json(exclude_unset=True, by_alias=True)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO queue (workspace_id, user_id, payload, status, attempts,"
+                " next_attempt) VALUES (?, ?, ?, ?, 0, 0)",
+                [workspace_id, user_id, body, QUEUED],
+            )
+        self._wakeup.set()
+        return cast(int, cursor.lastrowid)
+
+    def pending(self) -> int:
+        """Returns number of creations waiting to be sent or being sent."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM queue WHERE status != ?", [FAILED]
+            ).fetchone()
+        return count
+
+    def failed(self) -> list[QueuedEntry]:
+        """Returns creations which were given up on, with their last errors."""
+        return self._select("status = ?", [FAILED])
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all pending creations are sent or given up on.
+
+        Returns False when ``timeout`` seconds passed first. Raises RuntimeError
+        when creations are pending but queue is not started, as nothing would
+        ever send them.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._settled:
+            while self.pending():
+                if self._thread is None or not self._thread.is_alive():
+                    msg = "Queue is not started, call start() before flush()"
+                    raise RuntimeError(msg)
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._settled.wait(remaining)
+        return True
+
+    def _select(self, where: str, params: list, limit: int = -1) -> list[QueuedEntry]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, workspace_id, user_id, payload, attempts, error FROM queue"
+                f" WHERE {where} ORDER BY id LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [
+            QueuedEntry(
+                entry_id,
+                workspace_id,
+                user_id,
+                AddTimeEntryPayload.model_validate_json(payload),
+                attempts,
+                error,
+            )
+            for entry_id, workspace_id, user_id, payload, attempts, error in rows
+        ]
+
+    def _drain(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._claim()
+            if not batch:
+                self._wakeup.wait(self._idle_time())
+                self._wakeup.clear()
+                continue
+            # any error is settled with its entry, so it can not stop the thread
+            results = run_bulk(self._send, batch, self.max_workers, (Exception,))
+            for entry, result in zip(batch, results, strict=True):
+                self._settle(entry, result.error)
+            with self._settled:
+                self._settled.notify_all()
+
+    def _claim(self) -> list[QueuedEntry]:
+        batch = self._select(
+            "status = ? AND next_attempt <= ?", [QUEUED, time.time()], self.batch_size
+        )
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE queue SET status = ? WHERE id = ?",
+                [(SENDING, entry.id) for entry in batch],
+            )
+        return batch
+
+    def _idle_time(self) -> float | None:
+        with self._lock:
+            (next_attempt,) = self._connection.execute(
+                "SELECT MIN(next_attempt) FROM queue WHERE status = ?", [QUEUED]
+            ).fetchone()
+        return None if next_attempt is None else max(0.0, next_attempt - time.time())
+
+    def _send(self, entry: QueuedEntry) -> AddTimeEntryResponse | None:
+        return self._writer.add_time_entry(
+            entry.workspace_id, entry.user_id, entry.payload
+        )
+
+    def _settle(self, entry: QueuedEntry, error: Exception | None) -> None:
+        if error is None:
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM queue WHERE id = ?", [entry.id])
+            # journal is only needed while creation may be sent again
+            self.journal.forget(
+                idempotency_key(entry.workspace_id, entry.user_id, entry.payload)
+            )
+            return
+
+        attempts = entry.attempts + 1
+        response = getattr(error, "response", None)
+        status = response.status_code if response is not None else None
+        retry = isinstance(error, RETRIED_ERRORS) and (
+            self.retry.should_retry("POST", attempts, status, idempotent=True)
+        )
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        next_attempt = time.time() + self.retry.backoff(attempts, retry_after)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE queue SET status = ?, attempts = ?, next_attempt = ?,"
+                " error = ? WHERE id = ?",
+                [
+                    QUEUED if retry else FAILED,
+                    attempts,
+                    next_attempt,
+                    repr(error),
+                    entry.id,
+                ],
+            )
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from _pytest.config import Config
     from _pytest.config.argparsing import Parser
@@ -26,3 +26,40 @@ def pytest_collection_modifyitems(config: Config, items: Sequence[Item]) -> None
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def make_time_entry() -> Callable[..., dict]:
+    """
+    Returns factory of time entry response bodies as sent by Clockify.
+
+    Entry lasts from ``start`` to ``end``, other fields are overridden by their
+    API names, e.g. ``userId="u1"``.
+    """
+
+    def make(
+        entry_id: str,
+        *,
+        start: str = "2020-01-01T09:00:00.000Z",
+        end: str = "2020-01-01T09:15:00.000Z",
+        duration: str = "PT15M",
+        **fields: Any,  # noqa: ANN401
+    ) -> dict:
+        return {
+            "billable": False,
+            "costRate": None,
+            "customFieldValues": [],
+            "description": "",
+            "id": entry_id,
+            "isLocked": False,
+            "kioskId": None,
+            "projectId": "p",
+            "taskId": None,
+            "timeInterval": {"duration": duration, "end": end, "start": start},
+            "type": "REGULAR",
+            "userId": "007",
+            "workspaceId": "123",
+            **fields,
+        }
+
+    return make
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from clockify_client.aio import AsyncClockify
+from clockify_client.aio.abstract_clockify import AsyncAbstractClockify
+from clockify_client.aio.models.project import AsyncProject
+from clockify_client.aio.models.report import AsyncReport
+from clockify_client.aio.models.tag import AsyncTag
+from clockify_client.aio.models.time_entry import AsyncTimeEntry
+from clockify_client.aio.transport import AsyncTransport
+from clockify_client.api_objects.project import GetProjectResponse
+from clockify_client.api_objects.time_entry import TimeEntryResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PATH = "/bar/"
+URL = f"https://global.baz.co{PATH}"
+RESP_JSON = {"stuff": "things"}
+
+TIME_ENTRY = {
+    "billable": True,
+    "costRate": {"amount": 10500, "currency": "USD"},
+    "customFieldValues": [],
+    "description": "This is a sample time entry description.",
+    "hourlyRate": {"amount": 10500, "currency": "USD"},
+    "id": "64c777ddd3fcab07cfbb210c",
+    "isLocked": False,
+    "kioskId": None,
+    "projectId": "25b687e29ae1f428e7ebe123",
+    "tagIds": [],
+    "taskId": None,
+    "timeInterval": {
+        "duration": "PT30M",
+        "end": "2021-01-01T00:00:00Z",
+        "start": "2020-01-01T00:00:00Z",
+    },
+    "type": "REGULAR",
+    "userId": "007",
+    "workspaceId": "123",
+}
+
+
+def mock_transport(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> AsyncTransport:
+    return AsyncTransport(http_transport=httpx.MockTransport(handler))
+
+
+def test_can_be_instantiated() -> None:
+    async def run() -> None:
+        async with AsyncClockify("apikey", "baz.co/") as clockify:
+            assert clockify.reports.base_url == "https://reports.baz.co"
+            assert clockify.tags.transport is clockify.transport
+            assert set(clockify.transport.clients) == {
+                "https://global.baz.co",
+                "https://reports.baz.co",
+            }
+
+    asyncio.run(run())
+
+
+def test_unmounted_url() -> None:
+    async def run() -> None:
+        transport = AsyncTransport()
+        with pytest.raises(ValueError, match="No connection pool"):
+            await transport.request("GET", URL, headers={})
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "delete"])
+@pytest.mark.parametrize("status_code", [400, 401, 404, 500])
+def test_request_error(method: str, status_code: int) -> None:
+    async def run() -> None:
+        transport = mock_transport(lambda _: httpx.Response(status_code))
+        ac = AsyncAbstractClockify("apikey", "baz.co", transport)
+        args = (PATH, {"foo": "bar"}) if method in {"post", "put"} else (PATH,)
+        with pytest.raises(httpx.HTTPStatusError):
+            await getattr(ac, method)(*args)
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "delete"])
+@pytest.mark.parametrize(
+    ("status_code", "expected"), [(200, RESP_JSON), (201, RESP_JSON), (204, None)]
+)
+def test_request_json(method: str, status_code: int, expected: dict | None) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if status_code == 204:
+            return httpx.Response(status_code)
+        return httpx.Response(status_code, json=RESP_JSON)
+
+    async def run() -> None:
+        ac = AsyncAbstractClockify("apikey", "baz.co", mock_transport(handler))
+        args = (PATH, {"foo": "bar"}) if method == "post" else (PATH,)
+        rt = await getattr(ac, method)(*args)
+        assert rt == expected
+
+    asyncio.run(run())
+    assert len(requests) == 1
+    assert requests[0].method == method.upper()
+    assert str(requests[0].url) == URL
+    assert requests[0].headers["X-Api-Key"] == "apikey"
+
+
+def test_get_time_entries() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/workspaces/123/user/007/time-entries"
+        assert request.url.params["start"] == "2020-01-01T00:00:00Z"
+        return httpx.Response(200, json=[TIME_ENTRY])
+
+    async def run() -> list[TimeEntryResponse] | None:
+        time_entry = AsyncTimeEntry("apikey", "baz.co", mock_transport(handler))
+        return await time_entry.get_time_entries(
+            "123", "007", {"start": "2020-01-01T00:00:00Z"}
+        )
+
+    rt = asyncio.run(run())
+    assert rt == [TimeEntryResponse.model_validate(TIME_ENTRY)]
+
+
+def test_get_projects() -> None:
+    project = {
+        "color": "#000000",
+        "duration": "PT0S",
+        "id": "1",
+        "memberships": [],
+        "name": "foo",
+        "note": "",
+        "public": True,
+        "workspaceId": "123",
+    }
+
+    async def run() -> list[GetProjectResponse] | None:
+        transport = mock_transport(lambda _: httpx.Response(200, json=[project]))
+        return await AsyncProject("apikey", "baz.co", transport).get_projects("123")
+
+    assert asyncio.run(run()) == [GetProjectResponse.model_validate(project)]
+
+
+def test_get_tags_and_reports_share_transport() -> None:
+    urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(str(request.url))
+        if request.method == "POST":
+            assert json.loads(request.content) == {"dateRangeStart": "x"}
+        return httpx.Response(200, json=RESP_JSON)
+
+    async def run() -> None:
+        transport = mock_transport(handler)
+        tag = AsyncTag("apikey", "baz.co", transport)
+        report = AsyncReport("apikey", "baz.co", transport)
+        results = await asyncio.gather(
+            tag.get_tags("456", {"name": "Sprint1"}),
+            report.get_summary_report("456", {"dateRangeStart": "x"}),
+        )
+        assert results == [RESP_JSON, RESP_JSON]
+        await transport.aclose()
+
+    asyncio.run(run())
+    assert sorted(urls) == [
+        "https://global.baz.co/workspaces/456/tags?name=Sprint1",
+        "https://reports.baz.co/workspaces/456/reports/summary/",
+    ]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+
+from clockify_client.bulk import run_bulk
+
+
+def test_run_bulk_keeps_order_and_reports_errors() -> None:
+    def operation(item: int) -> int:
+        time.sleep(0.001 * (5 - item))  # later items finish first
+        if item == 2:
+            raise RequestsConnectionError(item)
+        return item * 10
+
+    results = run_bulk(operation, range(5), max_workers=3)
+    assert [r.value for r in results] == [0, 10, None, 30, 40]
+    assert [r.ok for r in results] == [True, True, False, True, True]
+    assert isinstance(results[2].error, RequestsConnectionError)
+
+
+def test_run_bulk_bounds_concurrency() -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def operation(item: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        return item
+
+    results = run_bulk(operation, iter(range(10)), max_workers=2)
+    assert [r.value for r in results] == list(range(10))
+    assert peak == 2
+
+
+def test_run_bulk_raises_unexpected_errors() -> None:
+    def operation(item: int) -> int:
+        raise KeyError(item)
+
+    with pytest.raises(KeyError):
+        run_bulk(operation, [1], max_workers=2)
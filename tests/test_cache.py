@@ -0,0 +1,547 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import responses
+from requests import HTTPError
+
+from clockify_client import Clockify
+from clockify_client.aio.transport import AsyncTransport
+from clockify_client.cache import CacheLookup, ResponseCache, SqliteBackend
+from clockify_client.transport import Transport
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+    from requests import PreparedRequest
+
+PROJECTS_URL = "https://global.baz.co/workspaces/1/projects/"
+
+
+def test_make_key() -> None:
+    key1 = ResponseCache.make_key("get", "https://x.co/a?b=1&a=2", "apikey")
+    key2 = ResponseCache.make_key("GET", "https://x.co/a?a=2&b=1", "apikey")
+    key3 = ResponseCache.make_key("GET", "https://x.co/a?a=2&b=1", "other")
+    assert key1 == key2
+    assert key1 != key3
+    assert "apikey" not in key1
+
+
+def test_ttl_for() -> None:
+    cache = ResponseCache(default_ttl=5, ttls={"*/projects": 60, "*/tags": 0})
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/projects/") == 60
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/projects?page=2") == 60
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/tags") == 0
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/clients") == 5
+
+
+def test_default_ttls_cover_reference_data() -> None:
+    cache = ResponseCache()
+    for path in [
+        "/v1/user/",
+        "/v1/workspaces/",
+        "/v1/workspaces/1/clients",
+        "/v1/workspaces/1/projects",
+        "/v1/workspaces/1/projects/2/tasks/",
+        "/v1/workspaces/1/projects/2/tasks/3",
+        "/v1/workspaces/1/tags",
+        "/v1/workspaces/1/users",
+    ]:
+        assert cache.ttl_for(f"https://x.co{path}") > 0, path
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/user/2/time-entries") == 0
+    assert cache.ttl_for("https://x.co/v1/workspaces/1/time-entries/3") == 0
+
+
+def test_expiry(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("clockify_client.cache.time.monotonic", return_value=0)
+    cache = ResponseCache(ttls={"*": 10})
+    cache.set("key", "https://x.co/a", b"[]")
+    assert cache.get("key") is not None
+
+    monotonic.return_value = 10
+    assert cache.get("key") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_lru_eviction() -> None:
+    cache = ResponseCache(maxsize=2, ttls={"*": 10})
+    cache.set("a", "https://x.co/a", b"1")
+    cache.set("b", "https://x.co/b", b"2")
+    cache.get("a")
+    cache.set("c", "https://x.co/c", b"3")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_zero_ttl_not_stored() -> None:
+    cache = ResponseCache(ttls={})
+    cache.set("a", "https://x.co/a", b"1")
+    assert len(cache) == 0
+
+
+def test_lookup_settle_store(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("clockify_client.cache.time.monotonic", return_value=0)
+    cache = ResponseCache(ttls={"*": 10}, stale_while_revalidate=60)
+    url = PROJECTS_URL
+    assert cache.lookup("POST", url, "apikey") == CacheLookup()
+
+    lookup = cache.lookup("GET", url, "apikey")
+    assert lookup.key is not None
+    assert (lookup.entry, lookup.serve) == (None, False)
+    assert lookup.headers({"X-Api-Key": "apikey"}) == {"X-Api-Key": "apikey"}
+    assert cache.settle(lookup, "GET", url, 200) is None
+    assert cache.store(lookup, url, b"1", {"ETag": '"v1"'}) is not None
+    assert cache.store(CacheLookup(), url, b"1", {}) is None
+
+    assert cache.lookup("GET", url, "apikey").serve
+    monotonic.return_value = 20
+    stale = cache.lookup("GET", url, "apikey")
+    assert (stale.serve, stale.refresh) == (True, True)
+    # refresh of the entry is already claimed
+    assert not cache.lookup("GET", url, "apikey").refresh
+    assert stale.headers({}) == {"If-None-Match": '"v1"'}
+    assert cache.settle(stale, "GET", url, 304) is stale.entry
+    assert cache.stats.revalidations == 1
+
+    assert cache.settle(CacheLookup(), "PUT", url, 500) is None
+    assert len(cache) == 0
+
+
+################################################################################
+@responses.activate
+def test_clockify_serves_reference_data_from_cache() -> None:
+    rsp = responses.get(PROJECTS_URL, json=[])
+    rsp_entries = responses.get(
+        "https://global.baz.co/workspaces/1/user/2/time-entries/", json=[]
+    )
+    cache = ResponseCache()
+    clockify = Clockify("apikey", "baz.co", cache=cache)
+
+    assert clockify.projects.get_projects("1") == []
+    assert clockify.projects.get_projects("1") == []
+    assert rsp.call_count == 1
+
+    clockify.time_entries.get_time_entries("1", "2")
+    clockify.time_entries.get_time_entries("1", "2")
+    assert rsp_entries.call_count == 2
+    assert cache.stats.hits == 1
+
+    other = Clockify("otherkey", "baz.co", cache=cache)
+    other.projects.get_projects("1")
+    assert rsp.call_count == 2
+
+
+@responses.activate
+def test_errors_and_writes_not_cached() -> None:
+    responses.get(PROJECTS_URL, status=500)
+    responses.post(PROJECTS_URL, json={})
+    cache = ResponseCache()
+    clockify = Clockify("apikey", "baz.co", cache=cache)
+
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            clockify.projects.get("/workspaces/1/projects/")
+        clockify.projects.post("/workspaces/1/projects/", {})
+    assert len(responses.calls) == 4
+    assert len(cache) == 0
+
+
+def test_async_transport_cache() -> None:
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, content=b'["foo"]')
+
+    async def run() -> None:
+        transport = AsyncTransport(
+            http_transport=httpx.MockTransport(handler), cache=ResponseCache()
+        )
+        transport.mount("https://global.baz.co")
+        for _ in range(3):
+            rt = await transport.send(
+                "GET", PROJECTS_URL, headers={}, parse=lambda b: b
+            )
+            assert rt == b'["foo"]'
+
+    asyncio.run(run())
+    assert len(calls) == 1
+
+
+################################################################################
+def _fill(cache: ResponseCache, *paths: str) -> None:
+    for path in paths:
+        url = f"https://global.baz.co/v1{path}"
+        cache.set(ResponseCache.make_key("GET", url, "apikey"), url, b"[]")
+
+
+def _cached_paths(cache: ResponseCache) -> set[str]:
+    return {key.split("/v1", 1)[1].rstrip("?") for key in cache._backend}
+
+
+def test_invalidate_pattern() -> None:
+    cache = ResponseCache(ttls={"*": 60})
+    _fill(
+        cache, "/workspaces/1/tags/", "/workspaces/1/tags?page=2", "/workspaces/2/tags"
+    )
+
+    assert cache.invalidate("global.baz.co/v1/workspaces/1/tags") == 2
+    assert _cached_paths(cache) == {"/workspaces/2/tags"}
+
+
+@pytest.mark.parametrize(
+    ("write", "dropped"),
+    [
+        ("/workspaces/1/clients/", {"/workspaces/1/clients/"}),
+        ("/workspaces/1/projects/", {"/workspaces/1/projects?page=1"}),
+        ("/workspaces/1/projects/5/tasks/", {"/workspaces/1/projects/5/tasks/"}),
+        (
+            "/workspaces/1/projects/5/tasks/7",
+            {"/workspaces/1/projects/5/tasks/", "/workspaces/1/projects/5/tasks/7"},
+        ),
+        ("/workspaces/1/users/", {"/workspaces/1/users/"}),
+        (
+            "/workspaces/1/users/3",
+            {"/workspaces/1/users/", "/workspaces/1/projects?page=1", "/user/"},
+        ),
+        (
+            "/workspaces/1/user/3/time-entries/",
+            {"/workspaces/1/user/3/time-entries/"},
+        ),
+        (
+            "/workspaces/1/time-entries/9",
+            {
+                "/workspaces/1/user/3/time-entries/",
+                "/workspaces/1/user/4/time-entries/",
+                "/workspaces/1/time-entries/9",
+            },
+        ),
+    ],
+)
+def test_invalidate_for_write(write: str, dropped: set[str]) -> None:
+    cache = ResponseCache(ttls={"*": 60})
+    _fill(
+        cache,
+        "/user/",
+        "/workspaces/",
+        "/workspaces/1/clients/",
+        "/workspaces/1/projects?page=1",
+        "/workspaces/1/projects/5/tasks/",
+        "/workspaces/1/projects/5/tasks/7",
+        "/workspaces/1/projects/6/tasks/",
+        "/workspaces/1/users/",
+        "/workspaces/1/user/3/time-entries/",
+        "/workspaces/1/user/4/time-entries/",
+        "/workspaces/1/time-entries/9",
+        "/workspaces/2/projects?page=1",
+        "/workspaces/2/users/",
+    )
+    before = _cached_paths(cache)
+
+    assert cache.invalidate_for(f"https://global.baz.co/v1{write}") == len(dropped)
+    assert before - _cached_paths(cache) == dropped
+
+
+@responses.activate
+def test_write_invalidates_cached_reads() -> None:
+    rsp = responses.get(PROJECTS_URL, json=[])
+    responses.post(
+        PROJECTS_URL,
+        status=400,
+    )
+    tags = responses.get("https://global.baz.co/workspaces/1/tags/", json=[])
+    clockify = Clockify("apikey", "baz.co", cache=ResponseCache())
+
+    clockify.projects.get_projects("1")
+    clockify.tags.get_tags("1")
+    with pytest.raises(HTTPError):
+        clockify.projects.add_project("1", "new", "client")
+    clockify.projects.get_projects("1")
+    clockify.tags.get_tags("1")
+    assert rsp.call_count == 2
+    assert tags.call_count == 1
+
+
+################################################################################
+def test_entry_parsed_once() -> None:
+    cache = ResponseCache(ttls={"*": 60})
+    entry = cache.set("a", "https://x.co/a", b'{"a": 1}')
+    assert entry is not None
+    calls: list[bytes] = []
+
+    def parse(content: bytes) -> list[bytes]:
+        calls.append(content)
+        return calls
+
+    first = entry.parse(parse)
+    assert entry.parse(parse) == first
+    assert entry.parse(parse) is not first
+    assert calls == [b'{"a": 1}']
+
+
+def test_validators_kept_after_expiry() -> None:
+    cache = ResponseCache(ttls={})
+    cache.set("a", "https://x.co/a", b"1", etag='"v1"', last_modified="yesterday")
+    entry = cache.get("a")
+    assert entry is not None
+    assert not entry.fresh
+    assert entry.validators == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "yesterday",
+    }
+    assert cache.stats.misses == 1
+
+    assert (
+        ResponseCache(ttls={}, conditional=False).set("a", "x", b"1", etag="v") is None
+    )
+
+
+@responses.activate
+def test_conditional_get() -> None:
+    url = "https://global.baz.co/workspaces/1/user/2/time-entries/"
+    statuses: list[int] = []
+
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        if request.headers.get("If-None-Match") == '"v1"':
+            statuses.append(304)
+            return 304, {}, ""
+        statuses.append(200)
+        return 200, {"ETag": '"v1"'}, "[]"
+
+    responses.add_callback(responses.GET, url, callback)
+    cache = ResponseCache()
+    transport = Transport(cache=cache)
+    transport.mount("https://global.baz.co")
+    calls: list[bytes] = []
+
+    def parse(content: bytes) -> list:
+        calls.append(content)
+        return []
+
+    parsed = transport.send("GET", url, headers={}, parse=parse)
+    assert transport.send("GET", url, headers={}, parse=parse) == parsed
+    assert transport.send("GET", url, headers={}, parse=parse) == parsed
+    assert statuses == [200, 304, 304]
+    assert calls == [b"[]"]
+    assert cache.stats.revalidations == 2
+
+
+@responses.activate
+def test_conditional_get_changed() -> None:
+    url = "https://global.baz.co/workspaces/1/user/2/time-entries/"
+    responses.get(url, json=["old"], headers={"ETag": '"v1"'})
+    clockify = Clockify("apikey", "baz.co", cache=ResponseCache())
+    assert clockify.time_entries.get(url.split(".co")[1]) == ["old"]
+
+    responses.replace(responses.GET, url, json=["new"], headers={"ETag": '"v2"'})
+    assert clockify.time_entries.get(url.split(".co")[1]) == ["new"]
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@responses.activate
+def test_typed_response_validated_once(mocker: MockerFixture) -> None:
+    responses.get(PROJECTS_URL, json=[])
+    clockify = Clockify("apikey", "baz.co", cache=ResponseCache())
+    loads = mocker.spy(json, "loads")
+
+    projects = clockify.projects.get_projects("1")
+    assert clockify.projects.get_projects("1") == projects
+    loads.assert_not_called()
+
+
+@responses.activate
+def test_cached_results_can_be_modified() -> None:
+    project = {
+        "color": "#000000",
+        "duration": "PT0S",
+        "id": "p1",
+        "memberships": [],
+        "name": "foo",
+        "note": "",
+        "public": True,
+        "workspaceId": "1",
+    }
+    responses.get(PROJECTS_URL, json=[project])
+    tags_url = "https://global.baz.co/workspaces/1/tags"
+    responses.get(tags_url, json=[{"id": "t1", "name": "bar"}])
+    clockify = Clockify("apikey", "baz.co", cache=ResponseCache())
+
+    projects = clockify.projects.get_projects("1")
+    assert projects is not None
+    projects[0].name = "changed"
+    projects.clear()
+    rt = clockify.projects.get_projects("1")
+    assert rt is not None
+    assert [p.name for p in rt] == ["foo"]
+
+    tags = clockify.tags.get("/workspaces/1/tags")
+    assert isinstance(tags, list)
+    tags[0]["name"] = "changed"
+    tags.append({"id": "t2"})
+    assert clockify.tags.get("/workspaces/1/tags") == [{"id": "t1", "name": "bar"}]
+    assert len(responses.calls) == 2
+
+
+################################################################################
+@responses.activate
+def test_sqlite_backend_survives_restart(tmp_path: Path) -> None:
+    responses.get(PROJECTS_URL, json=[], headers={"ETag": '"v1"'})
+
+    def run() -> None:
+        backend = SqliteBackend(tmp_path / "cache.sqlite")
+        clockify = Clockify("apikey", "baz.co", cache=ResponseCache(backend=backend))
+        assert clockify.projects.get_projects("1") == []
+        backend.close()
+
+    run()
+    run()
+    assert len(responses.calls) == 1
+
+
+def test_sqlite_backend_expiry(mocker: MockerFixture, tmp_path: Path) -> None:
+    monotonic = mocker.patch("clockify_client.cache.time.monotonic", return_value=0)
+    clock = mocker.patch("clockify_client.cache.time.time", return_value=1000)
+    path = tmp_path / "cache.sqlite"
+    ResponseCache(ttls={"*": 10}, backend=SqliteBackend(path)).set(
+        "key", "https://x.co/a", b"[]", etag='"v1"'
+    )
+
+    # another process, started later with its own monotonic clock
+    monotonic.return_value, clock.return_value = 500, 1005
+    cache = ResponseCache(ttls={"*": 10}, backend=SqliteBackend(path))
+    entry = cache.get("key")
+    assert entry is not None
+    assert entry.fresh
+    assert entry.content == b"[]"
+
+    clock.return_value = 1011
+    entry = cache.get("key")
+    assert entry is not None
+    assert not entry.fresh
+    assert entry.validators == {"If-None-Match": '"v1"'}
+
+    cache.revalidated(entry, "https://x.co/a", "key")
+    entry = ResponseCache(backend=SqliteBackend(path)).get("key")
+    assert entry is not None
+    assert entry.fresh
+
+
+def test_sqlite_backend_eviction() -> None:
+    backend = SqliteBackend(":memory:", maxsize=2, max_bytes=5)
+    cache = ResponseCache(ttls={"*": 10}, backend=backend)
+    cache.set("a", "https://x.co/a", b"1")
+    cache.set("b", "https://x.co/b", b"2")
+    cache.get("a")
+    cache.set("c", "https://x.co/c", b"3")
+    assert sorted(backend) == ["a", "c"]
+
+    cache.set("d", "https://x.co/d", b"44444")
+    assert list(backend) == ["d"]
+    assert cache.stats.evictions == 3
+
+    _fill(cache, "/workspaces/1/tags")
+    assert cache.invalidate("*/tags") == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+################################################################################
+@responses.activate
+def test_stale_while_revalidate(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("clockify_client.cache.time.monotonic", return_value=0)
+    release = threading.Event()
+    calls: list[PreparedRequest] = []
+
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        calls.append(request)
+        if len(calls) > 1:
+            assert release.wait(5)
+        return 200, {}, json.dumps(["old" if len(calls) == 1 else "new"])
+
+    responses.add_callback(responses.GET, PROJECTS_URL, callback)
+    cache = ResponseCache(ttls={"*": 10}, stale_while_revalidate=60)
+    transport = Transport(cache=cache)
+    transport.mount("https://global.baz.co")
+
+    def get() -> list[str] | None:
+        return transport.send("GET", PROJECTS_URL, headers={}, parse=json.loads)
+
+    assert get() == ["old"]
+    monotonic.return_value = 20
+    # refresh is blocked, so both are served stale and only one refresh starts
+    assert get() == ["old"]
+    assert get() == ["old"]
+    release.set()
+    for _ in range(500):
+        if not cache._refreshing:
+            break
+        time.sleep(0.01)
+
+    assert get() == ["new"]
+    assert len(calls) == 2
+    assert (cache.stats.hits, cache.stats.stale_hits, cache.stats.misses) == (1, 2, 1)
+
+    monotonic.return_value = 100
+    assert cache.get(ResponseCache.make_key("GET", PROJECTS_URL, "")) is None
+
+
+def test_async_stale_while_revalidate(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("clockify_client.cache.time.monotonic", return_value=0)
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b'["foo"]', headers={"ETag": '"v1"'})
+
+    cache = ResponseCache(ttls={"*": 10}, stale_while_revalidate=60)
+
+    async def run() -> None:
+        transport = AsyncTransport(
+            http_transport=httpx.MockTransport(handler), cache=cache
+        )
+        transport.mount("https://global.baz.co")
+        for i in range(3):
+            rt = await transport.send(
+                "GET", PROJECTS_URL, headers={}, parse=lambda b: b
+            )
+            assert rt == b'["foo"]'
+            monotonic.return_value = 20 * (i + 1)
+        await transport.aclose()
+
+    asyncio.run(run())
+    assert len(calls) == 2
+    assert calls[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats.revalidations == 1
+
+
+@responses.activate
+def test_revalidated_entry_of_uncached_endpoint_not_served_stale() -> None:
+    url = "https://global.baz.co/workspaces/123/user/007/time-entries"
+    responses.get(url, json=[], headers={"ETag": '"v1"'})
+    responses.get(url, json=[1], headers={"ETag": '"v2"'})
+    # zero TTL entry is kept only to be revalidated, never served without asking
+    cache = ResponseCache(stale_while_revalidate=60)
+    transport = Transport(cache=cache)
+    transport.mount("https://global.baz.co")
+
+    assert transport.send("GET", url, headers={}, parse=json.loads) == []
+    assert transport.send("GET", url, headers={}, parse=json.loads) == [1]
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert cache.stats.stale_hits == 0
@@ -81,3 +81,22 @@ def test_get_clients() -> None:
     client.get_clients("234", {"name": "Sally"})
     assert rsp2.call_count == 1
     return
+
+
+@responses.activate
+def test_iter_clients() -> None:
+    resp_data = [{"id": str(i), "name": "Client X"} for i in range(2)]
+    rsp1 = responses.get(
+        "https://global.baz.co/workspaces/123/clients?page=2&page-size=2",
+        json=resp_data,
+        status=200,
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/workspaces/123/clients?page=3&page-size=2",
+        json=[],
+        status=200,
+    )
+    client = Client("apikey", "baz.co")
+    assert list(client.iter_clients("123", {"page": 2, "page-size": 2})) == resp_data
+    assert rsp1.call_count == 1
+    assert rsp2.call_count == 1
@@ -12,3 +12,20 @@ def test_can_be_instantiated() -> None:
     assert clockify1.clients.api_key == "1"
     assert clockify2.clients.api_key == "2"
     assert clockify1 is not clockify2
+
+
+def test_services_share_transport() -> None:
+    with Clockify("apikey", "baz.co", pool_maxsize=4) as clockify:
+        services = [
+            clockify.workspaces,
+            clockify.projects,
+            clockify.tags,
+            clockify.tasks,
+            clockify.time_entries,
+            clockify.users,
+            clockify.reports,
+            clockify.clients,
+        ]
+        assert all(s.transport is clockify.transport for s in services)
+        assert clockify.transport.pool_maxsize == 4
+        assert clockify.reports.base_url == "https://reports.baz.co"
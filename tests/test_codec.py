@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import responses
+from pydantic import BaseModel, Field
+
+from clockify_client import Clockify
+from clockify_client.codec import STDLIB_CODEC, JsonCodec, get_codec
+
+
+class Payload(BaseModel):
+    name: str = Field(alias="fullName")
+    note: str | None = None
+
+
+def test_stdlib_codec() -> None:
+    assert get_codec("json") is STDLIB_CODEC
+    assert STDLIB_CODEC.loads(b'{"a": [1, "\xc5\xbd"]}') == {"a": [1, "Ž"]}
+    assert STDLIB_CODEC.dumps({"a": [1, "Ž"]}) == '{"a":[1,"Ž"]}'.encode()
+
+
+def test_encode() -> None:
+    assert STDLIB_CODEC.encode({"a": None}) == b'{"a":null}'
+    assert STDLIB_CODEC.encode(Payload(fullName="foo")) == b'{"fullName":"foo"}'
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_fast_codec(name: str) -> None:
+    pytest.importorskip(name)
+    codec = get_codec(name)
+    assert codec.name == name
+    assert json.loads(codec.dumps({"a": [1, "Ž"]})) == {"a": [1, "Ž"]}
+    assert codec.loads(b'{"a": [1, "\xc5\xbd"]}') == {"a": [1, "Ž"]}
+
+
+def test_auto_codec() -> None:
+    installed = []
+    for name in ["orjson", "msgspec"]:
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        installed.append(name)
+    assert get_codec().name == (installed[0] if installed else "json")
+
+
+@responses.activate
+def test_clockify_uses_codec() -> None:
+    calls: list[bytes] = []
+
+    def loads(content: bytes) -> list:
+        calls.append(content)
+        return json.loads(content)
+
+    codec = JsonCodec("spy", loads, STDLIB_CODEC.dumps)
+    url = "https://global.baz.co/workspaces/1/clients/"
+    rsp = responses.post(url, json={})
+    responses.get(url, json=[])
+    clockify = Clockify("apikey", "baz.co", json_codec=codec)
+
+    assert clockify.clients.get_clients("1") == []
+    assert clockify.clients.add_client("1", "foo") == {}
+    assert calls == [b"[]", b"{}"]
+    assert rsp.calls[0].request.headers["Content-Type"] == "application/json"
+    assert json.loads(rsp.calls[0].request.body) == {
+        "address": None,
+        "email": None,
+        "name": "foo",
+        "note": None,
+    }
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+from requests import HTTPError, ReadTimeout
+from responses import matchers
+
+from clockify_client.api_objects.time_entry import AddTimeEntryPayload
+from clockify_client.exceptions import RateLimitExceededError
+from clockify_client.idempotency import (
+    DONE,
+    PENDING,
+    IdempotencyJournal,
+    IdempotentTimeEntries,
+    idempotency_key,
+)
+from clockify_client.models.time_entry import TimeEntry
+from clockify_client.rate_limit import RateLimiter
+from clockify_client.retry import RetryPolicy
+from clockify_client.transport import Transport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+ENTRIES_URL = "https://global.baz.co/workspaces/123/user/007/time-entries"
+PAYLOAD = AddTimeEntryPayload.model_validate(
+    {
+        "billable": False,
+        "description": "standup",
+        "end": "2020-01-01T09:15:00Z",
+        "projectId": "p",
+        "start": "2020-01-01T09:00:00Z",
+        "type": "REGULAR",
+    }
+)
+RETRY = RetryPolicy(max_attempts=2, backoff_factor=0, jitter=False)
+
+
+def _writer(journal: IdempotencyJournal | None = None) -> IdempotentTimeEntries:
+    return IdempotentTimeEntries(
+        TimeEntry("apikey", "baz.co"), journal or IdempotencyJournal(), RETRY
+    )
+
+
+def test_idempotency_key() -> None:
+    same = AddTimeEntryPayload.model_validate(PAYLOAD.model_dump(by_alias=True))
+    other = PAYLOAD.model_copy(update={"description": "retro"})
+    assert idempotency_key("123", "007", PAYLOAD) == idempotency_key("123", "007", same)
+    assert idempotency_key("123", "007", PAYLOAD) != idempotency_key(
+        "123", "007", other
+    )
+    assert idempotency_key("123", "007", PAYLOAD) != idempotency_key(
+        "123", "8", PAYLOAD
+    )
+
+
+@responses.activate
+def test_done_write_not_repeated(
+    tmp_path: Path, make_time_entry: Callable[..., dict]
+) -> None:
+    rsp = responses.post(
+        f"{ENTRIES_URL}/", json=make_time_entry("1", description="standup"), status=201
+    )
+    path = tmp_path / "journal.sqlite"
+
+    with IdempotencyJournal(path) as journal:
+        created = _writer(journal).add_time_entry("123", "007", PAYLOAD)
+    with IdempotencyJournal(path) as journal:
+        assert _writer(journal).add_time_entry("123", "007", PAYLOAD) == created
+        record = journal.get(idempotency_key("123", "007", PAYLOAD))
+    assert created is not None
+    assert created.id == "1"
+    assert record is not None
+    assert record.status == DONE
+    assert rsp.call_count == 1
+
+
+@responses.activate
+def test_retry_finds_entry_created_by_timed_out_attempt(
+    make_time_entry: Callable[..., dict],
+) -> None:
+    post = responses.post(f"{ENTRIES_URL}/", body=ReadTimeout())
+    lookup = responses.get(
+        ENTRIES_URL,
+        json=[
+            make_time_entry("2", description="other"),
+            make_time_entry("1", description="standup"),
+        ],
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "start": "2020-01-01T09:00:00Z",
+                    "end": "2020-01-01T09:15:00Z",
+                    "page": "1",
+                    "page-size": "50",
+                }
+            )
+        ],
+    )
+    journal = IdempotencyJournal()
+
+    created = _writer(journal).add_time_entry("123", "007", PAYLOAD)
+    assert created is not None
+    assert created.id == "1"
+    assert (post.call_count, lookup.call_count) == (1, 1)
+    record = journal.get(idempotency_key("123", "007", PAYLOAD))
+    assert record is not None
+    assert json.loads(record.response or "")["id"] == "1"
+
+
+@responses.activate
+def test_lookup_bounds_sent_in_utc(make_time_entry: Callable[..., dict]) -> None:
+    payload = PAYLOAD.model_copy(
+        update={"start": "2020-01-01T10:00:00+01:00", "end": "2020-01-01T04:15:00-05"}
+    )
+    responses.post(f"{ENTRIES_URL}/", body=ReadTimeout())
+    lookup = responses.get(
+        ENTRIES_URL,
+        json=[make_time_entry("1", description="standup")],
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "start": "2020-01-01T09:00:00Z",
+                    "end": "2020-01-01T09:15:00Z",
+                    "page": "1",
+                    "page-size": "50",
+                }
+            )
+        ],
+    )
+
+    created = _writer().add_time_entry("123", "007", payload)
+    assert created is not None
+    assert created.id == "1"
+    assert lookup.call_count == 1
+
+
+@responses.activate
+def test_retry_creates_entry_when_none_exists(
+    make_time_entry: Callable[..., dict],
+) -> None:
+    responses.post(f"{ENTRIES_URL}/", body=ReadTimeout())
+    responses.post(
+        f"{ENTRIES_URL}/", json=make_time_entry("3", description="standup"), status=201
+    )
+    responses.get(ENTRIES_URL, json=[])
+
+    created = _writer().add_time_entry("123", "007", PAYLOAD)
+    assert created is not None
+    assert created.id == "3"
+    assert [c.request.method for c in responses.calls] == ["POST", "GET", "POST"]
+
+
+@responses.activate
+def test_pending_write_checked_by_later_call(
+    make_time_entry: Callable[..., dict],
+) -> None:
+    responses.post(f"{ENTRIES_URL}/", body=ReadTimeout())
+    journal = IdempotencyJournal()
+    writer = IdempotentTimeEntries(
+        TimeEntry("apikey", "baz.co"), journal, RetryPolicy(max_attempts=1)
+    )
+    with pytest.raises(ReadTimeout):
+        writer.add_time_entry("123", "007", PAYLOAD)
+    record = journal.get(idempotency_key("123", "007", PAYLOAD))
+    assert record is not None
+    assert record.status == PENDING
+
+    responses.get(ENTRIES_URL, json=[make_time_entry("1", description="standup")])
+    created = writer.add_time_entry("123", "007", PAYLOAD)
+    assert created is not None
+    assert created.id == "1"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_rejected_write_forgotten() -> None:
+    rsp = responses.post(f"{ENTRIES_URL}/", status=400)
+    journal = IdempotencyJournal()
+
+    with pytest.raises(HTTPError):
+        _writer(journal).add_time_entry("123", "007", PAYLOAD)
+    assert journal.get(idempotency_key("123", "007", PAYLOAD)) is None
+    assert rsp.call_count == 1
+
+
+def test_write_refused_by_rate_limiter_forgotten() -> None:
+    limiter = RateLimiter(0.001, burst=1, block=False)
+    limiter.acquire()
+    transport = Transport(rate_limiter=limiter)
+    journal = IdempotencyJournal()
+    writer = IdempotentTimeEntries(TimeEntry("apikey", "baz.co", transport), journal)
+
+    with pytest.raises(RateLimitExceededError):
+        writer.add_time_entry("123", "007", PAYLOAD)
+    assert journal.get(idempotency_key("123", "007", PAYLOAD)) is None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import responses
+from pydantic import ValidationError
+
+from clockify_client import Clockify
+from clockify_client.aio import AsyncClockify
+from clockify_client.api_objects.project import EstimateResetDto
+from clockify_client.api_objects.time_entry import TimeEntryResponse
+from clockify_client.parsing import json_parser, list_parser
+
+RESET = (
+    b'{"dayOfMonth": 1, "dayOfWeek": "MONDAY", "hour": 8, "interval": "MONTHLY",'
+    b' "month": "JANUARY"}'
+)
+
+
+def test_json_parser() -> None:
+    reset = json_parser(EstimateResetDto)(RESET)
+    assert isinstance(reset, EstimateResetDto)
+    assert reset.day_of_week == "MONDAY"
+    assert json_parser(EstimateResetDto) == json_parser(EstimateResetDto)
+
+    with pytest.raises(ValidationError):
+        json_parser(EstimateResetDto)(b"{}")
+
+
+def test_list_parser() -> None:
+    resets = list_parser(EstimateResetDto)(b"[" + RESET + b"," + RESET + b"]")
+    assert [r.hour for r in resets] == [8, 8]
+    assert list_parser(EstimateResetDto) == list_parser(EstimateResetDto)
+    assert list_parser(EstimateResetDto)(b"[]") == []
+
+
+ENTRY = {
+    "billable": False,
+    "costRate": {"amount": 100, "currency": "USD"},
+    "customFieldValues": [],
+    "description": "",
+    "id": "1",
+    "isLocked": False,
+    "kioskId": None,
+    "projectId": "p",
+    "taskId": None,
+    "timeInterval": {"duration": "not a duration", "end": "later", "start": "now"},
+    "type": "REGULAR",
+    "userId": "007",
+    "workspaceId": "123",
+}
+
+
+def test_validation_modes() -> None:
+    content = json.dumps(ENTRY).encode()
+    with pytest.raises(ValidationError):
+        json_parser(TimeEntryResponse)(content)
+
+    lenient = json_parser(TimeEntryResponse, "lenient")(content)
+    assert lenient.time_interval.start == "now"
+    with pytest.raises(ValidationError):
+        json_parser(TimeEntryResponse, "lenient")(
+            json.dumps({**ENTRY, "id": None}).encode()
+        )
+
+    trusted = json_parser(TimeEntryResponse, "trusted")(content)
+    assert isinstance(trusted.time_interval, type(lenient.time_interval))
+    assert trusted.cost_rate is not None
+    assert trusted.cost_rate.amount == 100
+    assert trusted == lenient
+    assert list_parser(TimeEntryResponse, "trusted")(b"[" + content + b"]") == [trusted]
+    assert json_parser(TimeEntryResponse, "trusted") == json_parser(
+        TimeEntryResponse, "trusted"
+    )
+
+    with pytest.raises(ValueError, match="Unknown validation mode"):
+        json_parser(TimeEntryResponse, "loose")  # type: ignore[arg-type]
+
+
+@responses.activate
+def test_client_validation_mode() -> None:
+    url = "https://global.baz.co/workspaces/123/user/007/time-entries"
+    responses.get(f"{url}/", json=[ENTRY])
+    responses.get(url, json=[ENTRY])
+
+    clockify = Clockify("apikey", "baz.co", validation="trusted")
+    entries = clockify.time_entries.get_time_entries("123", "007")
+    assert entries is not None
+    assert entries[0].time_interval.duration == "not a duration"
+    assert [e.id for e in clockify.time_entries.iter_time_entries("123", "007")] == [
+        "1"
+    ]
+
+    with pytest.raises(ValidationError):
+        Clockify("apikey", "baz.co").time_entries.get_time_entries("123", "007")
+
+
+@pytest.mark.parametrize("client_type", [Clockify, AsyncClockify])
+def test_client_rejects_unknown_validation_mode(
+    client_type: type[Clockify | AsyncClockify],
+) -> None:
+    with pytest.raises(ValueError, match="Unknown validation mode 'loose'"):
+        client_type("apikey", "baz.co", validation="loose")  # type: ignore[arg-type]
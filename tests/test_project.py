@@ -301,3 +301,39 @@ def test_add_project_response_error() -> None:
     }
     with pytest.raises(ValidationError):
         AddProjectResponse.model_validate(resp)
+
+
+@responses.activate
+def test_iter_projects() -> None:
+    resp_data = [
+        {
+            "color": "#000000",
+            "duration": "60000",
+            "id": str(i),
+            "memberships": [],
+            "name": f"MyProject{i}",
+            "note": "This is a sample note for the project.",
+            "public": True,
+            "workspaceId": "345",
+        }
+        for i in range(3)
+    ]
+    expected = [GetProjectResponse.model_validate(_) for _ in resp_data]
+    rsp1 = responses.get(
+        "https://global.baz.co/workspaces/345/projects?archived=false&page=1&page-size=2",
+        json=resp_data[:2],
+        status=200,
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/workspaces/345/projects?archived=false&page=2&page-size=2",
+        json=resp_data[2:],
+        status=200,
+    )
+    project = Project("apikey", "baz.co")
+    params = GetProjectsParams.model_validate({"archived": "false", "page-size": 2})
+    rt = project.iter_projects("345", params)
+    assert next(rt) == expected[0]
+    assert rsp2.call_count == 0
+    assert list(rt) == expected[1:]
+    assert rsp1.call_count == 1
+    assert rsp2.call_count == 1
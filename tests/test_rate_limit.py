@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+
+from clockify_client import Clockify
+from clockify_client.exceptions import RateLimitExceededError
+from clockify_client.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_invalid_rate() -> None:
+    with pytest.raises(ValueError, match="rate must be positive"):
+        RateLimiter(0)
+
+
+def test_burst_defaults_to_rate() -> None:
+    assert RateLimiter(50).burst == 50
+    assert RateLimiter(0.5).burst == 1
+    assert RateLimiter(5, burst=20).burst == 20
+
+
+def test_burst_passes_without_waiting(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("clockify_client.rate_limit.time.sleep")
+    limiter = RateLimiter(10, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_blocking_waits_for_token(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("clockify_client.rate_limit.time.sleep")
+    limiter = RateLimiter(10, burst=1)
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays == [pytest.approx(0.1, abs=0.01), pytest.approx(0.2, abs=0.01)]
+
+
+def test_non_blocking_fails() -> None:
+    limiter = RateLimiter(1, burst=2, block=False)
+    limiter.acquire()
+    limiter.acquire()
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire()
+
+
+def test_timeout_fails_without_taking_token(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.rate_limit.time.sleep")
+    limiter = RateLimiter(10, burst=1, timeout=0.15)
+    limiter.acquire()
+    limiter.acquire()  # waits ~0.1s
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire()  # would wait ~0.2s
+
+
+def test_acquire_async(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("clockify_client.rate_limit.asyncio.sleep")
+    limiter = RateLimiter(10, burst=1)
+
+    async def run() -> None:
+        await limiter.acquire_async()
+        await limiter.acquire_async()
+
+    asyncio.run(run())
+    assert sleep.call_count == 1
+
+
+@responses.activate
+def test_limiter_shared_by_services() -> None:
+    responses.get("https://global.baz.co/workspaces/", json=[])
+    responses.get("https://global.baz.co/workspaces/1/tags/", json=[])
+    limiter = RateLimiter(1, burst=2, block=False)
+    clockify = Clockify("apikey", "baz.co", rate_limiter=limiter)
+    assert clockify.reports.transport.rate_limiter is limiter
+
+    clockify.workspaces.get_workspaces()
+    clockify.tags.get_tags("1")
+    with pytest.raises(RateLimitExceededError):
+        clockify.workspaces.get_workspaces()
+    assert len(responses.calls) == 2
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import json
+from typing import TYPE_CHECKING
+
+import pytest
 import responses
+from requests import HTTPError
 
 from clockify_client.models.report import Report
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from requests import PreparedRequest
+
 
 def test_can_be_instantiated() -> None:
     report = Report("apikey", "baz.co/")
@@ -64,3 +74,178 @@ def test_get_weekly_report() -> None:
     rt = report.get_weekly_report("123", req_data)
     assert rt == resp_data
     assert rsp.call_count == 1
+
+
+@responses.activate
+def test_stream_detailed_report() -> None:
+    resp_data = {
+        "totals": [{"totalTime": 7200}],
+        "timeentries": [{"_id": "1"}, {"_id": "2"}],
+    }
+    req_data = {
+        "dateRangeEnd": "2018-11-30T23:59:59.999Z",
+        "dateRangeStart": "2018-11-01T00:00:00Z",
+    }
+    rsp = responses.post(
+        "https://reports.baz.co/workspaces/123/reports/detailed/",
+        json=resp_data,
+        status=200,
+    )
+    report = Report("apikey", "baz.co")
+    stream = report.stream_detailed_report("123", req_data, chunk_size=8)
+    assert rsp.call_count == 0
+
+    assert list(stream) == resp_data["timeentries"]
+    assert stream.members == {"totals": resp_data["totals"]}
+    assert json.loads(rsp.calls[0].request.body) == req_data
+
+
+@responses.activate
+def test_stream_detailed_report_error() -> None:
+    responses.post(
+        "https://reports.baz.co/workspaces/123/reports/detailed/", status=400
+    )
+    report = Report("apikey", "baz.co")
+    with pytest.raises(HTTPError):
+        list(report.stream_detailed_report("123", {}))
+
+
+def _detailed_pages(entries: int) -> Callable[[PreparedRequest], tuple]:
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        detailed_filter = json.loads(request.body or "{}")["detailedFilter"]
+        page, size = detailed_filter["page"], detailed_filter["pageSize"]
+        ids = range((page - 1) * size, min(page * size, entries))
+        body = {
+            "totals": [{"entriesCount": entries}],
+            "timeentries": [{"_id": str(i)} for i in ids],
+        }
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+@responses.activate
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_detailed_report(prefetch: int) -> None:
+    url = "https://reports.baz.co/workspaces/123/reports/detailed/"
+    responses.add_callback(responses.POST, url, _detailed_pages(7))
+    req_data = {
+        "dateRangeStart": "2018-11-01T00:00:00Z",
+        "detailedFilter": {"pageSize": 3, "sortColumn": "DATE"},
+    }
+    report = Report("apikey", "baz.co")
+
+    rt = report.iter_detailed_report("123", req_data, prefetch=prefetch)
+    assert rt.totals is None
+    assert [e["_id"] for e in rt] == [str(i) for i in range(7)]
+    assert rt.totals == [{"entriesCount": 7}]
+
+    bodies = [json.loads(c.request.body or "") for c in responses.calls]
+    assert sorted(b["detailedFilter"]["page"] for b in bodies)[:3] == [1, 2, 3]
+    assert bodies[0]["detailedFilter"]["sortColumn"] == "DATE"
+    assert bodies[0]["dateRangeStart"] == req_data["dateRangeStart"]
+    assert req_data["detailedFilter"] == {"pageSize": 3, "sortColumn": "DATE"}
+
+
+@responses.activate
+def test_iter_detailed_report_from_page() -> None:
+    url = "https://reports.baz.co/workspaces/123/reports/detailed/"
+    responses.add_callback(responses.POST, url, _detailed_pages(6))
+    report = Report("apikey", "baz.co")
+
+    req_data = {"detailedFilter": {"page": 2, "pageSize": 3}}
+    rt = report.iter_detailed_report("123", req_data)
+    assert [e["_id"] for e in rt] == ["3", "4", "5"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_summary_report_sharded() -> None:
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        body = json.loads(request.body or "{}")
+        month = body["dateRangeStart"][:7]
+        group = {"_id": month[-2:], "duration": 10, "children": []}
+        project = {"_id": "p1", "duration": 5}
+        report = {
+            "totals": [{"_id": "", "totalTime": 15, "entriesCount": 2}],
+            "groupOne": [project, group],
+        }
+        return 200, {}, json.dumps(report)
+
+    url = "https://reports.baz.co/workspaces/123/reports/summary/"
+    responses.add_callback(responses.POST, url, callback)
+    req_data = {
+        "dateRangeEnd": "2018-12-31T23:59:59.999Z",
+        "dateRangeStart": "2018-10-01T00:00:00Z",
+        "summaryFilter": {"groups": ["PROJECT"]},
+    }
+    report = Report("apikey", "baz.co")
+
+    rt = report.get_summary_report("123", req_data, shard_by="month")
+    assert rt == {
+        "totals": [{"_id": "", "totalTime": 45, "entriesCount": 6}],
+        "groupOne": [
+            {"_id": "p1", "duration": 15},
+            {"_id": "10", "duration": 10, "children": []},
+            {"_id": "11", "duration": 10, "children": []},
+            {"_id": "12", "duration": 10, "children": []},
+        ],
+    }
+    bodies = [json.loads(c.request.body or "") for c in responses.calls]
+    assert sorted((b["dateRangeStart"], b["dateRangeEnd"]) for b in bodies) == [
+        ("2018-10-01T00:00:00Z", "2018-10-31T23:59:59.999Z"),
+        ("2018-11-01T00:00:00.000Z", "2018-11-30T23:59:59.999Z"),
+        ("2018-12-01T00:00:00.000Z", "2018-12-31T23:59:59.999Z"),
+    ]
+    assert all(b["summaryFilter"] == req_data["summaryFilter"] for b in bodies)
+
+
+@responses.activate
+def test_get_detailed_report_sharded() -> None:
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        body = json.loads(request.body or "{}")
+        day = body["dateRangeStart"][8:10]
+        page, size = body["detailedFilter"]["page"], body["detailedFilter"]["pageSize"]
+        ids = [f"{day}-{i}" for i in range(3)][(page - 1) * size : page * size]
+        report = {
+            "totals": [{"_id": "", "entriesCount": 3}],
+            "timeentries": [{"_id": i} for i in ids],
+        }
+        return 200, {}, json.dumps(report)
+
+    url = "https://reports.baz.co/workspaces/123/reports/detailed/"
+    responses.add_callback(responses.POST, url, callback)
+    req_data = {
+        "dateRangeEnd": "2018-11-02T23:59:59.999Z",
+        "dateRangeStart": "2018-11-01T00:00:00Z",
+        "detailedFilter": {"pageSize": 2},
+        "sortOrder": "ASCENDING",
+    }
+    report = Report("apikey", "baz.co")
+
+    rt = report.get_detailed_report("123", req_data, shard_by="day", max_workers=2)
+    assert rt == {
+        "totals": [{"_id": "", "entriesCount": 6}],
+        "timeentries": [
+            {"_id": f"{day}-{i}"} for day in ["01", "02"] for i in range(3)
+        ],
+    }
+    assert len(responses.calls) == 4
+
+    # Clockify sorts newest first by default, so later windows come first
+    del req_data["sortOrder"]
+    rt = report.get_detailed_report("123", req_data, shard_by="day")
+    assert isinstance(rt, dict)
+    assert [e["_id"][:2] for e in rt["timeentries"]] == ["02"] * 3 + ["01"] * 3
+
+
+def test_detailed_report_sharded_only_by_date() -> None:
+    req_data = {
+        "dateRangeEnd": "2018-11-02T23:59:59.999Z",
+        "dateRangeStart": "2018-11-01T00:00:00Z",
+        "detailedFilter": {"sortColumn": "DURATION"},
+    }
+    report = Report("apikey", "baz.co")
+
+    with pytest.raises(ValueError, match="DURATION"):
+        report.get_detailed_report("123", req_data, shard_by="day")
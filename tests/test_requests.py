@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import json
+import re
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
 import responses
+from pydantic import BaseModel, Field
 from requests import HTTPError
+from responses import matchers
 
 from clockify_client.abstract_clockify import AbstractClockify
 
+if TYPE_CHECKING:
+    from requests import PreparedRequest
+
 REQ_PAYLOAD = {"foobar": "barfoo"}
 PATH = "/bar/"
 URL = f"https://global.baz.co{PATH}"
@@ -144,3 +155,132 @@ def test_delete_no_json(status_code: int) -> None:
     rt = ac.delete(PATH)
     assert rt is None
     assert rsp.call_count == 1
+
+
+################################################################################
+@responses.activate
+def test_paginate_stops_on_short_page() -> None:
+    pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}, {"id": "4"}], [{"id": "5"}]]
+    rsps = [
+        responses.get(
+            "https://global.baz.co/things",
+            json=page,
+            match=[
+                matchers.query_param_matcher(
+                    {"name": "foo", "page": str(i), "page-size": "2"}
+                )
+            ],
+        )
+        for i, page in enumerate(pages, start=1)
+    ]
+    ac = AbstractClockify("apikey", "baz.co")
+
+    iterator = ac.paginate("/things", {"name": "foo", "page-size": 2})
+    assert all(rsp.call_count == 0 for rsp in rsps)
+    assert next(iterator) == pages[0]
+    assert [rsp.call_count for rsp in rsps] == [1, 0, 0]
+    assert list(iterator) == pages[1:]
+    assert [rsp.call_count for rsp in rsps] == [1, 1, 1]
+
+
+@responses.activate
+def test_paginate_stops_on_empty_page() -> None:
+    rsp1 = responses.get(
+        "https://global.baz.co/things",
+        json=[{"id": "1"}],
+        match=[matchers.query_param_matcher({"page": "3", "page-size": "1"})],
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/things",
+        json=[],
+        match=[matchers.query_param_matcher({"page": "4", "page-size": "1"})],
+    )
+    ac = AbstractClockify("apikey", "baz.co")
+
+    assert list(ac.paginate("/things", {"page": 3, "page-size": 1})) == [[{"id": "1"}]]
+    assert rsp1.call_count == 1
+    assert rsp2.call_count == 1
+
+
+@responses.activate
+def test_paginate_default_page_size() -> None:
+    rsp = responses.get(
+        "https://global.baz.co/things",
+        json=[{"id": "1"}],
+        match=[matchers.query_param_matcher({"page": "1", "page-size": "50"})],
+    )
+    ac = AbstractClockify("apikey", "baz.co")
+
+    assert list(ac.paginate("/things")) == [[{"id": "1"}]]
+    assert rsp.call_count == 1
+
+
+@responses.activate
+@pytest.mark.parametrize("prefetch", [1, 3])
+def test_paginate_prefetch_keeps_order(prefetch: int) -> None:
+    pages = {1: [{"id": "1"}, {"id": "2"}], 2: [{"id": "3"}, {"id": "4"}]}
+    pages[3] = [{"id": "5"}]
+
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        page = int(parse_qs(urlsplit(str(request.url)).query)["page"][0])
+        # first pages answer slowest, so completion order differs from page order
+        time.sleep(0.03 / page)
+        return 200, {}, json.dumps(pages.get(page, []))
+
+    rsp = responses.add_callback(
+        responses.GET, re.compile(r"https://global\.baz\.co/things\?.*"), callback
+    )
+    ac = AbstractClockify("apikey", "baz.co")
+
+    rt = list(ac.paginate("/things", {"page-size": 2}, prefetch=prefetch))
+    assert rt == [pages[1], pages[2], pages[3]]
+    assert rsp.call_count >= 3
+
+
+@responses.activate
+def test_paginate_prefetch_raises_in_order() -> None:
+    responses.get(
+        "https://global.baz.co/things",
+        json=[{"id": "1"}],
+        match=[matchers.query_param_matcher({"page": "1", "page-size": "1"})],
+    )
+    responses.get(
+        "https://global.baz.co/things",
+        status=500,
+        match=[matchers.query_param_matcher({"page": "2", "page-size": "1"})],
+    )
+    ac = AbstractClockify("apikey", "baz.co")
+
+    iterator = ac.paginate("/things", {"page-size": 1}, prefetch=2)
+    assert next(iterator) == [{"id": "1"}]
+    with pytest.raises(HTTPError):
+        next(iterator)
+
+
+################################################################################
+class Payload(BaseModel):
+    name: str = Field(alias="fullName")
+    note: str | None = None
+
+
+@responses.activate
+def test_post_model_sends_json_bytes() -> None:
+    rsp = responses.post(URL, json=RESP_JSON)
+    ac = AbstractClockify("apikey", "baz.co")
+
+    assert ac.post(PATH, Payload(fullName="Žofie")) == RESP_JSON
+    request = rsp.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["X-Api-Key"] == "apikey"
+    assert isinstance(request.body, bytes)
+    assert json.loads(request.body) == {"fullName": "Žofie"}
+
+
+@responses.activate
+def test_put_as_model() -> None:
+    rsp = responses.put(URL, json={"fullName": "foo"})
+    ac = AbstractClockify("apikey", "baz.co")
+
+    rt = ac.put_as(PATH, Payload(fullName="bar", note=None), Payload)
+    assert rt == Payload(fullName="foo")
+    assert json.loads(rsp.calls[0].request.body) == {"fullName": "bar", "note": None}
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import requests
+import responses
+
+from clockify_client import Clockify
+from clockify_client.aio.models.report import AsyncReport
+from clockify_client.aio.transport import AsyncTransport
+from clockify_client.retry import RetryPolicy
+from clockify_client.transport import Transport
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+URL = "https://global.baz.co/bar/"
+
+
+@pytest.mark.parametrize(
+    ("method", "status_code", "idempotent", "expected"),
+    [
+        ("GET", 503, None, True),
+        ("PUT", 500, None, True),
+        ("DELETE", 429, None, True),
+        ("GET", 404, None, False),
+        ("POST", 500, None, False),
+        ("POST", 429, None, True),
+        ("POST", 500, True, True),
+        ("GET", 500, False, False),
+    ],
+)
+def test_should_retry_status(
+    method: str, status_code: int, idempotent: bool | None, expected: bool
+) -> None:
+    policy = RetryPolicy()
+    assert (
+        policy.should_retry(method, 1, status_code, idempotent=idempotent) is expected
+    )
+
+
+def test_should_retry_connection_errors() -> None:
+    policy = RetryPolicy()
+    assert policy.should_retry("GET", 1)
+    assert not policy.should_retry("POST", 1)
+    assert policy.should_retry("POST", 1, maybe_processed=False)
+
+
+def test_should_retry_gives_up() -> None:
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry("GET", 2, 503)
+    assert not policy.should_retry("GET", 3, 503)
+
+
+def test_backoff_exponential() -> None:
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_backoff_jitter() -> None:
+    policy = RetryPolicy(backoff_factor=1)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+
+
+def test_backoff_retry_after() -> None:
+    policy = RetryPolicy(max_backoff=10)
+    assert policy.backoff(1, "3") == 3
+    assert policy.backoff(1, "120") == 10
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=5), usegmt=True)
+    assert 3 < policy.backoff(1, retry_at) <= 5
+    assert policy.backoff(1, "garbage") <= 0.5
+    assert RetryPolicy(respect_retry_after=False, jitter=False).backoff(1, "3") == 0.5
+
+
+################################################################################
+@responses.activate
+def test_transport_retries_get(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("clockify_client.transport.time.sleep")
+    rsp = responses.get(URL, status=503, headers={"Retry-After": "2"})
+    responses.get(URL, json={"stuff": "things"})
+    transport = Transport(retry=RetryPolicy())
+
+    response = transport.request("GET", URL, headers={})
+    assert response.json() == {"stuff": "things"}
+    assert len(responses.calls) == 2
+    assert rsp.call_count == 1
+    sleep.assert_called_once_with(2.0)
+
+
+@responses.activate
+def test_transport_returns_last_failure(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.transport.time.sleep")
+    responses.get(URL, status=500)
+    transport = Transport(retry=RetryPolicy(max_attempts=4))
+
+    assert transport.request("GET", URL, headers={}).status_code == 500
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_transport_does_not_repeat_post(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.transport.time.sleep")
+    responses.post(URL, status=502)
+    transport = Transport(retry=RetryPolicy())
+
+    assert transport.request("POST", URL, headers={}).status_code == 502
+    assert len(responses.calls) == 1
+
+    assert transport.request("POST", URL, headers={}, idempotent=True).status_code
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_transport_retries_connection_error(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.transport.time.sleep")
+    responses.get(URL, body=requests.ConnectionError("reset"))
+    responses.get(URL, json={})
+    transport = Transport(retry=RetryPolicy())
+
+    assert transport.request("GET", URL, headers={}).status_code == 200
+
+    responses.post(URL, body=requests.ConnectionError("reset"))
+    with pytest.raises(requests.ConnectionError):
+        transport.request("POST", URL, headers={})
+
+
+@responses.activate
+def test_clockify_retry_policy(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.transport.time.sleep")
+    responses.get("https://global.baz.co/workspaces/", status=429)
+    responses.get("https://global.baz.co/workspaces/", json=[])
+    clockify = Clockify("apikey", "baz.co", retry=RetryPolicy())
+
+    assert clockify.workspaces.get_workspaces() == []
+    assert clockify.time_entries.transport.retry is clockify.transport.retry
+
+
+@responses.activate
+def test_reports_retried(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.transport.time.sleep")
+    url = "https://reports.baz.co/workspaces/123/reports"
+    summary = responses.post(f"{url}/summary/", status=503)
+    responses.post(f"{url}/summary/", json={"totals": []})
+    detailed = responses.post(f"{url}/detailed/", status=503)
+    responses.post(f"{url}/detailed/", json={"timeentries": [{"id": "1"}]})
+    clockify = Clockify("apikey", "baz.co", retry=RetryPolicy())
+
+    # reports are read with POST requests, which are safe to repeat
+    assert clockify.reports.get_summary_report("123", {}) == {"totals": []}
+    assert summary.call_count == 1
+    stream = clockify.reports.stream_detailed_report("123", {})
+    assert list(stream) == [{"id": "1"}]
+    assert detailed.call_count == 1
+    assert len(responses.calls) == 4
+
+
+################################################################################
+def test_async_transport_retries(mocker: MockerFixture) -> None:
+    sleep = mocker.patch("clockify_client.aio.transport.asyncio.sleep")
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            msg = "refused"
+            raise httpx.ConnectError(msg, request=request)
+        return httpx.Response(statuses.pop(0), json={})
+
+    async def run() -> None:
+        transport = AsyncTransport(
+            http_transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(max_attempts=2, jitter=False),
+        )
+        transport.mount("https://global.baz.co")
+        response = await transport.request("GET", URL, headers={})
+        assert response.status_code == 200
+        with pytest.raises(httpx.ConnectError):
+            await transport.request("POST", URL, headers={})
+
+    asyncio.run(run())
+    assert sleep.call_count == 2
+
+
+def test_async_reports_retried(mocker: MockerFixture) -> None:
+    mocker.patch("clockify_client.aio.transport.asyncio.sleep")
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        return httpx.Response(statuses.pop(0), json={"totals": []})
+
+    async def run() -> None:
+        transport = AsyncTransport(
+            http_transport=httpx.MockTransport(handler), retry=RetryPolicy()
+        )
+        report = AsyncReport("apikey", "baz.co", transport)
+        assert await report.get_summary_report("123", {}) == {"totals": []}
+        await transport.aclose()
+
+    asyncio.run(run())
+    assert statuses == []
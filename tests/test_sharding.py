@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from clockify_client.sharding import (
+    merge_detailed_reports,
+    merge_records,
+    merge_summary_reports,
+    sorted_descending,
+    split_date_range,
+)
+
+if TYPE_CHECKING:
+    from clockify_client.sharding import Window
+
+
+@pytest.mark.parametrize(
+    ("window", "expected"),
+    [
+        (
+            "month",
+            [
+                ("2018-11-15T00:00:00Z", "2018-12-14T23:59:59.999Z"),
+                ("2018-12-15T00:00:00.000Z", "2019-01-14T23:59:59.999Z"),
+                ("2019-01-15T00:00:00.000Z", "2019-01-31T23:59:59.999Z"),
+            ],
+        ),
+        (
+            "week",
+            [
+                ("2018-11-15T00:00:00Z", "2018-11-21T23:59:59.999Z"),
+                ("2018-11-22T00:00:00.000Z", "2018-11-28T23:59:59.999Z"),
+                ("2018-11-29T00:00:00.000Z", "2018-12-05T23:59:59.999Z"),
+            ],
+        ),
+    ],
+)
+def test_split_date_range(window: Window, expected: list[tuple[str, str]]) -> None:
+    end = expected[-1][1]
+    assert split_date_range("2018-11-15T00:00:00Z", end, window) == expected
+
+
+def test_split_date_range_months_from_end_of_month() -> None:
+    windows = split_date_range("2024-01-31T00:00:00Z", "2024-04-30T23:59:59Z", "month")
+    assert windows == [
+        ("2024-01-31T00:00:00Z", "2024-02-28T23:59:59.999Z"),
+        ("2024-02-29T00:00:00.000Z", "2024-03-30T23:59:59.999Z"),
+        ("2024-03-31T00:00:00.000Z", "2024-04-29T23:59:59.999Z"),
+        ("2024-04-30T00:00:00.000Z", "2024-04-30T23:59:59Z"),
+    ]
+
+
+def test_split_date_range_short() -> None:
+    start, end = "2018-11-15T08:00:00+02:00", "2018-11-15T12:00:00+02:00"
+    assert split_date_range(start, end, "day") == [(start, end)]
+    assert split_date_range(end, start, "day") == []
+
+    days = split_date_range(start, "2018-11-17T12:00:00+02:00", "day")
+    assert days[1] == ("2018-11-16T08:00:00.000+02:00", "2018-11-17T07:59:59.999+02:00")
+    assert days[2][1] == "2018-11-17T12:00:00+02:00"
+
+
+def test_merge_records() -> None:
+    first = [
+        {"_id": "p1", "name": "Foo", "duration": 10, "amount": 1.5, "children": []},
+        {"_id": "p2", "name": "Bar", "duration": 5, "billable": True},
+    ]
+    second = [
+        {
+            "_id": "p1",
+            "name": "Foo",
+            "duration": 20,
+            "amount": 0.5,
+            "children": [{"_id": "t1", "duration": 20}],
+        },
+        {"_id": "p3", "name": "Baz", "duration": 1},
+    ]
+    third = [{"_id": "p1", "duration": 1, "children": [{"_id": "t1", "duration": 2}]}]
+
+    assert merge_records([first, None, second, third]) == [
+        {
+            "_id": "p1",
+            "name": "Foo",
+            "duration": 31,
+            "amount": 2.0,
+            "children": [{"_id": "t1", "duration": 22}],
+        },
+        {"_id": "p2", "name": "Bar", "duration": 5, "billable": True},
+        {"_id": "p3", "name": "Baz", "duration": 1},
+    ]
+
+
+def test_merge_summary_reports() -> None:
+    totals = {
+        "_id": "",
+        "totalTime": 10,
+        "entriesCount": 2,
+        "amounts": [{"type": "EARNED", "value": 100}],
+    }
+    reports: list[dict] = [
+        {"totals": [totals], "groupOne": [{"_id": "p1", "duration": 10}]},
+        {"totals": [], "groupOne": []},
+        {"totals": [totals], "groupOne": [{"_id": "p2", "duration": 10}]},
+    ]
+    assert merge_summary_reports(reports) == {
+        "totals": [
+            {
+                "_id": "",
+                "totalTime": 20,
+                "entriesCount": 4,
+                "amounts": [{"type": "EARNED", "value": 200}],
+            }
+        ],
+        "groupOne": [{"_id": "p1", "duration": 10}, {"_id": "p2", "duration": 10}],
+    }
+    assert merge_summary_reports([]) == {}
+
+
+def test_merge_detailed_reports() -> None:
+    reports: list[dict] = [
+        {"totals": [{"_id": "", "entriesCount": 1}], "timeentries": [{"_id": "1"}]},
+        {"totals": None, "timeentries": None},
+        {"totals": [{"_id": "", "entriesCount": 2}], "timeentries": [{"_id": "2"}]},
+    ]
+    assert merge_detailed_reports(reports) == {
+        "totals": [{"_id": "", "entriesCount": 3}],
+        "timeentries": [{"_id": "1"}, {"_id": "2"}],
+    }
+    assert merge_detailed_reports(reports, descending=True)["timeentries"] == [
+        {"_id": "2"},
+        {"_id": "1"},
+    ]
+
+
+def test_sorted_descending() -> None:
+    assert sorted_descending({})
+    assert sorted_descending({"detailedFilter": {"sortColumn": "DATE"}})
+    assert not sorted_descending({"sortOrder": "ASCENDING"})
+    with pytest.raises(ValueError, match="USER"):
+        sorted_descending({"detailedFilter": {"sortColumn": "USER"}})
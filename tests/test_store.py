@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from requests import HTTPError
+
+from clockify_client.api_objects.time_entry import TimeEntryResponse
+from clockify_client.models.time_entry import UserTimeEntries
+from clockify_client.store import LocalStore
+from clockify_client.sync import ChangeSet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def entries(make_time_entry: Callable[..., dict]) -> list[dict]:
+    return [
+        make_time_entry(
+            entry_id,
+            start=start,
+            end=start,
+            duration="PT1H",
+            projectId=project_id,
+            userId=user_id,
+            workspaceId="ws",
+        )
+        for entry_id, user_id, project_id, start in [
+            ("1", "u1", "p1", "2024-03-01T10:00:00Z"),
+            ("2", "u1", "p2", "2024-03-02T10:00:00Z"),
+            ("3", "u2", "p1", "2024-03-03T10:00:00Z"),
+        ]
+    ]
+
+
+def test_time_entries(tmp_path: Path, entries: list[dict]) -> None:
+    with LocalStore(tmp_path / "mirror.db") as store:
+        assert store.upsert("time_entries", "ws", entries) == 3
+        store.upsert("time_entries", "other", entries[:1])
+
+        def ids(**kwargs: str) -> list[str]:
+            return [e.id for e in store.time_entries("ws", **kwargs)]
+
+        assert ids() == ["1", "2", "3"]
+        assert ids(user_id="u1") == ["1", "2"]
+        assert ids(project_id="p1") == ["1", "3"]
+        assert ids(user_id="u1", project_id="p1") == ["1"]
+        assert ids(start="2024-03-02T00:00:00Z") == ["2", "3"]
+        assert ids(start="2024-03-02T00:00:00Z", end="2024-03-03T10:00:00Z") == ["2"]
+
+    with LocalStore(tmp_path / "mirror.db") as store:
+        entry = store.get("time_entries", "ws", "3")
+        assert entry == TimeEntryResponse.model_validate(entries[2])
+        assert store.get("time_entries", "ws", "4") is None
+
+
+def test_untyped_tables() -> None:
+    store = LocalStore()
+    tags: list[dict] = [
+        {"id": "t1", "name": "foo"},
+        {"id": "t2", "name": "bar", "extra": 1},
+    ]
+    store.upsert("tags", "ws", tags)
+    assert store.query("tags", "ws", order_by="name") == tags[::-1]
+    assert store.query("tags", "ws", name="foo") == tags[:1]
+
+    store.replace("tags", "ws", tags[1:])
+    assert store.query("tags", "ws") == tags[1:]
+    store.delete("tags", "ws", ["t2"])
+    assert store.query("tags", "ws") == []
+
+    with pytest.raises(ValueError, match="can be queried only by"):
+        store.query("tags", "ws", email="foo")
+    with pytest.raises(KeyError):
+        store.query("foo", "ws")
+
+
+def test_apply_changes(entries: list[dict]) -> None:
+    store = LocalStore()
+    store.upsert("time_entries", "ws", entries[:2])
+    updated = TimeEntryResponse.model_validate({**entries[0], "description": "x"})
+    changes = ChangeSet(
+        added=[TimeEntryResponse.model_validate(entries[2])],
+        updated=[updated],
+        deleted=["2"],
+    )
+
+    store.apply("ws", changes)
+    assert [(e.id, e.description) for e in store.time_entries("ws")] == [
+        ("1", "x"),
+        ("3", ""),
+    ]
+
+
+def test_mirror(mocker: MockerFixture, entries: list[dict]) -> None:
+    project = mocker.Mock(id="p1")
+    user = mocker.Mock(id="u1")
+    models = [TimeEntryResponse.model_validate(e) for e in entries]
+    clockify = mocker.Mock()
+    clockify.workspaces.get_workspaces.return_value = [{"id": "ws"}, {"id": "x"}]
+    clockify.clients.iter_clients.return_value = [{"id": "c1", "name": "Foo"}]
+    clockify.projects.iter_projects.return_value = [project]
+    clockify.tasks.iter_tasks.return_value = [{"id": "k1", "projectId": "p1"}]
+    clockify.tags.iter_tags.return_value = [{"id": "t1", "name": "foo"}]
+    clockify.users.iter_users.return_value = [user]
+    clockify.time_entries.get_workspace_time_entries.return_value = [
+        UserTimeEntries("u1", models)
+    ]
+    store = LocalStore()
+    replaced: dict[str, list] = {}
+
+    def replace(table: str, _workspace_id: str, records: list) -> int:
+        replaced[table] = list(records)
+        return len(replaced[table])
+
+    mocker.patch.object(store, "replace", side_effect=replace)
+
+    store.mirror(clockify, "ws")
+    assert replaced["workspaces"] == [{"id": "ws"}]
+    assert replaced["tasks"] == [{"id": "k1", "projectId": "p1"}]
+    assert replaced["users"] == [user]
+    assert replaced["time_entries"] == models
+    clockify.tasks.iter_tasks.assert_called_once_with("ws", "p1")
+    clockify.time_entries.get_workspace_time_entries.assert_called_once_with(
+        "ws", user_ids=["u1"]
+    )
+
+    error = HTTPError("boom")
+    clockify.time_entries.get_workspace_time_entries.return_value = [
+        UserTimeEntries("u1", error=error)
+    ]
+    with pytest.raises(HTTPError):
+        store.mirror(clockify, "ws")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from clockify_client.streaming import ItemStream
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+REPORT = {
+    "totals": [{"totalTime": 12345, "entriesCount": 2}],
+    "timeentries": [
+        {"_id": "1", "description": "Žluťoučký kůň", "duration": 3600},
+        {"_id": "2", "description": "", "tags": [], "rate": 1.5e3},
+    ],
+    "count": 1234567,
+}
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10000])
+def test_items_and_members(size: int) -> None:
+    data = json.dumps(REPORT, ensure_ascii=False, indent=1).encode()
+    stream = ItemStream(_chunks(data, size), "timeentries")
+
+    assert list(stream) == REPORT["timeentries"]
+    assert stream.members == {"totals": REPORT["totals"], "count": 1234567}
+
+
+@pytest.mark.parametrize(
+    ("body", "items", "members"),
+    [
+        (b"", [], {}),
+        (b"{}", [], {}),
+        (b'{"timeentries": []}', [], {}),
+        (b'{"timeentries": [1, 22, 333]}', [1, 22, 333], {}),
+        (b'{"timeentries": null, "a": 1}', [], {"timeentries": None, "a": 1}),
+    ],
+)
+def test_edge_cases(body: bytes, items: list, members: dict) -> None:
+    stream = ItemStream(_chunks(body, 1), "timeentries")
+    assert list(stream) == items
+    assert stream.members == members
+
+
+@pytest.mark.parametrize(
+    "body", [b"[]", b'{"timeentries": [1', b'{"timeentries": [1} ', b'{"a" 1}']
+)
+def test_malformed(body: bytes) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(ItemStream(_chunks(body, 4), "timeentries"))
+
+
+def test_reads_lazily_and_closes() -> None:
+    read: list[bytes] = []
+    closed: list[bool] = []
+
+    def chunks() -> Iterator[bytes]:
+        try:
+            for chunk in [b'{"timeentries": [', b"1,", b"2,", b"3]}"]:
+                read.append(chunk)
+                yield chunk
+        finally:
+            closed.append(True)
+
+    items = iter(ItemStream(chunks(), "timeentries"))
+    assert next(items) == 1
+    assert len(read) == 2
+    items.close()  # type: ignore[attr-defined]
+    assert closed == [True]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+from responses import matchers
+
+from clockify_client.models.time_entry import TimeEntry
+from clockify_client.sync import JsonFileStore, TimeEntrySync
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+URL = "https://global.baz.co/workspaces/123/user/007/time-entries"
+
+
+def test_json_file_store(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "state.json")
+    assert store.load("a") is None
+    store.save("a", {"watermark": "x"})
+    store.save("b", {"watermark": "y"})
+
+    reopened = JsonFileStore(tmp_path / "state.json")
+    assert reopened.load("a") == {"watermark": "x"}
+    assert reopened.load("b") == {"watermark": "y"}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+@responses.activate
+def test_sync(tmp_path: Path, make_time_entry: Callable[..., dict]) -> None:
+    sync = TimeEntrySync(
+        TimeEntry("apikey", "baz.co"),
+        JsonFileStore(tmp_path / "state.json"),
+        lookback=timedelta(days=7),
+    )
+    old = make_time_entry("old", start="2024-01-01T10:00:00Z")
+    recent = make_time_entry("recent", start="2024-03-08T10:00:00Z")
+    gone = make_time_entry("gone", start="2024-03-09T10:00:00Z")
+    first_run = responses.get(
+        URL,
+        json=[old, recent, gone],
+        match=[matchers.query_param_matcher({"page": "1", "page-size": "50"})],
+    )
+
+    changes = sync.sync("123", "007", now=datetime(2024, 3, 10, tzinfo=UTC))
+    assert [e.id for e in changes.added] == ["old", "recent", "gone"]
+    assert not changes.updated
+    assert not changes.deleted
+    assert first_run.call_count == 1
+
+    edited = make_time_entry(
+        "recent", start="2024-03-08T10:00:00Z", description="edited"
+    )
+    new = make_time_entry("new", start="2024-03-11T10:00:00Z")
+    second_run = responses.get(
+        URL,
+        json=[edited, new],
+        match=[
+            matchers.query_param_matcher(
+                {"start": "2024-03-03T00:00:00Z", "page": "1", "page-size": "50"}
+            )
+        ],
+    )
+    lookup = responses.get(
+        "https://global.baz.co/workspaces/123/time-entries/gone", status=404
+    )
+    changes = sync.sync("123", "007", now=datetime(2024, 3, 12, tzinfo=UTC))
+    assert lookup.call_count == 1
+    assert [e.id for e in changes.added] == ["new"]
+    assert [e.description for e in changes.updated] == ["edited"]
+    assert changes.deleted == ["gone"]
+    assert second_run.call_count == 1
+
+    responses.get(
+        URL,
+        json=[edited, new],
+        match=[
+            matchers.query_param_matcher(
+                {"start": "2024-03-05T00:00:00Z", "page": "1", "page-size": "50"}
+            )
+        ],
+    )
+    assert not sync.sync("123", "007", now=datetime(2024, 3, 13, tzinfo=UTC))
+
+
+@responses.activate
+def test_sync_entry_moved_before_window(
+    tmp_path: Path, make_time_entry: Callable[..., dict]
+) -> None:
+    sync = TimeEntrySync(
+        TimeEntry("apikey", "baz.co"),
+        JsonFileStore(tmp_path / "state.json"),
+        lookback=timedelta(days=7),
+    )
+    responses.get(URL, json=[make_time_entry("a", start="2024-03-08T10:00:00Z")])
+    sync.sync("123", "007", now=datetime(2024, 3, 10, tzinfo=UTC))
+
+    moved = make_time_entry("a", start="2024-02-01T10:00:00Z")
+    responses.replace(responses.GET, URL, json=[])
+    lookup = responses.get(
+        "https://global.baz.co/workspaces/123/time-entries/a", json=moved
+    )
+    changes = sync.sync("123", "007", now=datetime(2024, 3, 11, tzinfo=UTC))
+    assert not changes.deleted
+    assert [e.time_interval.start for e in changes.updated] == ["2024-02-01T10:00:00Z"]
+    assert lookup.call_count == 1
+
+    # moved entry is out of window now, so it is not looked up again
+    assert not sync.sync("123", "007", now=datetime(2024, 3, 12, tzinfo=UTC))
+    assert lookup.call_count == 1
+
+
+@responses.activate
+def test_sync_window_in_utc(tmp_path: Path) -> None:
+    sync = TimeEntrySync(
+        TimeEntry("apikey", "baz.co"),
+        JsonFileStore(tmp_path / "state.json"),
+        lookback=timedelta(days=1),
+    )
+    responses.get(URL, json=[])
+    prague = timezone(timedelta(hours=2))
+    sync.sync("123", "007", now=datetime(2024, 3, 10, 12, tzinfo=prague))
+
+    second_run = responses.get(
+        URL,
+        json=[],
+        match=[
+            matchers.query_param_matcher(
+                {"start": "2024-03-09T10:00:00Z", "page": "1", "page-size": "50"}
+            )
+        ],
+    )
+    sync.sync("123", "007", now=datetime(2024, 3, 11, 12, tzinfo=prague))
+    assert second_run.call_count == 1
+
+    with pytest.raises(ValueError, match="timezone aware"):
+        sync.sync("123", "007", now=datetime(2024, 3, 12))  # noqa: DTZ001
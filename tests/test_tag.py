@@ -39,3 +39,22 @@ def test_get_tags() -> None:
     )
     tag.get_tags("456", {"name": "Sprint1"})
     assert rsp2.call_count == 1
+
+
+@responses.activate
+def test_iter_tags() -> None:
+    resp_data = [{"archived": False, "id": str(i), "name": "Sprint1"} for i in range(3)]
+    rsp1 = responses.get(
+        "https://global.baz.co/workspaces/456/tags?page=1&page-size=2",
+        json=resp_data[:2],
+        status=200,
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/workspaces/456/tags?page=2&page-size=2",
+        json=resp_data[2:],
+        status=200,
+    )
+    tag = Tag("apikey", "baz.co")
+    assert list(tag.iter_tags("456", {"page-size": 2})) == resp_data
+    assert rsp1.call_count == 1
+    assert rsp2.call_count == 1
@@ -163,3 +163,16 @@ def test_get_task() -> None:
     rt = task.get_task("123", "345", "789")
     assert rt == resp_data
     assert rsp.call_count == 1
+
+
+@responses.activate
+def test_iter_tasks() -> None:
+    resp_data = [{"id": str(i), "name": "Bugfixing"} for i in range(2)]
+    rsp = responses.get(
+        "https://global.baz.co/workspaces/123/projects/345/tasks?name=Bugfixing&page=1&page-size=50",
+        json=resp_data,
+        status=200,
+    )
+    task = Task("apikey", "baz.co")
+    assert list(task.iter_tasks("123", "345", {"name": "Bugfixing"})) == resp_data
+    assert rsp.call_count == 1
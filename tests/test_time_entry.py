@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING
 
 import pytest
 import responses
 from pydantic import ValidationError
+from requests import HTTPError
+from responses import matchers
 
 from clockify_client.api_objects.time_entry import (
     AddTimeEntryPayload,
@@ -13,7 +16,15 @@ from clockify_client.api_objects.time_entry import (
     UpdateTimeEntryPayload,
     UpdateTimeEntryResponse,
 )
+from clockify_client.exceptions import RateLimitExceededError
 from clockify_client.models.time_entry import TimeEntry
+from clockify_client.rate_limit import RateLimiter
+from clockify_client.transport import Transport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from requests import PreparedRequest
 
 
 def test_can_be_instantiated() -> None:
@@ -336,3 +347,241 @@ def test_delete_time_entry() -> None:
     time_entry = TimeEntry("apikey", "baz.co")
     assert time_entry.delete_time_entry("123", "987") is None  # type: ignore[func-returns-value]
     assert rsp.call_count == 1
+
+
+@responses.activate
+def test_iter_time_entries() -> None:
+    resp_data: list[dict] = [
+        {
+            "billable": True,
+            "costRate": None,
+            "customFieldValues": [],
+            "description": "This is a sample time entry description.",
+            "id": str(i),
+            "isLocked": False,
+            "kioskId": None,
+            "projectId": "25b687e29ae1f428e7ebe123",
+            "taskId": None,
+            "timeInterval": {
+                "duration": "PT30M",
+                "end": "2021-01-01T00:00:00Z",
+                "start": "2020-01-01T00:00:00Z",
+            },
+            "type": "REGULAR",
+            "userId": "007",
+            "workspaceId": "123",
+        }
+        for i in range(2)
+    ]
+    rsp1 = responses.get(
+        "https://global.baz.co/workspaces/123/user/007/time-entries"
+        "?start=2020-01-01T00:00:00Z&page=1&page-size=1",
+        json=resp_data[:1],
+        status=200,
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/workspaces/123/user/007/time-entries"
+        "?start=2020-01-01T00:00:00Z&page=2&page-size=1",
+        json=resp_data[1:],
+        status=200,
+    )
+    rsp3 = responses.get(
+        "https://global.baz.co/workspaces/123/user/007/time-entries"
+        "?start=2020-01-01T00:00:00Z&page=3&page-size=1",
+        json=[],
+        status=200,
+    )
+    expected = [TimeEntryResponse.model_validate(_) for _ in resp_data]
+    time_entry = TimeEntry("apikey", "baz.co")
+    params = {"start": "2020-01-01T00:00:00Z", "page-size": 1}
+    rt = list(time_entry.iter_time_entries("123", "007", params))
+    assert rt == expected
+    assert [rsp1.call_count, rsp2.call_count, rsp3.call_count] == [1, 1, 1]
+
+
+@responses.activate
+def test_get_workspace_time_entries(make_time_entry: Callable[..., dict]) -> None:
+    url = "https://global.baz.co/workspaces/123"
+    responses.get(
+        f"{url}/users",
+        json=[{"id": f"u{i}"} for i in range(5)],
+        match=[matchers.query_param_matcher({"page": "1", "page-size": "50"})],
+    )
+    for i in range(5):
+        if i == 3:
+            responses.get(f"{url}/user/u{i}/time-entries", status=500)
+            continue
+        responses.get(
+            f"{url}/user/u{i}/time-entries",
+            json=[make_time_entry(f"{i}-{j}", userId=f"u{i}") for j in range(i)],
+            match=[
+                matchers.query_param_matcher(
+                    {"start": "2020-01-01T00:00:00Z", "page": "1", "page-size": "50"}
+                )
+            ],
+        )
+    time_entry = TimeEntry("apikey", "baz.co")
+
+    params = {"start": "2020-01-01T00:00:00Z"}
+    results = {
+        r.user_id: r
+        for r in time_entry.get_workspace_time_entries("123", params, max_workers=2)
+    }
+    assert sorted(results) == ["u0", "u1", "u2", "u3", "u4"]
+    assert isinstance(results["u3"].error, HTTPError)
+    assert results["u3"].entries == []
+    for i in [0, 1, 2, 4]:
+        assert results[f"u{i}"].error is None
+        assert [e.id for e in results[f"u{i}"].entries] == [
+            f"{i}-{j}" for j in range(i)
+        ]
+
+
+@responses.activate
+def test_get_workspace_time_entries_reports_refused_by_rate_limiter() -> None:
+    for user_id in ["a", "b", "c", "d"]:
+        responses.get(
+            f"https://global.baz.co/workspaces/123/user/{user_id}/time-entries",
+            json=[],
+        )
+    limiter = RateLimiter(0.001, burst=2, block=False)
+    time_entry = TimeEntry("apikey", "baz.co", Transport(rate_limiter=limiter))
+
+    results = time_entry.get_workspace_time_entries(
+        "123", user_ids=["a", "b", "c", "d"], max_workers=1
+    )
+    errors = {r.user_id: r.error for r in results}
+    assert sorted(errors) == ["a", "b", "c", "d"]
+    assert errors["a"] is None
+    assert errors["b"] is None
+    assert isinstance(errors["c"], RateLimitExceededError)
+    assert isinstance(errors["d"], RateLimitExceededError)
+
+
+@responses.activate
+def test_get_workspace_time_entries_of_users(
+    make_time_entry: Callable[..., dict],
+) -> None:
+    rsp = responses.get(
+        "https://global.baz.co/workspaces/123/user/007/time-entries",
+        json=[make_time_entry("1")],
+    )
+    time_entry = TimeEntry("apikey", "baz.co")
+
+    results = list(time_entry.get_workspace_time_entries("123", user_ids=["007"]))
+    assert [(r.user_id, len(r.entries), r.error) for r in results] == [("007", 1, None)]
+    assert rsp.call_count == 1
+
+
+@responses.activate
+def test_add_time_entries(make_time_entry: Callable[..., dict]) -> None:
+    url = "https://global.baz.co/workspaces/123/user/007/time-entries/"
+
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        description = json.loads(request.body or b"{}")["description"]
+        if description == "fail":
+            return 500, {}, ""
+        if description == "invalid":
+            return 201, {}, json.dumps({"id": "x"})
+        return 201, {}, json.dumps(make_time_entry(description, tagIds=[]))
+
+    responses.add_callback(responses.POST, url, callback)
+    time_entry = TimeEntry("apikey", "baz.co")
+    payloads = [
+        AddTimeEntryPayload.model_validate(
+            {
+                "billable": False,
+                "description": description,
+                "end": "2020-01-01T01:00:00Z",
+                "projectId": "p",
+                "start": "2020-01-01T00:00:00Z",
+                "type": "REGULAR",
+            }
+        )
+        for description in ["1", "fail", "3", "invalid", "5"]
+    ]
+
+    results = time_entry.add_time_entries("123", "007", payloads, max_workers=3)
+    assert [r.value.id if r.value else None for r in results] == [
+        "1",
+        None,
+        "3",
+        None,
+        "5",
+    ]
+    assert isinstance(results[1].error, HTTPError)
+    assert isinstance(results[3].error, ValidationError)
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_add_time_entries_reports_refused_by_rate_limiter(
+    make_time_entry: Callable[..., dict],
+) -> None:
+    responses.post(
+        "https://global.baz.co/workspaces/123/user/007/time-entries/",
+        json=make_time_entry("1", tagIds=[]),
+        status=201,
+    )
+    limiter = RateLimiter(0.001, burst=2, block=False)
+    time_entry = TimeEntry("apikey", "baz.co", Transport(rate_limiter=limiter))
+    payload = AddTimeEntryPayload.model_validate(
+        {
+            "billable": False,
+            "description": "1",
+            "end": "2020-01-01T01:00:00Z",
+            "projectId": "p",
+            "start": "2020-01-01T00:00:00Z",
+            "type": "REGULAR",
+        }
+    )
+
+    results = time_entry.add_time_entries("123", "007", [payload] * 5, max_workers=1)
+    assert [r.ok for r in results] == [True, True, False, False, False]
+    assert all(isinstance(r.error, RateLimitExceededError) for r in results[2:])
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_update_time_entries(make_time_entry: Callable[..., dict]) -> None:
+    url = "https://global.baz.co/workspaces/123/time-entries"
+    for entry_id in ["1", "3"]:
+        responses.put(f"{url}/{entry_id}", json=make_time_entry(entry_id, tagIds=[]))
+    responses.put(f"{url}/2", status=404)
+    payload = UpdateTimeEntryPayload.model_validate(
+        {
+            "billable": False,
+            "description": "",
+            "end": "2020-01-01T01:00:00Z",
+            "projectId": "p",
+            "start": "2020-01-01T00:00:00Z",
+            "type": "REGULAR",
+        }
+    )
+    time_entry = TimeEntry("apikey", "baz.co")
+
+    report = time_entry.update_time_entries(
+        "123", [(entry_id, payload) for entry_id in ["1", "2", "3"]], max_workers=2
+    )
+    assert not report.ok
+    assert report.succeeded == ["1", "3"]
+    assert list(report.failed) == ["2"]
+    assert isinstance(report.failed["2"], HTTPError)
+    assert [r.value.id if r.value else None for r in report.results] == [
+        "1",
+        None,
+        "3",
+    ]
+
+
+@responses.activate
+def test_delete_time_entries() -> None:
+    url = "https://global.baz.co/workspaces/123/time-entries"
+    rsps = [responses.delete(f"{url}/{i}", status=204) for i in range(4)]
+    time_entry = TimeEntry("apikey", "baz.co")
+
+    report = time_entry.delete_time_entries("123", (str(i) for i in range(4)))
+    assert report.ok
+    assert report.succeeded == ["0", "1", "2", "3"]
+    assert report.failed == {}
+    assert [rsp.call_count for rsp in rsps] == [1, 1, 1, 1]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import responses
+
+from clockify_client.transport import Transport
+
+
+def test_mount_creates_pool_per_base_url() -> None:
+    transport = Transport(pool_maxsize=3)
+    transport.mount("https://global.baz.co")
+    transport.mount("https://reports.baz.co")
+    transport.mount("https://global.baz.co")
+
+    global_adapter = transport.session.get_adapter("https://global.baz.co/foo")
+    reports_adapter = transport.session.get_adapter("https://reports.baz.co/foo")
+    assert global_adapter is not reports_adapter
+    assert global_adapter._pool_maxsize == 3  # type: ignore[attr-defined]
+    assert transport.session.get_adapter("https://global.baz.co/bar") is (
+        global_adapter
+    )
+
+
+@responses.activate
+def test_request_uses_session() -> None:
+    rsp = responses.get("https://global.baz.co/foo", json={"stuff": "things"})
+    transport = Transport()
+    transport.mount("https://global.baz.co")
+    response = transport.request(
+        "GET", "https://global.baz.co/foo", headers={"X-Api-Key": "apikey"}
+    )
+    assert response.json() == {"stuff": "things"}
+    assert rsp.calls[0].request.headers["X-Api-Key"] == "apikey"
+    transport.close()
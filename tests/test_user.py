@@ -641,3 +641,83 @@ def test_remove_user() -> None:
     rt = user.remove_user("123", "007")
     assert rt == resp_data
     assert rsp.call_count == 1
+
+
+@responses.activate
+def test_iter_users() -> None:
+    user_data = {
+        "activeWorkspace": "64a687e29ae1f428e7ebe303",
+        "customFields": [
+            {
+                "customFieldId": "5e4117fe8c625f38930d57b7",
+                "customFieldName": "TIN",
+                "customFieldType": "TXT",
+                "userId": "5a0ab5acb07987125438b60f",
+                "value": "20231211-12345",
+            }
+        ],
+        "defaultWorkspace": "123",
+        "email": "johndoe@example.com",
+        "id": "007",
+        "memberships": [
+            {
+                "costRate": {"amount": 10500, "currency": "USD"},
+                "hourlyRate": {"amount": 10500, "currency": "USD"},
+                "membershipStatus": "PENDING",
+                "membershipType": "PROJECT",
+                "targetId": "64c777ddd3fcab07cfbb210c",
+                "userId": "5a0ab5acb07987125438b60f",
+            }
+        ],
+        "name": "John Doe",
+        "profilePicture": "https://www.url.com/profile-picture1234567890.png",
+        "settings": {
+            "alerts": True,
+            "approval": False,
+            "collapseAllProjectLists": True,
+            "dashboardPinToTop": True,
+            "dashboardSelection": "ME",
+            "dashboardViewType": "BILLABILITY",
+            "dateFormat": "MM/DD/YYYY",
+            "groupSimilarEntriesDisabled": True,
+            "isCompactViewOn": False,
+            "lang": "en",
+            "longRunning": True,
+            "multiFactorEnabled": True,
+            "myStartOfDay": "09:00",
+            "onboarding": False,
+            "projectListCollapse": 15,
+            "projectPickerTaskFilter": False,
+            "pto": True,
+            "reminders": False,
+            "scheduledReports": True,
+            "scheduling": False,
+            "sendNewsletter": False,
+            "showOnlyWorkingDays": False,
+            "summaryReportSettings": {"group": "PROJECT", "subgroup": "CLIENT"},
+            "theme": "DARK",
+            "timeFormat": "HOUR24",
+            "timeTrackingManual": True,
+            "timeZone": "Asia/Aden",
+            "weekStart": "MONDAY",
+            "weeklyUpdates": False,
+        },
+        "status": "ACTIVE",
+    }
+    resp_data = [{**user_data, "id": str(i)} for i in range(3)]
+    expected = [UserResponse.model_validate(_) for _ in resp_data]
+    rsp1 = responses.get(
+        "https://global.baz.co/workspaces/123/users?status=ACTIVE&page=1&page-size=2",
+        json=resp_data[:2],
+        status=200,
+    )
+    rsp2 = responses.get(
+        "https://global.baz.co/workspaces/123/users?status=ACTIVE&page=2&page-size=2",
+        json=resp_data[2:],
+        status=200,
+    )
+    user = User("apikey", "baz.co")
+    params = GetUsersParams.model_validate({"status": "ACTIVE", "page-size": 2})
+    assert list(user.iter_users("123", params)) == expected
+    assert rsp1.call_count == 1
+    assert rsp2.call_count == 1
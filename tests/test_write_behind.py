@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+
+from clockify_client.api_objects.time_entry import AddTimeEntryPayload
+from clockify_client.codec import STDLIB_CODEC
+from clockify_client.models.time_entry import TimeEntry
+from clockify_client.rate_limit import RateLimiter
+from clockify_client.retry import RetryPolicy
+from clockify_client.transport import Transport
+from clockify_client.write_behind import TimeEntryQueue
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+    from requests import PreparedRequest
+
+ENTRIES_URL = "https://global.baz.co/workspaces/123/user/007/time-entries"
+RETRY = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+
+
+def _payload(description: str) -> AddTimeEntryPayload:
+    return AddTimeEntryPayload.model_validate(
+        {
+            "billable": False,
+            "description": description,
+            "end": "2020-01-01T09:15:00Z",
+            "projectId": "p",
+            "start": "2020-01-01T09:00:00Z",
+            "type": "REGULAR",
+        }
+    )
+
+
+@pytest.fixture
+def created(
+    make_time_entry: Callable[..., dict],
+) -> Callable[[PreparedRequest], tuple[int, dict, str]]:
+    def callback(request: PreparedRequest) -> tuple[int, dict, str]:
+        payload = json.loads(request.body or b"{}")
+        entry = make_time_entry(
+            payload["description"],
+            start=payload["start"],
+            end=payload["end"],
+            description=payload["description"],
+        )
+        return 201, {}, json.dumps(entry)
+
+    return callback
+
+
+def _queue(path: Path, **kwargs: int) -> TimeEntryQueue:
+    return TimeEntryQueue(TimeEntry("apikey", "baz.co"), path, retry=RETRY, **kwargs)
+
+
+@responses.activate
+def test_queued_entries_sent_in_background(
+    tmp_path: Path, created: Callable[[PreparedRequest], tuple[int, dict, str]]
+) -> None:
+    responses.add_callback(responses.POST, f"{ENTRIES_URL}/", created)
+
+    with _queue(tmp_path / "queue.sqlite", batch_size=2, max_workers=2) as queue:
+        ids = [queue.put("123", "007", _payload(str(i))) for i in range(5)]
+        assert queue.flush(timeout=5)
+        assert queue.pending() == 0
+        assert queue.failed() == []
+
+    assert ids == [1, 2, 3, 4, 5]
+    sent = sorted(
+        json.loads(c.request.body or b"{}")["description"] for c in responses.calls
+    )
+    assert sent == ["0", "1", "2", "3", "4"]
+
+
+@responses.activate
+def test_queued_entries_survive_restart(
+    tmp_path: Path, created: Callable[[PreparedRequest], tuple[int, dict, str]]
+) -> None:
+    responses.add_callback(responses.POST, f"{ENTRIES_URL}/", created)
+    path = tmp_path / "queue.sqlite"
+
+    queue = _queue(path)
+    assert queue.flush()
+    queue.put("123", "007", _payload("1"))
+    with pytest.raises(RuntimeError, match="not started"):
+        queue.flush()
+    queue.close()
+    assert len(responses.calls) == 0
+
+    with _queue(path) as queue:
+        assert queue.pending() == 1
+        assert queue.flush(timeout=5)
+    assert len(responses.calls) == 1
+    # unset fields are not sent as nulls, just like by direct call
+    body = responses.calls[0].request.body
+    assert body == STDLIB_CODEC.encode(_payload("1"))
+
+
+@responses.activate
+def test_transient_failure_retried(
+    tmp_path: Path, created: Callable[[PreparedRequest], tuple[int, dict, str]]
+) -> None:
+    responses.post(f"{ENTRIES_URL}/", status=503)
+    responses.add_callback(responses.POST, f"{ENTRIES_URL}/", created)
+    # failed attempt may have created entry, so it is looked for before retry
+    lookup = responses.get(ENTRIES_URL, json=[])
+
+    with _queue(tmp_path / "queue.sqlite") as queue:
+        queue.put("123", "007", _payload("1"))
+        assert queue.flush(timeout=5)
+        assert queue.failed() == []
+
+    assert [c.request.method for c in responses.calls] == ["POST", "GET", "POST"]
+    assert lookup.call_count == 1
+
+
+@responses.activate
+def test_rejected_entry_kept_as_failed(tmp_path: Path) -> None:
+    rsp = responses.post(f"{ENTRIES_URL}/", status=400)
+
+    with _queue(tmp_path / "queue.sqlite") as queue:
+        queue.put("123", "007", _payload("1"))
+        assert queue.flush(timeout=5)
+        failed = queue.failed()
+
+    assert rsp.call_count == 1
+    assert [(f.payload.description, f.attempts) for f in failed] == [("1", 1)]
+    assert "400" in (failed[0].error or "")
+
+
+@responses.activate
+def test_entries_refused_by_rate_limiter_retried(
+    tmp_path: Path, created: Callable[[PreparedRequest], tuple[int, dict, str]]
+) -> None:
+    responses.add_callback(responses.POST, f"{ENTRIES_URL}/", created)
+    limiter = RateLimiter(20, burst=1, block=False)
+    time_entries = TimeEntry("apikey", "baz.co", Transport(rate_limiter=limiter))
+    retry = RetryPolicy(max_attempts=10, backoff_factor=0.05, jitter=False)
+
+    with TimeEntryQueue(time_entries, tmp_path / "queue.sqlite", retry=retry) as queue:
+        for i in range(3):
+            queue.put("123", "007", _payload(str(i)))
+        assert queue.flush(timeout=10)
+        assert queue.failed() == []
+
+    # refused requests were not sent, so no lookup of existing entries is needed
+    assert [c.request.method for c in responses.calls] == ["POST"] * 3
+    sent = sorted(
+        json.loads(c.request.body or b"{}")["description"] for c in responses.calls
+    )
+    assert sent == ["0", "1", "2"]
+
+
+def test_unexpected_error_fails_entry_only(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    def add_time_entry(
+        _workspace_id: str, _user_id: str, payload: AddTimeEntryPayload
+    ) -> None:
+        if payload.description == "bad":
+            msg = "boom"
+            raise RuntimeError(msg)
+
+    with _queue(tmp_path / "queue.sqlite", max_workers=1) as queue:
+        mocker.patch.object(queue._writer, "add_time_entry", side_effect=add_time_entry)
+        for description in ["1", "bad", "3"]:
+            queue.put("123", "007", _payload(description))
+        assert queue.flush(timeout=5)
+        failed = queue.failed()
+        queue.put("123", "007", _payload("4"))
+        assert queue.flush(timeout=5)
+
+    assert [(f.payload.description, f.attempts) for f in failed] == [("bad", 1)]
+    assert "boom" in (failed[0].error or "")